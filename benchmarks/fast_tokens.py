@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Check the fast path of the blib2to3 tokenizer against the general one.
+
+Every file is tokenized with and without the fast path, for each grammar, and
+the two token streams must be identical. Both paths are timed on the files
+that tokenize without errors:
+
+    python benchmarks/fast_tokens.py [FILE ...] [--repeat N]
+
+The sources of the vendored libraries and of the standard library are used
+if no file is given. The exit status is 1 if any stream differs.
+"""
+
+import argparse
+import sys
+import sysconfig
+import time
+
+from collections import deque
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from python_black.lib.black import nodes  # noqa: E402,F401  (initializes pygram)
+from python_black.lib.blib2to3 import pygram  # noqa: E402
+from python_black.lib.blib2to3.pgen2 import tokenize  # noqa: E402
+from python_black.lib.blib2to3.pgen2.grammar import Grammar  # noqa: E402
+
+GRAMMARS = [
+    pygram.python_grammar_soft_keywords,
+    pygram.python_grammar_no_print_statement_no_exec_statement_async_keywords,
+    pygram.python_grammar_no_print_statement,
+]
+
+
+def tokens(src: str, grammar: Grammar, fast: bool) -> Tuple[List, Optional[str]]:
+    """Return the tokens of `src`, and the error that stopped them if any."""
+    result: List = []
+    try:
+        result.extend(tokenize.generate_source_tokens(src, grammar, fast=fast))
+    except (tokenize.TokenError, IndentationError) as e:
+        return result, repr(e)
+    return result, None
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", type=Path)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    files = args.files or [
+        *sorted((ROOT / "python_black" / "lib").rglob("*.py")),
+        *sorted(Path(sysconfig.get_paths()["stdlib"]).rglob("*.py")),
+    ]
+    sources = []
+    for path in files:
+        try:
+            sources.append((path, path.read_text(encoding="utf-8")))
+        except (OSError, UnicodeDecodeError):
+            continue
+
+    differ = 0
+    valid = []
+    for path, src in sources:
+        for grammar in GRAMMARS:
+            result = tokens(src, grammar, True)
+            if result != tokens(src, grammar, False):
+                differ += 1
+                print(f"tokens differ: {path}")
+                break
+        else:
+            if result[1] is None:
+                valid.append(src)
+    print(f"{len(sources)} files, {differ} with different tokens")
+
+    grammar = GRAMMARS[0]
+    for fast in (False, True):
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            for src in valid:
+                deque(
+                    tokenize.generate_source_tokens(src, grammar, fast=fast), maxlen=0
+                )
+            best = min(best, time.perf_counter() - start)
+        print(f"{'fast' if fast else 'general'} path: {best:.3f}s")
+    return 1 if differ else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Measure what finding the features used by a file costs Black.
+
+The files are parsed with the features collected on the way, as
+lib2to3_parse() does, then get_features_used() runs on the trees, once with
+the collected features and once walking the trees as it has to without them:
+
+    python benchmarks/features_bench.py [FILE ...] [--repeat N]
+
+The sources of the vendored Black are used if no file is given.
+"""
+
+import argparse
+import sys
+import time
+
+from pathlib import Path
+from typing import Callable, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from python_black.lib.black import get_features_used  # noqa: E402
+from python_black.lib.black.parsing import lib2to3_parse  # noqa: E402
+from python_black.lib.blib2to3.pytree import Node  # noqa: E402
+
+
+def best(function: Callable[[], object], repeat: int) -> float:
+    result = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        result = min(result, time.perf_counter() - start)
+    return result
+
+
+def walk(trees: List[Node]) -> None:
+    for tree in trees:
+        features = tree.features
+        tree.features = None
+        get_features_used(tree)
+        tree.features = features
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", type=Path)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    files = args.files or sorted((ROOT / "python_black" / "lib" / "black").glob("*.py"))
+    sources = [path.read_text(encoding="utf-8") for path in files]
+    trees = [lib2to3_parse(src) for src in sources]
+    print(f"{len(files)} files")
+
+    elapsed = best(lambda: [lib2to3_parse(src) for src in sources], args.repeat)
+    print(f"parse, collecting: {elapsed * 1000:7.1f} ms")
+    elapsed = best(lambda: [get_features_used(tree) for tree in trees], args.repeat)
+    print(f"collected features: {elapsed * 1000:7.1f} ms")
+    elapsed = best(lambda: walk(trees), args.repeat)
+    print(f"walking the trees: {elapsed * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Measure how normalize_fmt_off() scales with the number of regions.
+
+Each module has the given number of `# fmt: off`/`# fmt: on` regions and as
+many lines ending with `# fmt: skip`, between plain functions. The modules are
+parsed before timing, and normalize_fmt_off() runs on a fresh copy each time:
+
+    python benchmarks/fmt_off_bench.py [--regions N ...] [--repeat N]
+
+The time per region stays about the same when the scaling is linear.
+"""
+
+import argparse
+import sys
+import time
+
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from python_black.lib.black.comments import normalize_fmt_off  # noqa: E402
+from python_black.lib.black.parsing import lib2to3_parse  # noqa: E402
+
+REGION = """\
+def function_{i}(a, b):
+    return a + b
+
+
+# fmt: off
+TABLE_{i} = [
+    1,   2,   3,
+    4,   5,   6,
+]
+# fmt: on
+value_{i} = [ 1,2,3 ]  # fmt: skip
+
+
+"""
+
+
+def module(regions: int) -> str:
+    return "".join(REGION.format(i=i) for i in range(regions))
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--regions", type=int, nargs="+", default=[100, 200, 400, 800])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"{'regions':>8} {'time (ms)':>10} {'per region (us)':>16}")
+    for regions in args.regions:
+        tree = lib2to3_parse(module(regions))
+        best = float("inf")
+        for _ in range(args.repeat):
+            copy = tree.clone()
+            start = time.perf_counter()
+            normalize_fmt_off(copy)
+            best = min(best, time.perf_counter() - start)
+        per_region = best / regions * 1e6
+        print(f"{regions:>8} {best * 1000:>10.1f} {per_region:>16.1f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
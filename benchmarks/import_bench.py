@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Measure how long the blib2to3 grammars take to set up in a new interpreter.
+
+Each run starts a new interpreter, which imports pygram, calls
+pygram.initialize() as importing Black does, then gets the symbols and the
+grammars that Black parses with when no target version is given:
+
+    python benchmarks/import_bench.py [--repeat N]
+
+The memory that the grammars take after the import is measured with
+tracemalloc, once for those grammars and once with every grammar of pygram.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parent.parent
+
+BLACK_GRAMMARS = [
+    "python_symbols",
+    "python_grammar_no_print_statement_no_exec_statement_async_keywords",
+    "python_grammar_no_print_statement_no_exec_statement",
+    "python_grammar_soft_keywords",
+]
+ALL_GRAMMARS = BLACK_GRAMMARS + [
+    "python_grammar",
+    "python_grammar_no_print_statement",
+    "pattern_grammar",
+    "pattern_symbols",
+]
+
+TIME_CODE = """
+import time
+start = time.perf_counter()
+from python_black.lib.blib2to3 import pygram
+imported = time.perf_counter()
+pygram.initialize()
+initialized = time.perf_counter()
+for name in {names!r}:
+    getattr(pygram, name)
+used = time.perf_counter()
+print(imported - start, initialized - imported, used - initialized)
+"""
+
+MEMORY_CODE = """
+import tracemalloc
+tracemalloc.start()
+from python_black.lib.blib2to3 import pygram
+imported = tracemalloc.get_traced_memory()[0]
+pygram.initialize()
+for name in {names!r}:
+    getattr(pygram, name)
+print(tracemalloc.get_traced_memory()[0] - imported)
+"""
+
+
+def run(code: str, names: List[str]) -> List[float]:
+    output = subprocess.run(
+        [sys.executable, "-c", code.format(names=names)],
+        cwd=str(ROOT),
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    ).stdout
+    return [float(value) for value in output.split()]
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    run(TIME_CODE, BLACK_GRAMMARS)  # compile the modules
+    times = [run(TIME_CODE, BLACK_GRAMMARS) for _ in range(args.repeat)]
+    for i, name in enumerate(["import pygram", "initialize()", "first use"]):
+        values = [t[i] for t in times]
+        print(
+            f"{name}: min {min(values) * 1000:6.2f} ms,"
+            f" median {statistics.median(values) * 1000:6.2f} ms"
+        )
+    for name, names in [("Black's grammars", BLACK_GRAMMARS), ("all", ALL_GRAMMARS)]:
+        (memory,) = run(MEMORY_CODE, names)
+        print(f"memory, {name}: {memory / 1024:,.0f} KiB")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Measure how long Black takes to reject sources with a syntax error.
+
+Each file gets the kinds of errors left while typing, one at a time, at a
+random line: a bracket that isn't closed yet, a line cut short, and a triple
+quoted string that isn't closed yet. Every broken source is parsed with
+lib2to3_parse(), then twice with the same IncrementalParser, as when a buffer
+is saved twice without a change. The errors made in a string are left out:
+
+    python benchmarks/invalid_bench.py [FILE ...] [--seed N]
+
+The sources of the vendored Black are used if no file is given.
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from python_black.lib.black.parsing import (  # noqa: E402
+    IncrementalParser,
+    InvalidInput,
+    grammar_stats,
+    lib2to3_parse,
+)
+
+
+def open_bracket(lines: List[str], index: int) -> None:
+    lines.insert(index, "x = foo(\n")
+
+
+def cut_line(lines: List[str], index: int) -> None:
+    line = lines[index].rstrip("\n")
+    lines[index] = line[: len(line) // 2] + " +\n"
+
+
+def open_string(lines: List[str], index: int) -> None:
+    lines.insert(index, 'x = """\n')
+
+
+BREAKAGES: Dict[str, Callable[[List[str], int], None]] = {
+    "open bracket": open_bracket,
+    "cut line": cut_line,
+    "open string": open_string,
+}
+
+
+def reject(parse: Callable[[str], object], src: str) -> Optional[float]:
+    """Return how long `parse` took to reject `src`, or None if it parsed it."""
+    start = time.perf_counter()
+    try:
+        parse(src)
+    except (InvalidInput, IndentationError):
+        return time.perf_counter() - start
+    return None
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", type=Path)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    files = args.files or sorted((ROOT / "python_black" / "lib" / "black").glob("*.py"))
+    sources = [path.read_text(encoding="utf-8") for path in files]
+    print(f"{len(files)} files")
+
+    print(f"{'':>14} {'parses':>8} {'first (ms)':>11} {'again (ms)':>11}")
+    for name, breakage in BREAKAGES.items():
+        attempts = count = 0
+        first = again = 0.0
+        for src in sources:
+            lines = src.splitlines(True)
+            breakage(lines, rng.randrange(len(lines)))
+            broken = "".join(lines)
+            before = grammar_stats.attempts
+            elapsed = reject(lib2to3_parse, broken)
+            if elapsed is None:
+                # The error was made in a string.
+                continue
+            attempts += grammar_stats.attempts - before
+            count += 1
+            first += elapsed
+            incremental = IncrementalParser()
+            reject(incremental.parse, broken)
+            again += reject(incremental.parse, broken) or 0.0
+        parses = attempts / count
+        print(f"{name:>14} {parses:>8.2f} {first * 1000:>11.1f} {again * 1000:>11.1f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Measure line_edits() on large files that formatting changes all over.
+
+The files are made of copies of the vendored Black sources, of a quarter, half
+and all of the given number of lines, and formatted with a short line length
+so that changed lines are spread over the whole file. Applying the edits must
+give the formatted file, and finding them must take a small part of the time
+formatting took, whatever the size of the file:
+
+    python benchmarks/line_edits_bench.py [--lines N] [--line-length N] [--repeat N]
+"""
+
+import argparse
+import sys
+import time
+
+from pathlib import Path
+from typing import List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from python_black.edits import line_edits  # noqa: E402
+from python_black.lib.black import Mode, format_str  # noqa: E402
+
+Edit = Tuple[int, int, str]
+
+# The largest part of the formatting time that finding the edits may take.
+MAX_SHARE = 0.02
+
+
+def large_module(lines: int) -> str:
+    sources = [
+        path.read_text(encoding="utf-8")
+        for path in sorted((ROOT / "python_black" / "lib" / "black").glob("*.py"))
+    ]
+    parts: List[str] = []
+    count = 0
+    while count < lines:
+        for src in sources:
+            parts.append(src)
+            count += src.count("\n")
+            if count >= lines:
+                break
+    return "".join(parts)
+
+
+def apply(old: str, edits: List[Edit]) -> str:
+    for start, end, text in reversed(edits):
+        old = old[:start] + text + old[end:]
+    return old
+
+
+def changed_lines(old: str, edits: List[Edit]) -> int:
+    return sum(old.count("\n", start, end) for start, end, _ in edits)
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=6000)
+    parser.add_argument("--line-length", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    mode = Mode(line_length=args.line_length)
+    print(
+        f"{'lines':>7} {'changed':>8} {'edits':>6} {'format (s)':>11} {'edits (ms)':>11}"
+    )
+    for lines in (args.lines // 4, args.lines // 2, args.lines):
+        old = large_module(lines)
+        start = time.perf_counter()
+        new = format_str(old, mode=mode)
+        formatting = time.perf_counter() - start
+
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            edits = line_edits(old, new)
+            best = min(best, time.perf_counter() - start)
+        assert apply(old, edits) == new, "the edits don't give the formatted file"
+
+        print(
+            f"{old.count(chr(10)):>7,} {changed_lines(old, edits):>8,}"
+            f" {len(edits):>6,} {formatting:>11.2f} {best * 1000:>11.1f}"
+        )
+        # Diffing the changed lines against each other takes time in the square
+        # of their number, over a tenth of the formatting time at 4,000 lines.
+        assert best < formatting * MAX_SHARE, "line_edits() takes too long"
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
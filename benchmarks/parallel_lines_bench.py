@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Measure format_str() on a large module with its lines split by several processes.
+
+The module is made of copies of the vendored Black sources, up to the given
+number of lines. It is formatted with a short line length, so that many lines
+are split, once with the lines split here and once with `line_workers`
+processes. Both outputs must be the same:
+
+    python benchmarks/parallel_lines_bench.py [--lines N] [--line-length N] [--workers N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from python_black.lib.black import Mode, format_str  # noqa: E402
+
+
+def large_module(lines: int) -> str:
+    sources = [
+        path.read_text(encoding="utf-8")
+        for path in sorted((ROOT / "python_black" / "lib" / "black").glob("*.py"))
+    ]
+    parts: List[str] = []
+    count = 0
+    while count < lines:
+        for src in sources:
+            parts.append(src)
+            count += src.count("\n")
+            if count >= lines:
+                break
+    return "".join(parts)
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=20000)
+    parser.add_argument("--line-length", type=int, default=40)
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1))
+    args = parser.parse_args(argv)
+
+    src = large_module(args.lines)
+    mode = Mode(line_length=args.line_length)
+    format_str("pass\n", mode=mode)  # set up the grammars
+    print(f"{src.count(chr(10)):,} lines, line length {args.line_length}")
+
+    start = time.perf_counter()
+    expected = format_str(src, mode=mode)
+    print(f"one process: {time.perf_counter() - start:.2f} s")
+
+    start = time.perf_counter()
+    result = format_str(src, mode=mode, line_workers=args.workers)
+    print(f"{args.workers} processes: {time.perf_counter() - start:.2f} s")
+    assert result == expected, "the outputs differ"
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
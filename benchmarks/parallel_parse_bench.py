@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Measure lib2to3_parse() on a large module parsed in chunks by several processes.
+
+The module is made of copies of the vendored Black sources, up to the given
+number of lines. It is parsed in one process, then in chunks by each number of
+processes, and every tree must be the same as the one of the single parse,
+down to the prefixes, the positions and the features:
+
+    python benchmarks/parallel_parse_bench.py [--lines N] [--workers N ...] [--repeat N]
+
+The speedup is bounded by the number of CPUs, which is printed first.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from python_black.lib.black.parsing import (  # noqa: E402
+    PARALLEL_PARSE_THRESHOLD,
+    lib2to3_parse,
+    same_tree,
+    split_points,
+)
+from python_black.lib.blib2to3.pytree import Node  # noqa: E402
+
+
+def large_module(lines: int) -> str:
+    sources = [
+        path.read_text(encoding="utf-8")
+        for path in sorted((ROOT / "python_black" / "lib" / "black").glob("*.py"))
+    ]
+    parts: List[str] = []
+    count = 0
+    while count < lines:
+        for src in sources:
+            parts.append(src)
+            count += src.count("\n")
+            if count >= lines:
+                break
+    return "".join(parts)
+
+
+def same_parse(a: Node, b: Node) -> bool:
+    return (
+        same_tree(a, b)
+        and a.features == b.features
+        and [child.features for child in a.children]
+        == [child.features for child in b.children]
+    )
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=40000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4, 8])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    src = large_module(args.lines)
+    lib2to3_parse("pass\n")  # set up the grammars
+    lines = src.count("\n")
+    print(f"{os.cpu_count()} CPUs, {lines:,} lines, {len(src):,} characters")
+    if len(src) < PARALLEL_PARSE_THRESHOLD:
+        print(f"less than {PARALLEL_PARSE_THRESHOLD:,} characters, parsed in one go")
+
+    best = float("inf")
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        expected = lib2to3_parse(src)
+        best = min(best, time.perf_counter() - start)
+    single = best
+    print(f"{'processes':>9} {'time (s)':>9} {'speedup':>8}")
+    print(f"{1:>9} {single:>9.2f} {1:>8.2f}")
+
+    for workers in args.workers:
+        if len(split_points(src, workers)) < workers - 1:
+            print(f"{workers:>9} not enough top-level statements")
+            continue
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            tree = lib2to3_parse(src, workers=workers)
+            best = min(best, time.perf_counter() - start)
+            assert same_parse(tree, expected), "the trees differ"
+        print(f"{workers:>9} {best:>9.2f} {single / best:>8.2f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
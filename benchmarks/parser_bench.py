@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Measure how many tokens per second the blib2to3 parser goes through.
+
+The files are tokenized before timing, so only the driver and the parser are
+measured:
+
+    python benchmarks/parser_bench.py [FILE ...] [--repeat N]
+
+The sources of the vendored Black are parsed if no file is given.
+"""
+
+import argparse
+import sys
+import time
+
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from python_black.lib.black import nodes  # noqa: E402,F401  (initializes pygram)
+from python_black.lib.blib2to3 import pygram  # noqa: E402
+from python_black.lib.blib2to3.pgen2 import driver, tokenize  # noqa: E402
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", type=Path)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    files = args.files or sorted((ROOT / "python_black" / "lib" / "black").glob("*.py"))
+    grammar = pygram.python_grammar_soft_keywords
+    drv = driver.Driver(grammar)
+
+    sources = []
+    for path in files:
+        src = path.read_text(encoding="utf-8")
+        if not src.endswith("\n"):
+            src += "\n"
+        sources.append(
+            list(
+                tokenize.generate_tokens(
+                    iter(src.splitlines(True)).__next__, grammar=grammar
+                )
+            )
+        )
+    ntokens = sum(map(len, sources))
+
+    best = float("inf")
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        for tokens in sources:
+            drv.parse_tokens(iter(tokens))
+        best = min(best, time.perf_counter() - start)
+
+    print(f"{len(files)} files, {ntokens} tokens")
+    print(f"best of {args.repeat}: {best:.3f}s, {ntokens / best:,.0f} tokens/s")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Measure how parsing scales with the size of comment blocks.
+
+Each source has blocks of comment lines at the end of indented suites, so
+that their prefix is split on the dedent after them. The time per line should
+stay the same as the blocks grow:
+
+    python benchmarks/prefix_bench.py [--repeat N]
+"""
+
+import argparse
+import sys
+import time
+
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from python_black.lib.black import nodes  # noqa: E402,F401  (initializes pygram)
+from python_black.lib.blib2to3 import pygram  # noqa: E402
+from python_black.lib.blib2to3.pgen2 import driver  # noqa: E402
+
+BLOCK_SIZES = [250, 500, 1000, 2000, 4000, 8000]
+
+
+def make_source(block_size: int, total_lines: int = 16000) -> str:
+    """Return about `total_lines` lines of blocks of `block_size` comment lines."""
+    block = "".join(
+        f"        # {i} Lorem ipsum dolor sit amet, consectetur adipiscing elit.\n"
+        + ("\n" if i % 10 == 0 else "")
+        for i in range(block_size)
+    )
+    suite = "class A:\n    def f(self):\n        pass\n" + block + "    # dedented\n"
+    return suite * max(1, total_lines // block_size)
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    drv = driver.Driver(pygram.python_grammar_soft_keywords)
+    print(f"{'block':>6} {'lines':>7} {'time':>8} {'us/line':>8}")
+    for block_size in BLOCK_SIZES:
+        src = make_source(block_size)
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            drv.parse_string(src)
+            best = min(best, time.perf_counter() - start)
+
+        lines = src.count("\n")
+        print(f"{block_size:>6} {lines:>7} {best:>7.3f}s {best / lines * 1e6:>8.2f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
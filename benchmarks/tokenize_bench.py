@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Compare the line-based and the offset-based token streams of blib2to3.
+
+The files are tokenized, then parsed, once from readline() with the 5-tuples
+of generate_tokens(), and once from the source string with the offsets of
+generate_source_tokens(). The peak memory of parsing is measured with
+tracemalloc:
+
+    python benchmarks/tokenize_bench.py [FILE ...] [--repeat N]
+
+The sources of the vendored Black are used if no file is given.
+"""
+
+import argparse
+import io
+import sys
+import time
+import tracemalloc
+
+from collections import deque
+from pathlib import Path
+from typing import Callable, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from python_black.lib.black import nodes  # noqa: E402,F401  (initializes pygram)
+from python_black.lib.blib2to3 import pygram  # noqa: E402
+from python_black.lib.blib2to3.pgen2 import driver, tokenize  # noqa: E402
+
+grammar = pygram.python_grammar_soft_keywords
+drv = driver.Driver(grammar)
+
+
+def tokenize_lines(src: str) -> None:
+    deque(tokenize.generate_tokens(io.StringIO(src).readline, grammar), maxlen=0)
+
+
+def tokenize_source(src: str) -> None:
+    deque(tokenize.generate_source_tokens(src, grammar), maxlen=0)
+
+
+def parse_lines(src: str) -> None:
+    tokens = tokenize.generate_tokens(io.StringIO(src).readline, grammar)
+    drv.parse_tokens(tokens)
+
+
+def parse_source(src: str) -> None:
+    drv.parse_source(src, tokenize.generate_source_tokens(src, grammar))
+
+
+def run_time(func: Callable[[str], None], sources: List[str]) -> float:
+    start = time.perf_counter()
+    for src in sources:
+        func(src)
+    return time.perf_counter() - start
+
+
+def peak_memory(func: Callable[[str], None], sources: List[str]) -> int:
+    peak = 0
+    for src in sources:
+        tracemalloc.start()
+        func(src)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return peak
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", type=Path)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    files = args.files or sorted((ROOT / "python_black" / "lib" / "black").glob("*.py"))
+    sources = []
+    for path in files:
+        src = path.read_text(encoding="utf-8")
+        if not src.endswith("\n"):
+            src += "\n"
+        sources.append(src)
+    ntokens = sum(1 for src in sources for _ in tokenize.generate_source_tokens(src))
+    print(f"{len(files)} files, {ntokens} tokens")
+
+    print(f"{'':>15} {'lines':>10} {'source':>10}")
+    for name, lines, source in [
+        ("tokenize", tokenize_lines, tokenize_source),
+        ("parse", parse_lines, parse_source),
+    ]:
+        # Interleave the two, so that both see the same load on the machine.
+        old = new = float("inf")
+        for _ in range(args.repeat):
+            old = min(old, run_time(lines, sources))
+            new = min(new, run_time(source, sources))
+        print(
+            f"{name + ' (tok/s)':>15} {ntokens / old:>10,.0f} {ntokens / new:>10,.0f}"
+        )
+
+    old_peak = peak_memory(parse_lines, sources)
+    new_peak = peak_memory(parse_source, sources)
+    print(f"{'peak (KiB)':>15} {old_peak / 1024:>10,.0f} {new_peak / 1024:>10,.0f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
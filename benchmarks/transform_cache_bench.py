@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Measure format_str() with and without the cache of transformed lines.
+
+The first module repeats the kind of lines large files are full of: long calls
+registering something, entries of a dict literal and decorators, all too long
+for the line length. The second is made of the vendored Black sources. Each is
+formatted with the cache off, with an empty cache, and again with the cache
+filled by the previous run, as when a file is formatted on each save. All the
+outputs must be the same:
+
+    python benchmarks/transform_cache_bench.py [--copies N] [--line-length N] [--repeat N]
+"""
+
+import argparse
+import sys
+import time
+
+from pathlib import Path
+from typing import List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from python_black.lib.black import Mode, format_str  # noqa: E402
+from python_black.lib.black.linegen import transform_cache  # noqa: E402
+
+REPEATED = """\
+registry.register("handler_{i}", handlers.default_handler, priority=settings.DEFAULT_PRIORITY)
+registry.register("handler", handlers.default_handler, priority=settings.DEFAULT_PRIORITY)
+
+
+@app.route("/api/v1/items/<int:item_id>", methods=["GET", "POST"], strict_slashes=False)
+def view_{i}(item_id):
+    return render(template_name, context={{"item": item_id, "user": request.user}})
+
+
+TABLE_{i} = {{
+    "first_key": compute_value(argument_one, argument_two, keyword_argument=None),
+    "second_key": compute_value(argument_one, argument_two, keyword_argument=None),
+}}
+"""
+
+
+def repeated_module(copies: int) -> str:
+    return "\n\n".join(REPEATED.format(i=i) for i in range(copies))
+
+
+def black_sources() -> str:
+    sources = sorted((ROOT / "python_black" / "lib" / "black").glob("*.py"))
+    return "".join(path.read_text(encoding="utf-8") for path in sources)
+
+
+def best(
+    src: str, mode: Mode, repeat: int, max_entries: int, warm: bool
+) -> Tuple[float, int, int]:
+    """Return the best time of the runs, and the hits and misses of the last."""
+    result = float("inf")
+    transform_cache.max_entries = max_entries
+    for _ in range(repeat):
+        transform_cache.clear()
+        if warm:
+            format_str(src, mode=mode)
+        before = transform_cache.stats()
+        start = time.perf_counter()
+        format_str(src, mode=mode)
+        result = min(result, time.perf_counter() - start)
+        after = transform_cache.stats()
+    hits = after["hits"] - before["hits"]
+    return result, hits, after["misses"] - before["misses"]
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--copies", type=int, default=500)
+    parser.add_argument("--line-length", type=int, default=88)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    mode = Mode(line_length=args.line_length)
+    format_str("pass\n", mode=mode)  # set up the grammars
+    modules = [
+        ("repeated lines", repeated_module(args.copies)),
+        ("black sources", black_sources()),
+    ]
+    for name, src in modules:
+        transform_cache.max_entries = 0
+        expected = format_str(src, mode=mode)
+        transform_cache.max_entries = 2048
+        transform_cache.clear()
+        for _ in range(2):
+            assert format_str(src, mode=mode) == expected, "the outputs differ"
+
+        print(f"{name}: {src.count(chr(10)):,} lines")
+        for label, max_entries, warm in [
+            ("no cache", 0, False),
+            ("empty cache", 2048, False),
+            ("filled cache", 2048, True),
+        ]:
+            elapsed, hits, misses = best(src, mode, args.repeat, max_entries, warm)
+            print(f"  {label:>12}: {elapsed:5.2f} s, {hits:,} hits, {misses:,} misses")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
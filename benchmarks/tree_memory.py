@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Measure the memory taken by the blib2to3 tree of a large module.
+
+The module is made of copies of the vendored Black sources, up to the given
+number of lines. It is parsed with tracemalloc running, which gives the
+memory the tree holds and the peak while parsing:
+
+    python benchmarks/tree_memory.py [--lines N] [--format]
+
+With --format, the peak of formatting the module with format_str() is
+measured as well.
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from python_black.lib.black import Mode, format_str  # noqa: E402
+from python_black.lib.black.parsing import lib2to3_parse  # noqa: E402
+
+
+def large_module(lines: int) -> str:
+    sources = [
+        path.read_text(encoding="utf-8")
+        for path in sorted((ROOT / "python_black" / "lib" / "black").glob("*.py"))
+    ]
+    parts: List[str] = []
+    count = 0
+    while count < lines:
+        for src in sources:
+            parts.append(src)
+            count += src.count("\n")
+            if count >= lines:
+                break
+    return "".join(parts)
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=50000)
+    parser.add_argument("--format", action="store_true")
+    args = parser.parse_args(argv)
+
+    src = large_module(args.lines)
+    lib2to3_parse("pass\n")  # set up the grammars
+    print(f"{src.count(chr(10)):,} lines")
+
+    start = time.perf_counter()
+    tree = lib2to3_parse(src)
+    print(f"parse: {time.perf_counter() - start:.2f} s")
+    nodes = leaves = 0
+    for node in tree.pre_order():
+        if node.children:
+            nodes += 1
+        else:
+            leaves += 1
+    print(f"{nodes:,} nodes, {leaves:,} leaves")
+    del tree
+    gc.collect()
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tree = lib2to3_parse(src)
+    size, peak = tracemalloc.get_traced_memory()
+    print(f"tree: {(size - before) / 2**20:,.1f} MiB")
+    print(f"parse peak: {(peak - before) / 2**20:,.1f} MiB")
+    tracemalloc.stop()
+    del tree
+    gc.collect()
+
+    if args.format:
+        tracemalloc.start()
+        format_str(src, mode=Mode())
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"format peak: {peak / 2**20:,.1f} MiB")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
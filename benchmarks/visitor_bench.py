@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Measure how fast nodes.Visitor walks the trees of Black.
+
+The files are parsed before timing. Each tree is walked by a visitor that only
+counts the leaves, and by the LineGenerator of Black, on a fresh copy since it
+changes the tree. A deeply nested expression checks that walking it doesn't
+hit the recursion limit:
+
+    python benchmarks/visitor_bench.py [FILE ...] [--repeat N]
+
+The sources of the vendored Black are used if no file is given.
+"""
+
+import argparse
+import sys
+import time
+
+from collections import deque
+from pathlib import Path
+from typing import Iterator, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from python_black.lib.black.linegen import LineGenerator  # noqa: E402
+from python_black.lib.black.mode import Mode  # noqa: E402
+from python_black.lib.black.nodes import LN, Visitor  # noqa: E402
+from python_black.lib.black.parsing import lib2to3_parse  # noqa: E402
+from python_black.lib.blib2to3.pytree import Leaf, Node  # noqa: E402
+
+
+class LeafCounter(Visitor[int]):
+    def visit_default(self, node: LN) -> Iterator[int]:
+        if isinstance(node, Leaf):
+            yield 1
+        yield from super().visit_default(node)
+
+
+def count_leaves(trees: List[Node]) -> None:
+    for tree in trees:
+        deque(LeafCounter().visit(tree), maxlen=0)
+
+
+def generate_lines(trees: List[Node]) -> None:
+    mode = Mode()
+    for tree in trees:
+        deque(LineGenerator(mode=mode, features=()).visit(tree), maxlen=0)
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", type=Path)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    files = args.files or sorted((ROOT / "python_black" / "lib" / "black").glob("*.py"))
+    trees = [lib2to3_parse(path.read_text(encoding="utf-8")) for path in files]
+    nodes = sum(1 for tree in trees for _ in tree.pre_order())
+    print(f"{len(files)} files, {nodes:,} nodes")
+
+    best = float("inf")
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        count_leaves(trees)
+        best = min(best, time.perf_counter() - start)
+    print(f"count leaves: {best * 1000:7.1f} ms, {nodes / best:>12,.0f} nodes/s")
+
+    best = float("inf")
+    for _ in range(args.repeat):
+        copies = [tree.clone() for tree in trees]
+        start = time.perf_counter()
+        generate_lines(copies)
+        best = min(best, time.perf_counter() - start)
+    print(f"line generator: {best * 1000:7.1f} ms, {nodes / best:>12,.0f} nodes/s")
+
+    depth = sys.getrecursionlimit()
+    nested = lib2to3_parse("x = " + "not " * depth + "y\n")
+    try:
+        leaves = sum(LeafCounter().visit(nested))
+    except RecursionError:
+        print(f"{depth} nested `not`: RecursionError")
+    else:
+        print(f"{depth} nested `not`: {leaves} leaves")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -6,23 +6,53 @@
 # @Created:   2022-02-04 10:51:04
 # @Modified:  2023-02-08 13:31:30
 
+import json
+import subprocess
 import sublime
 import sublime_plugin
 
 from os import path
-from typing import Any, Dict, List, Union
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from .python_black.constants import CONFIGURATION_FILENAME, CONFIGURATION_CONTENTS
-from .python_black.black import black_format
+from .python_black.black import (
+    black_format,
+    config_cache,
+    find_global_config_file,
+    forget_parser,
+    get_black_config,
+    get_black_mode,
+    parser_stats,
+    prepare_format,
+    result_cache,
+)
+from .python_black.changes import changed_lines
+from .python_black.client import (
+    DaemonError,
+    DaemonUnavailable,
+    format_project,
+    get_client,
+    stop_client,
+)
 from .python_black.mode import Mode
+from .python_black.protocol import mode_to_dict
 from .python_black.log import child_logger
 from .python_black.utils import (
     get_mode,
     get_package_settings,
     get_project_settings,
+    get_setting,
+    get_window_project_settings,
+    replace_text,
     set_mode,
+    show_error_panel,
 )
+from .python_black.worker import FormatJob, worker
 from .python_black.lib.black import __version__ as black_version
+from .python_black.lib.black.linegen import transform_cache
+from .python_black.lib.black.parsing import grammar_stats
+from .python_black.lib.blib2to3.pgen2.parse import soft_keyword_stats
 from .python_black.lib.pathspec import __version__ as pathspec_version
 from .python_black.lib.platformdirs import __version__ as platformdirs_version
 from .python_black.lib.tomli import __version__ as tomli_version
@@ -40,11 +70,40 @@ logger.info(
 )
 
 
+def plugin_loaded():
+    # Saved buffers match their files, so their changes can be tracked from now.
+    for window in sublime.windows():
+        for view in window.views():
+            if not view.is_dirty():
+                changed_lines.reset(view.buffer_id())
+
+
+def plugin_unloaded():
+    worker.shutdown()
+    stop_client()
+
+
 class BlackCommand(sublime_plugin.TextCommand):
     def is_visible(self, *args):
         region = self.view.sel()[0]
         return self.view.match_selector(region.b, "source.python")
 
+    def get_selected_lines(self) -> List[Tuple[int, int]]:
+        """Return the 1-based line ranges of the non-empty selections."""
+        lines = []
+        for region in self.view.sel():
+            if region.empty():
+                continue
+
+            first, _ = self.view.rowcol(region.begin())
+            last, col = self.view.rowcol(region.end())
+            # a selection of whole lines ends at the start of the next line
+            if col == 0 and last > first:
+                last -= 1
+            lines.append((first + 1, last + 1))
+
+        return lines
+
     def get_source(self, use_selection: bool):
         region = self.view.sel()[0]
         # select the whole view if there is no selected region
@@ -52,7 +111,14 @@ class BlackCommand(sublime_plugin.TextCommand):
             region = sublime.Region(0, self.view.size())
         return region, self.view.substr(region), self.view.encoding()
 
-    def run(self, edit: sublime.Edit, use_selection=True, smart_mode=False):
+    def run(
+        self,
+        edit: sublime.Edit,
+        use_selection=True,
+        smart_mode=False,
+        lines: Optional[List[List[int]]] = None,
+        selected_statements=False,
+    ):
         logger.info("use smart mode: %s", smart_mode)
 
         filename = self.view.file_name() or ""
@@ -63,7 +129,17 @@ class BlackCommand(sublime_plugin.TextCommand):
             )
             return
 
-        region, source, encoding = self.get_source(use_selection)
+        selected_lines: List[Tuple[int, int]] = []
+        if lines is not None:
+            selected_lines = [(first, last) for first, last in lines]
+        elif selected_statements:
+            selected_lines = self.get_selected_lines()
+
+        if lines is not None or selected_statements:
+            # the statements are formatted in the context of the whole view
+            region, source, encoding = self.get_source(False)
+        else:
+            region, source, encoding = self.get_source(use_selection)
 
         if not isinstance(source, str) and hasattr(source, "decode"):
             source = source.decode(encoding)
@@ -86,6 +162,7 @@ class BlackCommand(sublime_plugin.TextCommand):
             smart_mode=smart_mode,
             package_settings=package_settings,
             project_settings=project_settings,
+            lines=selected_lines,
         )
 
 
@@ -129,6 +206,103 @@ class BlackCreateConfiguration(sublime_plugin.WindowCommand):
         view.run_command("insert_snippet", {"contents": CONFIGURATION_CONTENTS})
 
 
+class BlackFormatProjectCommand(sublime_plugin.WindowCommand):
+    # The process formatting each window's project, one at a time.
+    processes: Dict[int, subprocess.Popen] = {}
+
+    def is_enabled(self) -> bool:
+        return bool(self.window.folders())
+
+    def run(self) -> None:
+        process = self.processes.get(self.window.id())
+        if process and process.poll() is None:
+            sublime.status_message("black: The project is already being formatted")
+            return
+
+        folders = self.window.folders()
+        if len(folders) == 1:
+            self._format(folders[0])
+        else:
+            self.window.show_quick_panel(
+                folders,
+                lambda index: self._on_selected(folders, index),
+                placeholder="Select a folder to format",
+            )
+
+    def _on_selected(self, folders: List[str], index: int) -> None:
+        if index > -1:
+            self._format(folders[index])
+
+    def _format(self, folder: str) -> None:
+        if not sublime.ok_cancel_dialog(
+            f"Format all the Python files in {folder}?", "Format"
+        ):
+            return
+
+        config_file = Path(folder, CONFIGURATION_FILENAME)
+        config = get_black_config(
+            config_file if config_file.is_file() else find_global_config_file(),
+            False,
+            get_package_settings().to_dict(),  # type: ignore
+            get_window_project_settings(self.window),
+        )
+        assert config is not None
+        daemon: Dict[str, Any] = get_package_settings().get("daemon") or {}  # type: ignore
+        params = {
+            "mode": mode_to_dict(get_black_mode(config)),
+            "include": config.get("include"),
+            "exclude": config.get("exclude"),
+            "extend_exclude": config.get("extend_exclude"),
+            "force_exclude": config.get("force_exclude"),
+            # Files with unsaved changes would be overwritten on reload.
+            "skip": [
+                view.file_name()
+                for view in self.window.views()
+                if view.is_dirty() and view.file_name()
+            ],
+            "workers": daemon.get("workers") or None,
+        }
+
+        panel = self.window.create_output_panel("black_project")
+        self.window.run_command("show_panel", {"panel": "output.black_project"})
+
+        def append(line: str) -> None:
+            sublime.set_timeout(
+                lambda: panel.run_command(
+                    "append",
+                    {"characters": line, "force": True, "scroll_to_end": True},
+                )
+            )
+
+        try:
+            self.processes[self.window.id()] = format_project(
+                daemon.get("python") or "python3", folder, params, append
+            )
+        except OSError as e:
+            append(f"black: cannot start the project formatter: {e}\n")
+
+
+class BlackStatisticsCommand(sublime_plugin.WindowCommand):
+    def run(self) -> None:
+        stats: Dict[str, Any] = {
+            "result_cache": result_cache.stats(),
+            "config_cache": config_cache.stats(),
+            "incremental_parsing": parser_stats(),
+            "grammars": grammar_stats.stats(),
+            "soft_keywords": soft_keyword_stats.stats(),
+            "transforms": transform_cache.stats(),
+        }
+
+        client = get_client()
+        if client:
+            try:
+                stats["daemon"] = client.stats()
+            except (DaemonError, DaemonUnavailable) as e:
+                stats["daemon"] = str(e)
+
+        show_error_panel(json.dumps(stats, indent=2))
+
+
 class AutoFormatOnSave(sublime_plugin.EventListener):
     def format_on_save_mode(self, view: sublime.View) -> Mode:
         settings = get_package_settings()
@@ -154,13 +328,85 @@ class AutoFormatOnSave(sublime_plugin.EventListener):
         return mode
 
     def on_pre_save(self, view: sublime.View):
+        if worker.consume_skip(view):
+            return
+
         mode = self.format_on_save_mode(view)
+        if mode == Mode.OFF:
+            return
 
-        if mode == Mode.ON:
-            view.run_command("black", {"use_selection": False})
+        smart_mode = mode == Mode.SMART
+
+        lines = None
+        if get_setting(view, "format_on_save_changes_only", False):
+            lines = changed_lines.get(view)
+            if lines == []:
+                return
+
+        if get_setting(view, "format_on_save_async", False):
+            self.format_in_background(view, smart_mode, lines)
+        elif smart_mode:
+            view.run_command(
+                "black", {"use_selection": False, "smart_mode": True, "lines": lines}
+            )
+        else:
+            view.run_command("black", {"use_selection": False, "lines": lines})
             sublime.status_message("black: Document has been automatically formatted")
-        elif mode == Mode.SMART:
-            view.run_command("black", {"use_selection": False, "smart_mode": True})
+
+    def on_load(self, view: sublime.View):
+        changed_lines.reset(view.buffer_id())
+
+    def on_new(self, view: sublime.View):
+        changed_lines.reset(view.buffer_id())
+
+    def on_post_save(self, view: sublime.View):
+        changed_lines.reset(view.buffer_id())
+
+    def on_close(self, view: sublime.View):
+        worker.cancel(view.id())
+        if not view.clones():
+            changed_lines.forget(view.buffer_id())
+            forget_parser(view.buffer_id())
+
+    def format_in_background(
+        self,
+        view: sublime.View,
+        smart_mode: bool,
+        lines: Optional[List[Tuple[int, int]]],
+    ):
+        syntax: str = view.settings().get("syntax", "")  # type: ignore
+        if syntax.lower().find("python") == -1:
+            return
+
+        request = prepare_format(
+            view,
+            view.substr(sublime.Region(0, view.size())),
+            smart_mode,
+            get_package_settings().to_dict(),  # type: ignore
+            get_project_settings(view),
+            lines or (),
+        )
+        deadline: int = get_setting(view, "format_on_save_deadline", 3000)  # type: ignore
+        worker.submit(FormatJob(view, request), deadline)
+
+
+class ChangedLinesListener(sublime_plugin.TextChangeListener):
+    def on_text_changed(self, changes: List[sublime.TextChange]):
+        changed_lines.update(self.buffer.id(), changes)
+
+    def on_reload(self):
+        changed_lines.reset(self.buffer.id())
+
+    def on_revert(self):
+        changed_lines.reset(self.buffer.id())
+
+
+class BlackReplaceCommand(sublime_plugin.TextCommand):
+    def run(self, edit, text):
+        replace_text(edit, self.view, sublime.Region(0, self.view.size()), text)
+
+    def is_visible(self, *args):
+        return False
 
 
 class BlackOutputCommand(sublime_plugin.TextCommand):
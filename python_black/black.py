@@ -1,36 +1,86 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import json
+import os
 import sublime
 import sys
+import threading
 
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Any, Collection, Dict, NamedTuple, Optional, Tuple, List
 
 from .lib import tomli as tomllib
 from .lib.black import format_str
 from .lib.black.files import infer_target_version
+from .lib.black.cache import ResultCache
 from .lib.black.mode import Mode, TargetVersion
 from .lib.black.const import DEFAULT_LINE_LENGTH, DEFAULT_INCLUDES
+from .lib.black.parsing import IncrementalParser
+from .client import DaemonClient, DaemonUnavailable, get_client
 from .types import BlackConfig, SublimeSettings
-from .utils import get_project_setting_file, replace_text, out
+from .utils import (
+    find_root_path_of_current_file,
+    get_package_settings,
+    get_project_setting_file,
+    replace_text,
+    out,
+)
 from .log import child_logger
 
 
 logger = child_logger(__name__)
 
+result_cache = ResultCache()
+
+# The parser of each buffer, which keeps the tree of its last formatted source.
+parsers: Dict[int, IncrementalParser] = {}
+
+
+def get_parser(view: sublime.View) -> Optional[IncrementalParser]:
+    """Return the incremental parser of the buffer of `view`, if it is enabled."""
+    incremental_parsing = get_package_settings().get("incremental_parsing", False)
+    if not incremental_parsing:
+        return None
+
+    buffer_id = view.buffer_id()
+    parser = parsers.get(buffer_id)
+    validate = incremental_parsing == "validate"
+    if parser is None or parser.validate != validate:
+        parser = parsers[buffer_id] = IncrementalParser(validate=validate)
+    return parser
+
+
+def forget_parser(buffer_id: int) -> None:
+    parsers.pop(buffer_id, None)
+
+
+def parser_stats() -> Dict[str, int]:
+    values = list(parsers.values())
+    return {
+        "buffers": len(values),
+        "full_parses": sum(p.full_parses for p in values),
+        "incremental_parses": sum(p.incremental_parses for p in values),
+        "validation_failures": sum(p.validation_failures for p in values),
+        "cached_failures": sum(p.cached_failures for p in values),
+    }
+
 
 def target_version_option_callback(v: List[str]) -> List[TargetVersion]:
     return [TargetVersion[val.upper()] for val in v]
 
 
-def find_global_config_file() -> Optional[Path]:
+def global_config_path() -> Path:
     HOME = Path.home()
 
     if sys.platform == "win32":
-        config_file = HOME / ".black"
-    else:
-        config_file = HOME / ".config" / "black"
+        return HOME / ".black"
+
+    return HOME / ".config" / "black"
+
+
+def find_global_config_file() -> Optional[Path]:
+    config_file = global_config_path()
 
     if config_file.exists() and config_file.is_file():
         return config_file
@@ -126,27 +176,15 @@ def update_config(default_config: BlackConfig, settings: SublimeSettings):
     )
 
 
-def black_format_str(
-    code: str,
+def get_black_config(
     config_file: Optional[Path],
     smart_mode: bool,
     package_settings: Optional[SublimeSettings],
     project_settings: Optional[SublimeSettings],
-) -> Optional[str]:
-    """
-    Directly call the format function of the `black`
-    package to complete the formatting of the code.
+) -> Optional[BlackConfig]:
+    """Merge the Black options of the settings and of the configuration file.
 
-    Args:
-        code (str): The code to be formatted
-        src (Tuple[str, ...]): Files path to be formatted.
-            Currently only one file can be formatted, so only one path can be passed in
-        config_file (Optional[str]): Configuration file to be used (default: {None})
-        package_settings (Optional[Dict[str, Any]]): Package settings
-        project_settings (Optional[Dict[str, Any]]): Project settings
-
-    Returns:
-        Optional[str]: Formatted code
+    Returns None in smart mode if the configuration file has no Black section.
     """
     default_config: Optional[BlackConfig] = {
         "target_version": [],
@@ -193,62 +231,292 @@ def black_format_str(
             default_config,
         )
 
+    logger.info("configuration used: %s", default_config)
+
+    return default_config
+
+
+def get_black_mode(config: BlackConfig) -> Mode:
     versions = set()
-    target_version_in_config_file = default_config.get("target_version")
+    target_version_in_config_file = config.get("target_version")
     if target_version_in_config_file:
         target_version = target_version_option_callback(target_version_in_config_file)
         if target_version:
             versions = set(target_version)
 
-    logger.info("configuration used: %s", default_config)
-
-    mode = Mode(
+    return Mode(
         target_versions=versions,
-        line_length=default_config["line_length"],
-        is_pyi=default_config["is_pyi"],
-        skip_source_first_line=default_config["skip_source_first_line"],
-        string_normalization=not default_config["skip_string_normalization"],
-        magic_trailing_comma=not default_config["skip_magic_trailing_comma"],
+        line_length=config["line_length"],
+        is_pyi=config["is_pyi"],
+        skip_source_first_line=config["skip_source_first_line"],
+        string_normalization=not config["skip_string_normalization"],
+        magic_trailing_comma=not config["skip_magic_trailing_comma"],
     )
 
-    if code:
-        formatted = format_str(code, mode=mode)
 
-        return formatted
+def format_code(request: "FormatRequest", mode: Mode) -> str:
+    """Format the source of `request` in the formatter daemon if it is enabled,
+    in process otherwise.
 
+    Results are looked up in and saved to `result_cache` if the `result_cache`
+    setting is enabled, unless only some lines are formatted. The parser of the
+    request is only used in process.
+    """
+    code = request.source
+    use_cache = request.result_cache and not request.lines
+    if use_cache:
+        formatted = result_cache.get(code, mode)
+        if formatted is not None:
+            logger.debug("result cache hit")
+            return formatted
+
+    formatted = _format_code(request, mode)
+    if use_cache:
+        result_cache.put(code, mode, formatted)
 
-def format_by_import_black_package(
+    return formatted
+
+
+def _format_code(request: "FormatRequest", mode: Mode) -> str:
+    client = request.client
+    if client:
+        try:
+            return client.format(request.source, mode, request.lines)
+        except DaemonUnavailable as e:
+            logger.warning("formatter daemon unavailable, formatting in process: %s", e)
+
+    return format_str(
+        request.source,
+        mode=mode,
+        lines=request.lines,
+        parser=request.parser,
+        verify_stability=request.verify_stability,
+    )
+
+
+def file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    """Return the modification time and size of `path`, or None if it is missing."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+
+    return stat.st_mtime_ns, stat.st_size
+
+
+class ResolvedConfig(NamedTuple):
+    config_file: Optional[Path]
+    # None if nothing should be formatted in smart mode.
+    mode: Optional[Mode]
+    # The stamps of the configuration files when they were read.
+    stamps: Dict[Path, Optional[Tuple[int, int]]]
+
+
+class ConfigCache:
+    """The `Mode` resolved for the files of a directory.
+
+    Finding and reading `pyproject.toml` on every format is replaced by
+    checking the stamps of the configuration files that were used. Entries
+    are also keyed by the Black options of the settings, so changing them
+    resolves the mode again.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[Any, ...], ResolvedConfig] = {}
+
+    @staticmethod
+    def key(
+        view: sublime.View,
+        smart_mode: bool,
+        package_settings: Optional[SublimeSettings],
+        project_settings: Optional[SublimeSettings],
+    ) -> Tuple[Any, ...]:
+        file_name = view.file_name()
+        window = view.window()
+        options = json.dumps(
+            [
+                (settings or {}).get("options")
+                for settings in (package_settings, project_settings)
+            ],
+            sort_keys=True,
+        )
+        return (
+            os.path.dirname(file_name) if file_name else None,
+            tuple(window.folders()) if window else (),
+            smart_mode,
+            options,
+        )
+
+    def get(self, key: Tuple[Any, ...]) -> Optional[ResolvedConfig]:
+        with self._lock:
+            resolved = self._entries.get(key)
+
+        if resolved is not None and all(
+            file_stamp(path) == stamp for path, stamp in resolved.stamps.items()
+        ):
+            with self._lock:
+                self.hits += 1
+            return resolved
+
+        with self._lock:
+            self.misses += 1
+            self._entries.pop(key, None)
+        return None
+
+    def put(self, key: Tuple[Any, ...], resolved: ResolvedConfig) -> None:
+        with self._lock:
+            self._entries[key] = resolved
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+config_cache = ConfigCache()
+
+
+def resolve_config(
     view: sublime.View,
-    source: str,
     smart_mode: bool,
     package_settings: Optional[SublimeSettings],
     project_settings: Optional[SublimeSettings],
-) -> Optional[str]:
+) -> ResolvedConfig:
+    """Find the configuration file of `view` and build the `Mode` to format it with."""
+    key = config_cache.key(view, smart_mode, package_settings, project_settings)
+    resolved = config_cache.get(key)
+    if resolved is not None:
+        logger.debug("configuration cache hit: %s", resolved.config_file)
+        return resolved
+
+    # Stamp the files before reading them, so that a change made meanwhile is
+    # seen next time. The project file is stamped even if it doesn't exist
+    # yet, so that creating it is seen as well.
+    stamps = {
+        path: file_stamp(path)
+        for path in (find_root_path_of_current_file(view), global_config_path())
+        if path
+    }
+
     config_file = find_config_file(view, smart_mode)
 
     logger.info("configuration file used: %s", config_file)
 
     if smart_mode and not config_file:
         logger.info("smart mode is in use, but the project config file is not found")
-        sublime.status_message("black: Project config file is not found")
+        resolved = ResolvedConfig(None, None, stamps)
+    else:
+        # NOTE: Ignore package and project settings if smart mode is enabled.
+        if smart_mode:
+            package_settings, project_settings = None, None
+
+        config = get_black_config(
+            config_file, smart_mode, package_settings, project_settings
+        )
+        resolved = ResolvedConfig(
+            config_file, get_black_mode(config) if config else None, stamps
+        )
+
+    config_cache.put(key, resolved)
+    return resolved
+
+
+class FormatRequest(NamedTuple):
+    """What formatting a source needs from its view and from the settings.
+
+    It is taken on the UI thread, so that run_format() doesn't use the Sublime
+    Text API and can run on any thread.
+    """
+
+    source: str
+    smart_mode: bool
+    resolved: ResolvedConfig
+    lines: Collection[Tuple[int, int]]
+    parser: Optional[IncrementalParser]
+    client: Optional[DaemonClient]
+    result_cache: bool
+    verify_stability: bool
 
-        return
 
-    # NOTE: Ignore package and project settings if smart mode is enabled.
-    if smart_mode:
-        package_settings, project_settings = None, None
+def prepare_format(
+    view: sublime.View,
+    source: str,
+    smart_mode: bool,
+    package_settings: Optional[SublimeSettings],
+    project_settings: Optional[SublimeSettings],
+    lines: Collection[Tuple[int, int]] = (),
+    whole_view: bool = True,
+) -> FormatRequest:
+    """Take what formatting `source` needs, on the UI thread.
 
-    formatted = black_format_str(
-        source, config_file, smart_mode, package_settings, project_settings
+    The parser of the view is only used if `source` is the whole view.
+    """
+    settings: Dict[str, Any] = package_settings or {}  # type: ignore
+    return FormatRequest(
+        source=source,
+        smart_mode=smart_mode,
+        resolved=resolve_config(view, smart_mode, package_settings, project_settings),
+        lines=lines,
+        parser=get_parser(view) if whole_view else None,
+        client=get_client(),
+        result_cache=bool(settings.get("result_cache", False)),
+        verify_stability=bool(settings.get("verify_stability", False)),
     )
+
+
+def run_format(request: FormatRequest) -> Tuple[Optional[str], Optional[str]]:
+    """Format the source of `request`.
+
+    Returns the formatted source, or None and the status message to show.
+    """
+    resolved = request.resolved
+    if resolved.mode is None:
+        if resolved.config_file:
+            return None, "black: Black section is not found"
+
+        return None, "black: Project config file is not found"
+
+    formatted = None
+    if request.source:
+        formatted = format_code(request, resolved.mode)
     if not formatted:
-        # When formatting the selection, an error may be
-        # reported due to indentation issues, but this is
-        # a issue with `black` and I may fix it in the future.
-        if not smart_mode:
-            sublime.status_message("black: Format failed")
+        return None, None if request.smart_mode else "black: Format failed"
 
-        return None
+    return formatted, None
+
+
+def format_by_import_black_package(
+    view: sublime.View,
+    source: str,
+    smart_mode: bool,
+    package_settings: Optional[SublimeSettings],
+    project_settings: Optional[SublimeSettings],
+    lines: Collection[Tuple[int, int]] = (),
+    whole_view: bool = True,
+) -> Optional[str]:
+    formatted, message = run_format(
+        prepare_format(
+            view,
+            source,
+            smart_mode,
+            package_settings,
+            project_settings,
+            lines,
+            whole_view,
+        )
+    )
+    if message:
+        sublime.status_message(message)
 
     return formatted
 
@@ -263,11 +531,18 @@ def black_format(
     smart_mode: bool,
     package_settings: SublimeSettings,
     project_settings: SublimeSettings,
+    lines: Collection[Tuple[int, int]] = (),
 ):
     sublime.status_message("black: Formatting...")
 
     formatted = format_by_import_black_package(
-        view, source, smart_mode, package_settings, project_settings
+        view,
+        source,
+        smart_mode,
+        package_settings,
+        project_settings,
+        lines,
+        region.size() == view.size(),
     )
 
     if formatted:
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import sublime
+
+from typing import Dict, List, Optional, Tuple
+
+from .log import child_logger
+
+logger = child_logger(__name__)
+
+# 0-based, inclusive rows.
+Rows = Tuple[int, int]
+
+
+class ChangedLines:
+    """Track the lines of each buffer changed since it was last saved.
+
+    A buffer is only tracked from the moment it is known to match its file
+    (it was loaded, created, reverted or saved), otherwise the lines changed
+    before can't be known.
+    """
+
+    def __init__(self) -> None:
+        self._rows: Dict[int, List[Rows]] = {}
+
+    def reset(self, buffer_id: int) -> None:
+        self._rows[buffer_id] = []
+
+    def forget(self, buffer_id: int) -> None:
+        self._rows.pop(buffer_id, None)
+
+    def update(self, buffer_id: int, changes: List[sublime.TextChange]) -> None:
+        rows = self._rows.get(buffer_id)
+        if rows is None:
+            return
+
+        for change in changes:
+            first, last = change.a.row, change.b.row
+            inserted = change.str.count("\n")
+            delta = inserted - (last - first)
+
+            changed_first, changed_last = first, first + inserted
+            updated: List[Rows] = []
+            for start, end in rows:
+                if end < first:
+                    updated.append((start, end))
+                elif start > last:
+                    updated.append((start + delta, end + delta))
+                else:
+                    changed_first = min(changed_first, start)
+                    if end > last:
+                        changed_last = max(changed_last, end + delta)
+            updated.append((changed_first, changed_last))
+            rows = self._merge(updated)
+
+        self._rows[buffer_id] = rows
+
+    @staticmethod
+    def _merge(rows: List[Rows]) -> List[Rows]:
+        merged: List[Rows] = []
+        for start, end in sorted(rows):
+            if merged and start <= merged[-1][1] + 1:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
+
+    def get(self, view: sublime.View) -> Optional[List[Tuple[int, int]]]:
+        """Return the 1-based line ranges of `view` changed since it was saved.
+
+        Returns None if the buffer isn't tracked and has unsaved changes.
+        """
+        rows = self._rows.get(view.buffer_id())
+        if rows is None:
+            if view.is_dirty():
+                return None
+            return []
+
+        logger.debug("changed rows of view %d: %s", view.id(), rows)
+        return [(start + 1, end + 1) for start, end in rows]
+
+
+changed_lines = ChangedLines()
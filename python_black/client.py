@@ -0,0 +1,343 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+from concurrent.futures import Future, TimeoutError
+from itertools import count
+from typing import Any, BinaryIO, Callable, Collection, Dict, List, Optional, Tuple
+
+from .lib.black.mode import Mode
+from .lib.black.parsing import InvalidInput
+from .log import child_logger
+from .protocol import Message, ProtocolError, mode_to_dict, read_frame, write_frame
+from .utils import get_package_settings
+
+logger = child_logger(__name__)
+
+# The directory (or `.sublime-package` archive) containing `python_black`.
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def spawn(command: List[str], **kwargs: Any) -> subprocess.Popen:
+    """Start `command`, a Python interpreter, with `python_black` importable."""
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, (PACKAGE_ROOT, env.get("PYTHONPATH")))
+    )
+
+    startupinfo = None
+    if sys.platform == "win32":
+        startupinfo = subprocess.STARTUPINFO()  # type: ignore
+        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW  # type: ignore
+
+    return subprocess.Popen(command, env=env, startupinfo=startupinfo, **kwargs)
+
+
+def format_project(
+    python: str, root: str, params: Message, on_line: Callable[[str], None]
+) -> subprocess.Popen:
+    """Format the Python files of `root` in a new process.
+
+    `on_line` is called from another thread with each line of its output.
+    """
+    command = [python, "-m", "python_black.project", root, json.dumps(params)]
+    logger.info("formatting project: %s", command[:-1])
+    process = spawn(
+        command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    )
+
+    def read_output() -> None:
+        assert process.stdout is not None
+        for line in iter(process.stdout.readline, b""):
+            on_line(line.decode("utf-8", "replace"))
+        process.wait()
+        on_line(f"[exit code {process.returncode}]\n")
+
+    threading.Thread(
+        target=read_output, name="python-black-project-reader", daemon=True
+    ).start()
+    return process
+
+
+class DaemonUnavailable(Exception):
+    """Raised when the daemon can't be started or stops answering."""
+
+
+class DaemonError(Exception):
+    """An error reported by the daemon that has no local equivalent."""
+
+    def __init__(self, type: str, message: str) -> None:
+        super().__init__(f"{type}: {message}")
+        self.type = type
+        self.message = message
+
+
+class DaemonClient:
+    """Talk to a formatter daemon over its standard streams or a Unix socket.
+
+    The daemon is started lazily on the first request. Requests may be sent
+    from several threads at once; responses are matched by their `id`.
+    """
+
+    def __init__(
+        self,
+        python: str,
+        socket_path: Optional[str] = None,
+        workers: Optional[int] = None,
+        timeout: float = 10.0,
+        line_workers: Optional[int] = None,
+        parse_workers: Optional[int] = None,
+    ) -> None:
+        self.python = python
+        self.socket_path = socket_path
+        self.workers = workers
+        self.timeout = timeout
+        self.line_workers = line_workers
+        self.parse_workers = parse_workers
+
+        self._lock = threading.Lock()
+        self._ids = count(1)
+        self._waiting: Dict[int, "Future[Any]"] = {}
+        self._process: Optional[subprocess.Popen] = None
+        self._socket: Optional[socket.socket] = None
+        self._reader: Optional[BinaryIO] = None
+        self._writer: Optional[BinaryIO] = None
+
+    @property
+    def config(
+        self,
+    ) -> Tuple[str, Optional[str], Optional[int], float, Optional[int], Optional[int]]:
+        return (
+            self.python,
+            self.socket_path,
+            self.workers,
+            self.timeout,
+            self.line_workers,
+            self.parse_workers,
+        )
+
+    def _command(self) -> List[str]:
+        command = [self.python, "-m", "python_black.daemon"]
+        if self.socket_path:
+            command += ["--socket", self.socket_path]
+        if self.workers:
+            command += ["--workers", str(self.workers)]
+        if self.line_workers:
+            command += ["--line-workers", str(self.line_workers)]
+        if self.parse_workers:
+            command += ["--parse-workers", str(self.parse_workers)]
+        return command
+
+    def _spawn(self, **kwargs: Any) -> subprocess.Popen:
+        command = self._command()
+        logger.info("starting formatter daemon: %s", command)
+        return spawn(command, stderr=None, **kwargs)
+
+    def _connect_socket(self) -> None:
+        assert self.socket_path is not None
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)  # type: ignore
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self._socket = sock
+        self._reader = sock.makefile("rb")
+        self._writer = sock.makefile("wb")
+
+    def _start(self) -> None:
+        if self._writer is not None:
+            return
+
+        try:
+            if self.socket_path:
+                try:
+                    self._connect_socket()
+                except OSError:
+                    self._process = self._spawn(stdin=subprocess.DEVNULL)
+                    self._wait_for_socket()
+            else:
+                self._process = self._spawn(
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE
+                )
+                self._reader = self._process.stdout  # type: ignore
+                self._writer = self._process.stdin  # type: ignore
+        except OSError as e:
+            self._reset()
+            raise DaemonUnavailable(f"cannot start the formatter daemon: {e}")
+
+        threading.Thread(
+            target=self._read_responses,
+            args=(self._reader,),
+            name="python-black-daemon-reader",
+            daemon=True,
+        ).start()
+
+    def _wait_for_socket(self) -> None:
+        for _ in range(50):
+            try:
+                self._connect_socket()
+                return
+            except OSError:
+                if self._process and self._process.poll() is not None:
+                    break
+                time.sleep(0.1)
+        raise OSError(f"the daemon didn't listen on {self.socket_path}")
+
+    def _read_responses(self, reader: BinaryIO) -> None:
+        try:
+            while True:
+                message = read_frame(reader)
+                if message is None:
+                    break
+
+                with self._lock:
+                    future = self._waiting.pop(message.get("id"), None)  # type: ignore
+                if future is not None:
+                    future.set_result(message)
+        except (OSError, ProtocolError, ValueError) as e:
+            logger.error("lost the connection to the formatter daemon: %s", e)
+        finally:
+            with self._lock:
+                if self._reader is reader:
+                    self._reset()
+
+    def _reset(self) -> None:
+        """Forget the current connection and fail the requests waiting on it."""
+        for future in self._waiting.values():
+            future.set_exception(DaemonUnavailable("the formatter daemon exited"))
+        self._waiting.clear()
+        if self._socket is not None:
+            self._socket.close()
+        self._socket = None
+        self._reader = None
+        self._writer = None
+        self._process = None
+
+    def request(self, method: str, params: Optional[Message] = None) -> Any:
+        future: "Future[Message]" = Future()
+        with self._lock:
+            self._start()
+            reader = self._reader
+            request_id = next(self._ids)
+            self._waiting[request_id] = future
+            try:
+                assert self._writer is not None
+                write_frame(
+                    self._writer,
+                    {"id": request_id, "method": method, "params": params or {}},
+                )
+            except OSError as e:
+                self._waiting.pop(request_id, None)
+                self._reset()
+                raise DaemonUnavailable(f"cannot send to the formatter daemon: {e}")
+
+        try:
+            response = future.result(self.timeout)
+        except TimeoutError:
+            # The daemon is most likely stuck, so it is dropped rather than
+            # making every later request wait for the timeout as well.
+            process = None
+            with self._lock:
+                self._waiting.pop(request_id, None)
+                if self._reader is reader:
+                    process = self._process
+                    self._reset()
+            if process is not None:
+                process.kill()
+            raise DaemonUnavailable(
+                f"the formatter daemon didn't answer within {self.timeout}s"
+            )
+
+        error = response.get("error")
+        if error:
+            if error["type"] == "InvalidInput":
+                raise InvalidInput(error["message"])
+            raise DaemonError(error["type"], error["message"])
+
+        return response.get("result")
+
+    def format(
+        self, source: str, mode: Mode, lines: Collection[Tuple[int, int]] = ()
+    ) -> str:
+        return self.request(
+            "format",
+            {"source": source, "mode": mode_to_dict(mode), "lines": list(lines)},
+        )
+
+    def stats(self) -> Message:
+        return self.request("stats")
+
+    def close(self) -> None:
+        with self._lock:
+            process = self._process
+            writer = self._writer
+            if writer is None:
+                return
+            try:
+                # A socket daemon we didn't start is left running for its
+                # other clients.
+                if process is not None and self.socket_path:
+                    write_frame(writer, {"id": 0, "method": "shutdown"})
+                writer.close()
+            except OSError:
+                pass
+            self._reset()
+
+        if process is not None:
+            try:
+                process.wait(1)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+
+_client: Optional[DaemonClient] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> Optional[DaemonClient]:
+    """Return the daemon client configured in the package settings, if enabled."""
+    global _client
+
+    settings: Dict[str, Any] = get_package_settings().get("daemon") or {}  # type: ignore
+    if not settings.get("enabled", False):
+        stop_client()
+        return None
+
+    config = (
+        settings.get("python") or "python3",
+        settings.get("socket") or None,
+        settings.get("workers") or None,
+        float(settings.get("timeout", 10000)) / 1000,
+        settings.get("line_workers") or None,
+        settings.get("parse_workers") or None,
+    )
+
+    with _client_lock:
+        if _client is not None and _client.config != config:
+            _client.close()
+            _client = None
+
+        if _client is None:
+            _client = DaemonClient(*config)
+
+        return _client
+
+
+def stop_client() -> None:
+    global _client
+
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
@@ -0,0 +1,289 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""A long-lived local formatter, like `blackd` but without HTTP.
+
+The daemon keeps the grammars, the compiled regular expressions and the
+`Mode` objects warm between requests, and speaks the framed protocol from
+`protocol.py` over its standard streams or a Unix socket:
+
+    python -m python_black.daemon [--socket PATH] [--workers N] [--line-workers N]
+                                  [--parse-workers N]
+
+It must not import `sublime`: it runs in a plain Python interpreter.
+"""
+
+import argparse
+import json
+import os
+import socketserver
+import sys
+import threading
+import time
+
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Deque, Dict, List, Optional
+
+from .lib.black import format_str
+from .lib.black.mode import Mode
+from .protocol import Message, ProtocolError, mode_from_dict, read_frame, write_frame
+
+Reply = Callable[[Message], None]
+
+LATENCY_WINDOW = 1000
+
+_modes: Dict[str, Mode] = {}
+
+
+def get_mode(params: Message) -> Mode:
+    """Return a cached `Mode` for the serialized `params`."""
+    key = json.dumps(params, sort_keys=True)
+    mode = _modes.get(key)
+    if mode is None:
+        mode = _modes[key] = mode_from_dict(params)
+    return mode
+
+
+def format_source(
+    source: str,
+    mode_params: Message,
+    lines: List[List[int]],
+    line_workers: int = 0,
+    parse_workers: int = 0,
+) -> str:
+    return format_str(
+        source,
+        mode=get_mode(mode_params),
+        lines=[(first, last) for first, last in lines],
+        line_workers=line_workers,
+        parse_workers=parse_workers,
+    )
+
+
+def warm_up() -> None:
+    """Run a tiny format so that a new worker has every module and grammar loaded."""
+    format_str("pass\n", mode=Mode())
+
+
+class LatencyTracker:
+    """Keep the latencies of the most recent requests."""
+
+    def __init__(self, window: int = LATENCY_WINDOW) -> None:
+        self._lock = threading.Lock()
+        self._samples: Deque[float] = deque(maxlen=window)
+        self.count = 0
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+            self.count += 1
+
+    def percentiles(self) -> Dict[str, float]:
+        with self._lock:
+            samples = sorted(self._samples)
+            count = self.count
+
+        if not samples:
+            return {"count": count}
+
+        def percentile(p: float) -> float:
+            index = min(len(samples) - 1, int(round(p / 100 * (len(samples) - 1))))
+            return round(samples[index] * 1000, 3)
+
+        return {
+            "count": count,
+            "p50": percentile(50),
+            "p90": percentile(90),
+            "p99": percentile(99),
+            "max": round(samples[-1] * 1000, 3),
+        }
+
+
+class Daemon:
+    def __init__(
+        self, workers: int, line_workers: int = 0, parse_workers: int = 0
+    ) -> None:
+        self.workers = workers
+        self.line_workers = line_workers
+        self.parse_workers = parse_workers
+        self.executor = self._create_executor(workers)
+        self.latency = LatencyTracker()
+        self.errors = 0
+        self.stopped = threading.Event()
+
+    @staticmethod
+    def _create_executor(workers: int) -> Executor:
+        try:
+            executor: Executor = ProcessPoolExecutor(
+                max_workers=workers, initializer=warm_up
+            )
+        except (ImportError, NotImplementedError, OSError):
+            # No multiprocessing support, so more than one thread wouldn't help
+            # because of the GIL.
+            executor = ThreadPoolExecutor(max_workers=1, initializer=warm_up)
+        return executor
+
+    def stats(self) -> Message:
+        return {
+            "pid": os.getpid(),
+            "workers": self.workers,
+            "line_workers": self.line_workers,
+            "parse_workers": self.parse_workers,
+            "errors": self.errors,
+            "latency_ms": self.latency.percentiles(),
+        }
+
+    def handle(self, message: Message, reply: Reply) -> None:
+        request_id = message.get("id")
+        method = message.get("method")
+        params = message.get("params") or {}
+        started = time.perf_counter()
+
+        if method == "format":
+            try:
+                future = self.executor.submit(
+                    format_source,
+                    params["source"],
+                    params["mode"],
+                    params.get("lines") or [],
+                    self.line_workers,
+                    self.parse_workers,
+                )
+            except Exception as e:
+                reply(self._error(request_id, e))
+                return
+
+            future.add_done_callback(
+                lambda f: reply(self._response(request_id, f, started))
+            )
+        elif method == "stats":
+            reply({"id": request_id, "result": self.stats()})
+        elif method == "ping":
+            reply({"id": request_id, "result": "pong"})
+        elif method == "shutdown":
+            reply({"id": request_id, "result": None})
+            self.stopped.set()
+        else:
+            reply(self._error(request_id, ValueError(f"unknown method: {method!r}")))
+
+    def _response(self, request_id: int, future: "Future[str]", started: float):
+        self.latency.record(time.perf_counter() - started)
+        # Raising the error here, in the thread of the process pool, would keep
+        # the thread alive through its traceback, and Python 3.8 would then wake
+        # it at exit through a pipe that shutting the pool down closed.
+        error = future.exception()
+        if error is not None:
+            return self._error(request_id, error)
+        return {"id": request_id, "result": future.result()}
+
+    def _error(self, request_id: Optional[int], exc: BaseException) -> Message:
+        self.errors += 1
+        return {
+            "id": request_id,
+            "error": {"type": type(exc).__name__, "message": str(exc)},
+        }
+
+    def serve_stdio(self) -> None:
+        stdin = sys.stdin.buffer
+        stdout = sys.stdout.buffer
+        # Nothing but frames may be written to stdout.
+        sys.stdout = sys.stderr
+        lock = threading.Lock()
+
+        def reply(message: Message) -> None:
+            with lock:
+                write_frame(stdout, message)
+
+        while not self.stopped.is_set():
+            try:
+                message = read_frame(stdin)
+            except (ProtocolError, ValueError) as e:
+                print(f"python-black daemon: {e}", file=sys.stderr)
+                break
+            if message is None:
+                break
+            self.handle(message, reply)
+
+    def serve_socket(self, path: str) -> None:
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                lock = threading.Lock()
+
+                def reply(message: Message) -> None:
+                    with lock:
+                        try:
+                            write_frame(self.wfile, message)
+                        except OSError:
+                            pass
+
+                while not daemon.stopped.is_set():
+                    try:
+                        message = read_frame(self.rfile)
+                    except (ProtocolError, ValueError, OSError):
+                        break
+                    if message is None:
+                        break
+                    daemon.handle(message, reply)
+
+        if os.path.exists(path):
+            os.remove(path)
+
+        server = socketserver.ThreadingUnixStreamServer(path, Handler)
+        server.daemon_threads = True
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            self.stopped.wait()
+        finally:
+            server.shutdown()
+            server.server_close()
+            os.remove(path)
+
+    def close(self) -> None:
+        self.executor.shutdown()
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="python-black formatter daemon")
+    parser.add_argument("--socket", help="listen on this Unix socket instead of stdio")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=min(4, os.cpu_count() or 1),
+        help="number of formatting processes",
+    )
+    parser.add_argument(
+        "--line-workers",
+        type=int,
+        default=0,
+        help="number of processes splitting the lines of a large file",
+    )
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=0,
+        help="number of processes parsing a large file",
+    )
+    args = parser.parse_args(argv)
+
+    if args.socket and not hasattr(socketserver, "ThreadingUnixStreamServer"):
+        parser.error("Unix sockets are not supported on this platform")
+
+    daemon = Daemon(max(1, args.workers), args.line_workers, args.parse_workers)
+    try:
+        if args.socket:
+            daemon.serve_socket(args.socket)
+        else:
+            daemon.serve_stdio()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""The replacements applying a formatting result to a view.
+
+It must not import `sublime`, so that it can be measured outside of it.
+"""
+
+import difflib
+
+from typing import List, Tuple
+
+# Above this many pairs of changed old and new lines, they are replaced at
+# once instead of being diffed, which takes time in their product.
+MAX_DIFF_SIZE = 5_000
+
+
+def line_edits(old: str, new: str) -> List[Tuple[int, int, str]]:
+    """Return the replacements of whole lines turning `old` into `new`.
+
+    Each replacement is `(start, end, text)`, with offsets into `old`, and they
+    are sorted and don't overlap. The lines shared at the start and at the end
+    are skipped before diffing the rest.
+    """
+    old_lines = old.splitlines(keepends=True)
+    new_lines = new.splitlines(keepends=True)
+
+    first = 0
+    limit = min(len(old_lines), len(new_lines))
+    while first < limit and old_lines[first] == new_lines[first]:
+        first += 1
+    last = 0
+    while last < limit - first and old_lines[-1 - last] == new_lines[-1 - last]:
+        last += 1
+
+    old_changed = old_lines[first : len(old_lines) - last]
+    new_changed = new_lines[first : len(new_lines) - last]
+    if not old_changed and not new_changed:
+        return []
+
+    offsets = [sum(map(len, old_lines[:first]))]
+    for line in old_changed:
+        offsets.append(offsets[-1] + len(line))
+
+    if len(old_changed) * len(new_changed) > MAX_DIFF_SIZE:
+        return [(offsets[0], offsets[-1], "".join(new_changed))]
+
+    matcher = difflib.SequenceMatcher(None, old_changed, new_changed, autojunk=False)
+    return [
+        (offsets[i1], offsets[i2], "".join(new_changed[j1:j2]))
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != "equal"
+    ]
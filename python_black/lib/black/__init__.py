@@ -8,23 +8,17 @@ from dataclasses import replace
 from datetime import datetime, timezone
 from json.decoder import JSONDecodeError
 from pathlib import Path
-from typing import Generator, Iterator, List, Set, Tuple, Optional, Any
+from typing import Collection, Generator, Iterator, List, Set, Tuple, Optional, Any
 
 from .files import (
     wrap_stream_for_windows,
 )
-from .nodes import (
-    STARS,
-    syms,
-    is_simple_decorator_expression,
-    is_string_token,
-    is_number_token,
-)
-from .output import color_diff, diff, dump_to_file
+from .nodes import syms
+from .output import color_diff, diff, dump_to_file, err
 from .parsing import parse_ast, stringify_ast
 from .report import Changed, NothingChanged
 from .lines import Line, EmptyLineTracker, LinesBlock
-from .linegen import transform_line, LineGenerator, LN
+from .linegen import transform_line_strings, transform_lines, LineGenerator, LN
 from .comments import normalize_fmt_off
 from .mode import (
     Mode,
@@ -34,13 +28,13 @@ from .mode import (
     VERSION_TO_FEATURES,
     FUTURE_FLAG_TO_FEATURE,
 )
-from .parsing import lib2to3_parse
+from .parsing import FeatureCollector, IncrementalParser, lib2to3_parse
+from .ranges import changed_lines, format_statements
 
 
 # lib2to3 fork
 from ..blib2to3.pytree import Node, Leaf
 from ..blib2to3.pgen2 import token
-from .trans import iter_fexpr_spans
 
 from .._black_version import version as __version__
 
@@ -213,11 +207,28 @@ def format_file_in_place(
     return True
 
 
-def format_str(src_contents: str, *, mode: Mode) -> str:
+def format_str(
+    src_contents: str,
+    *,
+    mode: Mode,
+    lines: Collection[Tuple[int, int]] = (),
+    parser: Optional[IncrementalParser] = None,
+    verify_stability: bool = False,
+    line_workers: int = 0,
+    parse_workers: int = 0,
+) -> str:
     """Reformat a string and return new contents.
 
     `mode` determines formatting options, such as how many characters per line are
-    allowed.  Example:
+    allowed.  If `lines` is given, only the statements overlapping those 1-based,
+    inclusive line ranges are reformatted.  If `parser` is given, it parses the
+    source, reusing what it parsed of the previous source.  If `verify_stability`
+    is true, the second pass is always run in full, and a difference with the
+    partial second pass is reported.  With more than one of `line_workers`, the
+    lines of large files are split by that many processes, see transform_lines().
+    With more than one of `parse_workers`, large files are parsed in chunks by
+    that many processes, see lib2to3_parse().
+    Example:
 
     >>> import black
     >>> print(black.format_str("def f(arg:str='')->None:...", mode=black.Mode()))
@@ -243,17 +254,91 @@ def format_str(src_contents: str, *, mode: Mode) -> str:
         hey
 
     """
-    dst_contents = _format_str_once(src_contents, mode=mode)
+    unstable_lines: List[Tuple[int, int]] = []
+    dst_contents = _format_str_once(
+        src_contents,
+        mode=mode,
+        lines=lines,
+        parser=parser,
+        unstable_lines=unstable_lines,
+        line_workers=line_workers,
+        parse_workers=parse_workers,
+    )
     # Forced second pass to work around optional trailing commas (becoming
     # forced trailing commas on pass 2) interacting differently with optional
-    # parentheses.  Admittedly ugly.
-    if src_contents != dst_contents:
-        return _format_str_once(dst_contents, mode=mode)
-    return dst_contents
+    # parentheses.  Admittedly ugly.  Only the statements with such lines are
+    # formatted again.
+    if src_contents == dst_contents:
+        return dst_contents
+
+    if lines:
+        lines = changed_lines(src_contents, dst_contents)
+        if not lines:
+            return dst_contents
+        return _format_str_once(
+            dst_contents,
+            mode=mode,
+            lines=lines,
+            parser=parser,
+            parse_workers=parse_workers,
+        )
+
+    result = dst_contents
+    if unstable_lines:
+        result = _format_str_once(
+            dst_contents,
+            mode=mode,
+            lines=unstable_lines,
+            parser=parser,
+            line_workers=line_workers,
+            parse_workers=parse_workers,
+        )
+    if verify_stability:
+        expected = _format_str_once(
+            dst_contents,
+            mode=mode,
+            parser=parser,
+            line_workers=line_workers,
+            parse_workers=parse_workers,
+        )
+        if result != expected:
+            log = dump_to_file(
+                str(mode),
+                diff(dst_contents, expected, "first pass", "second pass"),
+                diff(dst_contents, result, "first pass", "partial second pass"),
+            )
+            err(
+                "The partial second pass differs from the full one. This diff might"
+                f" be helpful: {log}"
+            )
+            return expected
+    return result
 
 
-def _format_str_once(src_contents: str, *, mode: Mode) -> str:
-    src_node = lib2to3_parse(src_contents.lstrip(), mode.target_versions)
+def _format_str_once(
+    src_contents: str,
+    *,
+    mode: Mode,
+    lines: Collection[Tuple[int, int]] = (),
+    parser: Optional[IncrementalParser] = None,
+    unstable_lines: Optional[List[Tuple[int, int]]] = None,
+    line_workers: int = 0,
+    parse_workers: int = 0,
+) -> str:
+    """Format `src_contents` once.
+
+    The ranges of output lines that might be split differently when formatted
+    again are added to `unstable_lines`, unless only `lines` were formatted.
+
+    With more than one of `line_workers`, the lines are all generated first,
+    and then given to transform_lines().
+    """
+    if parser is not None:
+        src_node = parser.parse(src_contents.lstrip(), mode.target_versions)
+    else:
+        src_node = lib2to3_parse(
+            src_contents.lstrip(), mode.target_versions, parse_workers
+        )
     dst_blocks: List[LinesBlock] = []
     if mode.target_versions:
         versions = mode.target_versions
@@ -266,27 +351,62 @@ def _format_str_once(src_contents: str, *, mode: Mode) -> str:
         for feature in {Feature.PARENTHESIZED_CONTEXT_MANAGERS}
         if supports_feature(versions, feature)
     }
-    normalize_fmt_off(src_node)
-    lines = LineGenerator(mode=mode, features=context_manager_features)
-    elt = EmptyLineTracker(mode=mode)
     split_line_features = {
         feature
         for feature in {Feature.TRAILING_COMMA_IN_CALL, Feature.TRAILING_COMMA_IN_DEF}
         if supports_feature(versions, feature)
     }
+    if lines:
+        dst_contents = format_statements(
+            src_contents,
+            src_node,
+            lines,
+            mode=mode,
+            features=context_manager_features,
+            split_line_features=split_line_features,
+        )
+        if dst_contents is not None:
+            return dst_contents
+
+    normalize_fmt_off(src_node)
+    line_generator = LineGenerator(mode=mode, features=context_manager_features)
+    elt = EmptyLineTracker(mode=mode)
     block: Optional[LinesBlock] = None
-    for current_line in lines.visit(src_node):
-        block = elt.maybe_empty_lines(current_line)
-        dst_blocks.append(block)
-        for line in transform_line(
-            current_line, mode=mode, features=split_line_features
-        ):
-            block.content_lines.append(str(line))
+    unstable_blocks: Set[int] = set()
+    if line_workers > 1:
+        logical_lines = []
+        for current_line in line_generator.visit(src_node):
+            dst_blocks.append(elt.maybe_empty_lines(current_line))
+            logical_lines.append(current_line)
+        transformed = transform_lines(
+            logical_lines, mode, split_line_features, line_workers
+        )
+        for index, (content_lines, unstable) in enumerate(transformed):
+            dst_blocks[index].content_lines.extend(content_lines)
+            if unstable:
+                unstable_blocks.add(index)
+    else:
+        for current_line in line_generator.visit(src_node):
+            block = elt.maybe_empty_lines(current_line)
+            dst_blocks.append(block)
+            content_lines, unstable = transform_line_strings(
+                current_line, mode, split_line_features
+            )
+            block.content_lines.extend(content_lines)
+            if unstable:
+                unstable_blocks.add(len(dst_blocks) - 1)
     if dst_blocks:
         dst_blocks[-1].after = 0
     dst_contents = []
-    for block in dst_blocks:
+    lineno = 1
+    for index, block in enumerate(dst_blocks):
         dst_contents.extend(block.all_lines())
+        if unstable_lines is not None:
+            lineno += block.before
+            newlines = sum(line.count("\n") for line in block.content_lines)
+            if index in unstable_blocks:
+                unstable_lines.append((lineno, lineno + newlines - 1))
+            lineno += newlines + block.after
     if not dst_contents:
         # Use decode_bytes to retrieve the correct source newline (CRLF or LF),
         # and check if normalized_content has more than one line
@@ -333,6 +453,10 @@ def get_features_used(  # noqa: C901
     - match statements;
     - except* clause;
     - variadic generics;
+
+    The features are checked node by node by a FeatureCollector, which the
+    parser runs on the nodes as it builds them: the features found then are
+    used if they were attached to `node`.
     """
     features: Set[Feature] = set()
     if future_imports:
@@ -342,110 +466,17 @@ def get_features_used(  # noqa: C901
             if future_import in FUTURE_FLAG_TO_FEATURE
         }
 
+    if node.features is not None:
+        # Collected while parsing.
+        return features | node.features
+
+    collector = FeatureCollector()
+    hooks = collector.hooks
     for n in node.pre_order():
-        if is_string_token(n):
-            value_head = n.value[:2]
-            if value_head in {'f"', 'F"', "f'", "F'", "rf", "fr", "RF", "FR"}:
-                features.add(Feature.F_STRINGS)
-                if Feature.DEBUG_F_STRINGS not in features:
-                    for span_beg, span_end in iter_fexpr_spans(n.value):
-                        if n.value[span_beg : span_end - 1].rstrip().endswith("="):
-                            features.add(Feature.DEBUG_F_STRINGS)
-                            break
-
-        elif is_number_token(n):
-            if "_" in n.value:
-                features.add(Feature.NUMERIC_UNDERSCORES)
-
-        elif n.type == token.SLASH:
-            if n.parent and n.parent.type in {
-                syms.typedargslist,
-                syms.arglist,
-                syms.varargslist,
-            }:
-                features.add(Feature.POS_ONLY_ARGUMENTS)
-
-        elif n.type == token.COLONEQUAL:
-            features.add(Feature.ASSIGNMENT_EXPRESSIONS)
-
-        elif n.type == syms.decorator:
-            if len(n.children) > 1 and not is_simple_decorator_expression(
-                n.children[1]
-            ):
-                features.add(Feature.RELAXED_DECORATORS)
-
-        elif (
-            n.type in {syms.typedargslist, syms.arglist}
-            and n.children
-            and n.children[-1].type == token.COMMA
-        ):
-            if n.type == syms.typedargslist:
-                feature = Feature.TRAILING_COMMA_IN_DEF
-            else:
-                feature = Feature.TRAILING_COMMA_IN_CALL
-
-            for ch in n.children:
-                if ch.type in STARS:
-                    features.add(feature)
-
-                if ch.type == syms.argument:
-                    for argch in ch.children:
-                        if argch.type in STARS:
-                            features.add(feature)
-
-        elif (
-            n.type in {syms.return_stmt, syms.yield_expr}
-            and len(n.children) >= 2
-            and n.children[1].type == syms.testlist_star_expr
-            and any(child.type == syms.star_expr for child in n.children[1].children)
-        ):
-            features.add(Feature.UNPACKING_ON_FLOW)
-
-        elif (
-            n.type == syms.annassign
-            and len(n.children) >= 4
-            and n.children[3].type == syms.testlist_star_expr
-        ):
-            features.add(Feature.ANN_ASSIGN_EXTENDED_RHS)
-
-        elif (
-            n.type == syms.with_stmt
-            and len(n.children) > 2
-            and n.children[1].type == syms.atom
-        ):
-            atom_children = n.children[1].children
-            if (
-                len(atom_children) == 3
-                and atom_children[0].type == token.LPAR
-                and atom_children[1].type == syms.testlist_gexp
-                and atom_children[2].type == token.RPAR
-            ):
-                features.add(Feature.PARENTHESIZED_CONTEXT_MANAGERS)
-
-        elif n.type == syms.match_stmt:
-            features.add(Feature.PATTERN_MATCHING)
-
-        elif (
-            n.type == syms.except_clause
-            and len(n.children) >= 2
-            and n.children[1].type == token.STAR
-        ):
-            features.add(Feature.EXCEPT_STAR)
-
-        elif n.type in {syms.subscriptlist, syms.trailer} and any(
-            child.type == syms.star_expr for child in n.children
-        ):
-            features.add(Feature.VARIADIC_GENERICS)
-
-        elif (
-            n.type == syms.tname_star
-            and len(n.children) == 3
-            and n.children[2].type == syms.star_expr
-        ):
-            features.add(Feature.VARIADIC_GENERICS)
-
-        elif n.type in (syms.type_stmt, syms.typeparams):
-            features.add(Feature.TYPE_PARAMS)
+        hook = hooks.get(n.type)
+        if hook is not None:
+            hook(n)
+    features |= collector.features
 
     return features
 
@@ -1,10 +1,13 @@
-"""Caching of formatted files with feature-based invalidation."""
+"""Caching of formatted files and formatting results."""
 
+import hashlib
 import os
 import pickle
+import threading
+from collections import OrderedDict
 from pathlib import Path
 import tempfile
-from typing import Dict, Iterable, Set, Tuple
+from typing import Dict, Iterable, Optional, Set, Tuple
 
 from ..platformdirs import user_cache_dir
 
@@ -101,3 +104,179 @@ def write_cache(cache: Cache, sources: Iterable[Path], mode: Mode) -> None:
         os.replace(f.name, cache_file)
     except OSError:
         pass
+
+
+class ResultCache:
+    """Formatting results keyed by the source, the mode and the version of Black.
+
+    Results are kept in a size-bounded LRU in memory and in `CACHE_DIR/results`
+    on disk, so they survive restarts. Sources that format to themselves are
+    stored without their result, and formatted output is recorded as already
+    formatted so that formatting it again is a hit as well.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        max_memory_size: int = 32 * 1024 * 1024,
+        max_disk_size: int = 128 * 1024 * 1024,
+    ) -> None:
+        self.directory = directory or CACHE_DIR / "results"
+        self.max_memory_size = max_memory_size
+        self.max_disk_size = max_disk_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        # `None` means the source is already formatted.
+        self._memory: "OrderedDict[str, Optional[str]]" = OrderedDict()
+        self._memory_size = 0
+        self._disk_size: Optional[int] = None
+
+    @staticmethod
+    def key(src_contents: str, mode: Mode) -> str:
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(src_contents.encode("utf-8", "surrogatepass"))
+        digest.update(b"\0")
+        digest.update(mode.get_cache_key().encode())
+        digest.update(b"\0")
+        digest.update(__version__.encode())
+        return digest.hexdigest()
+
+    def get(self, src_contents: str, mode: Mode) -> Optional[str]:
+        """Return the formatted `src_contents`, or None if it isn't cached."""
+        key = self.key(src_contents, mode)
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                result = self._memory[key]
+                return src_contents if result is None else result
+
+        found, result = self._read(key)
+        with self._lock:
+            if not found:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._remember(key, result)
+        return src_contents if result is None else result
+
+    def put(self, src_contents: str, mode: Mode, dst_contents: str) -> None:
+        """Record that `src_contents` formats to `dst_contents`."""
+        entries = [(self.key(dst_contents, mode), None)]
+        if src_contents != dst_contents:
+            entries.append((self.key(src_contents, mode), dst_contents))
+
+        with self._lock:
+            for key, result in entries:
+                self._remember(key, result)
+
+        for key, result in entries:
+            self._write(key, result)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "memory_entries": len(self._memory),
+                "memory_size": self._memory_size,
+                "disk_size": self._disk_size or 0,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._memory_size = 0
+            self._disk_size = 0
+            try:
+                for entry in os.scandir(self.directory):
+                    os.remove(entry.path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _entry_size(key: str, result: Optional[str]) -> int:
+        return len(key) + (len(result) if result else 0)
+
+    def _remember(self, key: str, result: Optional[str]) -> None:
+        size = self._entry_size(key, result)
+        if size > self.max_memory_size:
+            return
+
+        if key in self._memory:
+            self._memory_size -= self._entry_size(key, self._memory.pop(key))
+
+        self._memory[key] = result
+        self._memory_size += size
+        while self._memory_size > self.max_memory_size:
+            evicted_key, evicted = self._memory.popitem(last=False)
+            self._memory_size -= self._entry_size(evicted_key, evicted)
+            self.evictions += 1
+
+    def _read(self, key: str) -> Tuple[bool, Optional[str]]:
+        path = self.directory / key
+        try:
+            with path.open("rb") as fobj:
+                result = pickle.load(fobj)
+            # Keep recently used entries from being evicted.
+            os.utime(path)
+        except (OSError, pickle.UnpicklingError, ValueError, IndexError, EOFError):
+            return False, None
+
+        if result is not None and not isinstance(result, str):
+            return False, None
+        return True, result
+
+    def _write(self, key: str, result: Optional[str]) -> None:
+        path = self.directory / key
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=str(self.directory), delete=False
+            ) as f:
+                pickle.dump(result, f, protocol=4)
+                size = f.tell()
+            os.replace(f.name, path)
+        except OSError:
+            return
+
+        with self._lock:
+            if self._disk_size is None:
+                self._disk_size = self._measure_disk()
+            else:
+                self._disk_size += size
+            if self._disk_size > self.max_disk_size:
+                self._evict_disk()
+
+    def _measure_disk(self) -> int:
+        try:
+            return sum(entry.stat().st_size for entry in os.scandir(self.directory))
+        except OSError:
+            return 0
+
+    def _evict_disk(self) -> None:
+        """Remove the least recently used entries until the cache is 3/4 full."""
+        try:
+            entries = sorted(
+                (entry.stat().st_mtime, entry.stat().st_size, entry.path)
+                for entry in os.scandir(self.directory)
+            )
+        except OSError:
+            return
+
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, entry_path in entries:
+            if size <= self.max_disk_size * 3 // 4:
+                break
+            try:
+                os.remove(entry_path)
+            except OSError:
+                continue
+            size -= entry_size
+            self.evictions += 1
+        self._disk_size = size
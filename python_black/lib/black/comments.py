@@ -1,7 +1,7 @@
 import re
 from dataclasses import dataclass
 from functools import lru_cache
-from typing import Iterator, List, Optional, Union, Final
+from typing import Iterator, List, Optional, Tuple, Union, Final
 
 from .nodes import (
     CLOSING_BRACKETS,
@@ -131,10 +131,47 @@ def make_comment(content: str) -> str:
 
 
 def normalize_fmt_off(node: Node) -> None:
-    """Convert content between `# fmt: off`/`# fmt: on` into standalone comments."""
-    try_again = True
-    while try_again:
-        try_again = convert_one_fmt_off_pair(node)
+    """Convert content between `# fmt: off`/`# fmt: on` into standalone comments.
+
+    The leaves are visited once, in order. After converting a block, the visit
+    goes on with the standalone comment that replaced it, like a new visit from
+    the top would, since nothing before it changed.
+    """
+    # The nodes on the path to the current leaf, and the index of the child
+    # visited in each.
+    parents = [node]
+    indexes = [0]
+    while parents:
+        parent = parents[-1]
+        index = indexes[-1]
+        if index >= len(parent.children):
+            parents.pop()
+            indexes.pop()
+            if indexes:
+                indexes[-1] += 1
+            continue
+
+        child = parent.children[index]
+        if isinstance(child, Node):
+            parents.append(child)
+            indexes.append(0)
+            continue
+
+        converted = convert_fmt_off_in_leaf(child)
+        if converted is None:
+            indexes[-1] += 1
+            continue
+
+        parent, index = converted
+        while parents and parents[-1] is not parent:
+            parents.pop()
+            indexes.pop()
+        if parents:
+            indexes[-1] = index
+        else:
+            # The comment is somewhere else: start again from the top.
+            parents = [node]
+            indexes = [0]
 
 
 def convert_one_fmt_off_pair(node: Node) -> bool:
@@ -143,68 +180,81 @@ def convert_one_fmt_off_pair(node: Node) -> bool:
     Returns True if a pair was converted.
     """
     for leaf in node.leaves():
-        previous_consumed = 0
-        for comment in list_comments(leaf.prefix, is_endmarker=False):
-            if comment.value not in FMT_PASS:
-                previous_consumed = comment.consumed
-                continue
-            # We only want standalone comments. If there's no previous leaf or
-            # the previous leaf is indentation, it's a standalone comment in
-            # disguise.
-            if comment.value in FMT_PASS and comment.type != STANDALONE_COMMENT:
-                prev = preceding_leaf(leaf)
-                if prev:
-                    if comment.value in FMT_OFF and prev.type not in WHITESPACE:
-                        continue
-                    if comment.value in FMT_SKIP and prev.type in WHITESPACE:
-                        continue
-
-            ignored_nodes = list(generate_ignored_nodes(leaf, comment))
-            if not ignored_nodes:
-                continue
-
-            first = ignored_nodes[0]  # Can be a container node with the `leaf`.
-            parent = first.parent
-            prefix = first.prefix
-            if comment.value in FMT_OFF:
-                first.prefix = prefix[comment.consumed :]
-            if comment.value in FMT_SKIP:
-                first.prefix = ""
-                standalone_comment_prefix = prefix
-            else:
-                standalone_comment_prefix = (
-                    prefix[:previous_consumed] + "\n" * comment.newlines
-                )
-            hidden_value = "".join(str(n) for n in ignored_nodes)
-            if comment.value in FMT_OFF:
-                hidden_value = comment.value + "\n" + hidden_value
-            if comment.value in FMT_SKIP:
-                hidden_value += "  " + comment.value
-            if hidden_value.endswith("\n"):
-                # That happens when one of the `ignored_nodes` ended with a NEWLINE
-                # leaf (possibly followed by a DEDENT).
-                hidden_value = hidden_value[:-1]
-            first_idx: Optional[int] = None
-            for ignored in ignored_nodes:
-                index = ignored.remove()
-                if first_idx is None:
-                    first_idx = index
-            assert parent is not None, "INTERNAL ERROR: fmt: on/off handling (1)"
-            assert first_idx is not None, "INTERNAL ERROR: fmt: on/off handling (2)"
-            parent.insert_child(
-                first_idx,
-                Leaf(
-                    STANDALONE_COMMENT,
-                    hidden_value,
-                    prefix=standalone_comment_prefix,
-                    fmt_pass_converted_first_leaf=first_leaf_of(first),
-                ),
-            )
+        if convert_fmt_off_in_leaf(leaf) is not None:
             return True
 
     return False
 
 
+def convert_fmt_off_in_leaf(leaf: Leaf) -> Optional[Tuple[Node, int]]:
+    """Convert the content of the first `# fmt: off` or `# fmt: skip` in the
+    prefix of `leaf` that applies into a standalone comment.
+
+    Returns the parent of the standalone comment and its index there, or None
+    if nothing was converted.
+    """
+    previous_consumed = 0
+    for comment in list_comments(leaf.prefix, is_endmarker=False):
+        if comment.value not in FMT_PASS:
+            previous_consumed = comment.consumed
+            continue
+        # We only want standalone comments. If there's no previous leaf or
+        # the previous leaf is indentation, it's a standalone comment in
+        # disguise.
+        if comment.value in FMT_PASS and comment.type != STANDALONE_COMMENT:
+            prev = preceding_leaf(leaf)
+            if prev:
+                if comment.value in FMT_OFF and prev.type not in WHITESPACE:
+                    continue
+                if comment.value in FMT_SKIP and prev.type in WHITESPACE:
+                    continue
+
+        ignored_nodes = list(generate_ignored_nodes(leaf, comment))
+        if not ignored_nodes:
+            continue
+
+        first = ignored_nodes[0]  # Can be a container node with the `leaf`.
+        parent = first.parent
+        prefix = first.prefix
+        if comment.value in FMT_OFF:
+            first.prefix = prefix[comment.consumed :]
+        if comment.value in FMT_SKIP:
+            first.prefix = ""
+            standalone_comment_prefix = prefix
+        else:
+            standalone_comment_prefix = (
+                prefix[:previous_consumed] + "\n" * comment.newlines
+            )
+        hidden_value = "".join(str(n) for n in ignored_nodes)
+        if comment.value in FMT_OFF:
+            hidden_value = comment.value + "\n" + hidden_value
+        if comment.value in FMT_SKIP:
+            hidden_value += "  " + comment.value
+        if hidden_value.endswith("\n"):
+            # That happens when one of the `ignored_nodes` ended with a NEWLINE
+            # leaf (possibly followed by a DEDENT).
+            hidden_value = hidden_value[:-1]
+        first_idx: Optional[int] = None
+        for ignored in ignored_nodes:
+            index = ignored.remove()
+            if first_idx is None:
+                first_idx = index
+        assert parent is not None, "INTERNAL ERROR: fmt: on/off handling (1)"
+        assert first_idx is not None, "INTERNAL ERROR: fmt: on/off handling (2)"
+        parent.insert_child(
+            first_idx,
+            Leaf(
+                STANDALONE_COMMENT,
+                hidden_value,
+                prefix=standalone_comment_prefix,
+                fmt_pass_converted_first_leaf=first_leaf_of(first),
+            ),
+        )
+        return parent, first_idx
+
+    return None
+
+
 def generate_ignored_nodes(leaf: Leaf, comment: ProtoComment) -> Iterator[LN]:
     """Starting from the container of `leaf`, generate all leaves until `# fmt: on`.
 
@@ -1,11 +1,28 @@
 """
 Generating lines of code.
 """
+import multiprocessing
 import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import replace
 from enum import Enum, auto
 from functools import partial, wraps
-from typing import Collection, Iterator, List, Optional, Set, Union, cast
+from multiprocessing.context import BaseContext
+from typing import (
+    Collection,
+    Dict,
+    Final,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 from .brackets import (
     COMMA_PRIORITY,
@@ -79,6 +96,7 @@ from ..blib2to3.pytree import Node, Leaf
 # types
 LeafID = int
 LN = Union[Leaf, Node]
+TransformKey = Tuple[object, ...]
 
 
 class CannotSplit(CannotTransform):
@@ -507,19 +525,21 @@ class LineGenerator(Visitor[Line]):
 
 
 def transform_line(
-    line: Line, mode: Mode, features: Collection[Feature] = ()
+    line: Line, mode: Mode, features: Collection[Feature] = (), line_str: str = ""
 ) -> Iterator[Line]:
     """Transform a `line`, potentially splitting it into many lines.
 
     They should fit in the allotted `line_length` but might not be able to.
 
     `features` are syntactical features that may be used in the output.
+    `line_str`, if given, is `line` already rendered.
     """
     if line.is_comment:
         yield line
         return
 
-    line_str = line_to_string(line)
+    if not line_str:
+        line_str = line_to_string(line)
 
     ll = mode.line_length
     sn = mode.string_normalization
@@ -623,6 +643,227 @@ def transform_line(
         yield line
 
 
+# The fewest lines for which transform_lines() starts worker processes.
+PARALLEL_LINES_THRESHOLD: Final = 2000
+
+# The lines that the worker processes of transform_lines() transform, and the
+# arguments of transform_line(), inherited when they are forked.
+_worker_lines: Sequence[Line] = ()
+_worker_mode: Optional[Mode] = None
+_worker_features: Collection[Feature] = ()
+_worker_lock = threading.Lock()
+
+
+def transform_lines(
+    lines: Sequence[Line],
+    mode: Mode,
+    features: Collection[Feature] = (),
+    workers: int = 0,
+) -> List[Tuple[List[str], bool]]:
+    """Transform each of `lines` like transform_line().
+
+    Return, for each line, the lines it was turned into as strings, and whether
+    any of them may change on a second pass.
+
+    With more than one of `workers` and at least PARALLEL_LINES_THRESHOLD lines,
+    the lines are transformed in ordered chunks by as many forked processes.
+    They inherit the lines: sending them would mean pickling the trees the
+    leaves point to, which takes about as long as the transforms. Where
+    processes can't be forked, the lines are transformed here.
+    """
+    if workers > 1 and len(lines) >= PARALLEL_LINES_THRESHOLD:
+        try:
+            context = multiprocessing.get_context("fork")
+        except ValueError:
+            pass
+        else:
+            return _transform_lines_in_workers(lines, mode, features, workers, context)
+
+    return [transform_line_strings(line, mode, features) for line in lines]
+
+
+class TransformCache:
+    """The strings that logical lines were transformed into, keyed by the lines.
+
+    Large files repeat many lines that need to be split, like calls registering
+    something or decorators, and a file formatted on each save goes through the
+    same lines every time.  Transforming a line runs the whole search for a
+    split, so the results are kept in an LRU of at most `max_entries`, which is
+    off at 0.
+    """
+
+    def __init__(self, max_entries: int = 2048) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[TransformKey, Tuple[List[str], bool]]" = (
+            OrderedDict()
+        )
+
+    @staticmethod
+    def key(
+        line: Line, line_str: str, mode: Mode, features: Collection[Feature]
+    ) -> Optional[TransformKey]:
+        """Return the key of `line`, rendered as `line_str`, or None if it isn't
+        cached.
+
+        Lines that fit, and don't have to be split, cost less to transform than
+        their key.  Lines with comments or multiline strings aren't cached: the
+        result depends on more than their leaves.
+
+        Besides the rendered line, its attributes, the features and the mode,
+        the key has the type of each leaf, and the nodes it comes from up to its
+        statement, since the splits depend on them.
+        """
+        if line.is_comment or line.comments:
+            return None
+
+        if (
+            not line.magic_trailing_comma
+            and not line.should_split_rhs
+            and is_line_short_enough(line, mode=mode, line_str=line_str)
+        ):
+            return None
+
+        # The nodes get numbers from 1 in the order they are met, 0 is outside.
+        numbers: Dict[int, int] = {}
+        structure: List[int] = []
+        for leaf in line.leaves:
+            if leaf.type == STANDALONE_COMMENT or "\n" in leaf.value:
+                return None
+
+            path: List[Node] = []
+            node = leaf.parent
+            while node is not None and id(node) not in numbers:
+                path.append(node)
+                if node.parent is None or node.parent.type in STATEMENT_PARENTS:
+                    break
+                node = node.parent
+            for node in reversed(path):
+                numbers[id(node)] = len(numbers) + 1
+                parent = numbers.get(id(node.parent), 0)
+                structure += (node.type, parent, len(node.children))
+
+            parent = numbers.get(id(leaf.parent), 0)
+            structure += (leaf.type, parent, len(leaf.prefix), len(leaf.value))
+
+        return (
+            line_str,
+            tuple(structure),
+            line.depth,
+            line.inside_brackets,
+            line.should_split_rhs,
+            line.magic_trailing_comma is not None,
+            line.forced_optional_parentheses,
+            frozenset(features),
+            mode.get_cache_key(),
+        )
+
+    def transform(
+        self, line: Line, mode: Mode, features: Collection[Feature]
+    ) -> Tuple[List[str], bool]:
+        """Return what _transform_to_strings() returns, from the cache if possible."""
+        line_str = line_to_string(line)
+        key = self.key(line, line_str, mode, features) if self.max_entries else None
+        if key is None:
+            return _transform_to_strings(line, mode, features, line_str)
+
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return list(cached[0]), cached[1]
+            self.misses += 1
+
+        strings, unstable = _transform_to_strings(line, mode, features, line_str)
+        with self._lock:
+            self._entries[key] = (list(strings), unstable)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return strings, unstable
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# The parents of statements: the nodes above them don't change how they are split.
+STATEMENT_PARENTS: Final = {syms.file_input, syms.suite}
+
+transform_cache = TransformCache()
+
+
+def transform_line_strings(
+    line: Line, mode: Mode, features: Collection[Feature] = ()
+) -> Tuple[List[str], bool]:
+    """Transform `line` like transform_line(), using `transform_cache`.
+
+    Return the lines it was turned into as strings, and whether any of them may
+    change on a second pass.
+    """
+    return transform_cache.transform(line, mode, features)
+
+
+def _transform_to_strings(
+    line: Line, mode: Mode, features: Collection[Feature], line_str: str = ""
+) -> Tuple[List[str], bool]:
+    strings = []
+    unstable = False
+    for transformed_line in transform_line(
+        line, mode=mode, features=features, line_str=line_str
+    ):
+        strings.append(str(transformed_line))
+        if transformed_line.may_change_on_second_pass:
+            unstable = True
+    return strings, unstable
+
+
+def _transform_lines_in_workers(
+    lines: Sequence[Line],
+    mode: Mode,
+    features: Collection[Feature],
+    workers: int,
+    context: BaseContext,
+) -> List[Tuple[List[str], bool]]:
+    global _worker_lines, _worker_mode, _worker_features
+
+    # A few chunks per process even out their loads.
+    size = -(-len(lines) // (workers * 4))
+    starts = range(0, len(lines), size)
+    results: List[Tuple[List[str], bool]] = []
+    with _worker_lock:
+        _worker_lines, _worker_mode, _worker_features = lines, mode, features
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                for chunk in pool.map(_transform_chunk, starts, [size] * len(starts)):
+                    results.extend(chunk)
+        finally:
+            _worker_lines, _worker_mode, _worker_features = (), None, ()
+    return results
+
+
+def _transform_chunk(start: int, size: int) -> List[Tuple[List[str], bool]]:
+    assert _worker_mode is not None
+    return [
+        transform_line_strings(line, _worker_mode, _worker_features)
+        for line in _worker_lines[start : start + size]
+    ]
+
+
 class _BracketSplitComponent(Enum):
     head = auto()
     body = auto()
@@ -1569,4 +1810,6 @@ def run_transformer(
     )
     if all(is_line_short_enough(ln, mode=mode) for ln in second_opinion):
         result = second_opinion
+        for ln in result:
+            ln.forced_optional_parentheses = True
     return result
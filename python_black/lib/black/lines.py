@@ -58,6 +58,8 @@ class Line:
     inside_brackets: bool = False
     should_split_rhs: bool = False
     magic_trailing_comma: Optional[Leaf] = None
+    # Set on the lines of a split that only fit with the optional parentheses.
+    forced_optional_parentheses: bool = False
 
     def append(
         self, leaf: Leaf, preformatted: bool = False, track_bracket: bool = False
@@ -115,6 +117,22 @@ class Line:
         """Is this line a standalone comment?"""
         return len(self.leaves) == 1 and self.leaves[0].type == STANDALONE_COMMENT
 
+    @property
+    def has_added_trailing_comma(self) -> bool:
+        """Does this line contain a trailing comma added by a split?"""
+        return any(
+            leaf.type == token.COMMA and leaf.parent is None for leaf in self.leaves
+        )
+
+    @property
+    def may_change_on_second_pass(self) -> bool:
+        """Could formatting this line's output again split it differently?
+
+        Added trailing commas become magic trailing commas, and the optional
+        parentheses made visible become real ones.
+        """
+        return self.has_added_trailing_comma or self.forced_optional_parentheses
+
     @property
     def is_decorator(self) -> bool:
         """Is this line a decorator?"""
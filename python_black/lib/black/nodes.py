@@ -3,6 +3,7 @@ blib2to3 Node/Leaf transformation-related utility functions.
 """
 
 from typing import (
+    Callable,
     Generic,
     Iterator,
     List,
@@ -17,13 +18,12 @@ from typing import (
 from ..typing_extensions import TypeGuard
 from ..mypy_extensions import mypyc_attr
 
-from .cache import CACHE_DIR
 from .strings import has_triple_quotes
 from ..blib2to3 import pygram
 from ..blib2to3.pgen2 import token
-from ..blib2to3.pytree import NL, Leaf, Node, type_repr
+from ..blib2to3.pytree import NL, Leaf, Node
 
-pygram.initialize(CACHE_DIR)
+pygram.initialize()
 syms: Final = pygram.python_symbols
 
 # types
@@ -144,6 +144,11 @@ RARROW = 55
 class Visitor(Generic[T]):
     """Basic lib2to3 visitor that yields things of type `T` on `visit()`."""
 
+    # The `visit_*()` method of each node type, or None if there isn't one.
+    # Built on the first visit, so methods set on the instance after that are
+    # not used.
+    _visitors: Optional[List[Optional[Callable[[LN], Iterator[T]]]]] = None
+
     def visit(self, node: LN) -> Iterator[T]:
         """Main method to visit `node` and its children.
 
@@ -154,25 +159,51 @@ class Visitor(Generic[T]):
 
         Then yields objects of type `T` from the selected visitor.
         """
-        if node.type < 256:
-            name = token.tok_name[node.type]
-        else:
-            name = str(type_repr(node.type))
-        # We explicitly branch on whether a visitor exists (instead of
-        # using self.visit_default as the default arg to getattr) in order
-        # to save needing to create a bound method object and so mypyc can
-        # generate a native call to visit_default.
-        visitf = getattr(self, f"visit_{name}", None)
-        if visitf:
+        visitors = self._visitors
+        if visitors is None:
+            visitors = self._visitors = self._build_visitors()
+        visitf = visitors[node.type]
+        if visitf is not None:
             yield from visitf(node)
         else:
             yield from self.visit_default(node)
 
     def visit_default(self, node: LN) -> Iterator[T]:
-        """Default `visit_*()` implementation. Recurses to children of `node`."""
-        if isinstance(node, Node):
-            for child in node.children:
-                yield from self.visit(child)
+        """Default `visit_*()` implementation. Recurses to children of `node`.
+
+        The descendants without a `visit_*()` method are walked with a stack
+        instead of recursion, so visit_default() is only called again for the
+        leaves: overriding it only changes how those are visited.
+        """
+        if not isinstance(node, Node):
+            return
+
+        visitors = self._visitors
+        if visitors is None:
+            visitors = self._visitors = self._build_visitors()
+        stack = [iter(node.children)]
+        while stack:
+            for child in stack[-1]:
+                visitf = visitors[child.type]
+                if visitf is not None:
+                    yield from visitf(child)
+                elif isinstance(child, Node):
+                    stack.append(iter(child.children))
+                    break
+                else:
+                    yield from self.visit_default(child)
+            else:
+                stack.pop()
+
+    def _build_visitors(self) -> List[Optional[Callable[[LN], Iterator[T]]]]:
+        names = [(type, name) for type, name in token.tok_name.items() if type < 256]
+        names.extend((type, name) for name, type in vars(syms).items())
+        visitors: List[Optional[Callable[[LN], Iterator[T]]]] = [None] * (
+            max(type for type, _ in names) + 1
+        )
+        for type, name in names:
+            visitors[type] = getattr(self, f"visit_{name}", None)
+        return visitors
 
 
 def whitespace(leaf: Leaf, *, complex_subscript: bool) -> str:  # noqa: C901
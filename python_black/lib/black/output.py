@@ -3,21 +3,37 @@
 The double calls are for patching purposes in tests.
 """
 
-import sublime
+import sys
 import tempfile
 
 from ..mypy_extensions import mypyc_attr
 
+try:
+    import sublime
+except ImportError:
+    # Running outside of Sublime Text, e.g. in the formatter daemon.
+    sublime = None
+
 
 def out(msg: str):
-    sublime.status_message(f"black: {msg}")
+    if sublime is None:
+        print(f"black: {msg}", file=sys.stderr)
+    else:
+        sublime.status_message(f"black: {msg}")
 
 
 def err(msg: str):
-    sublime.status_message(f"black error: {msg}")
+    if sublime is None:
+        print(f"black error: {msg}", file=sys.stderr)
+    else:
+        sublime.status_message(f"black error: {msg}")
 
 
 def show_error_panel(text: str):
+    if sublime is None:
+        print(text, file=sys.stderr)
+        return
+
     view = sublime.active_window().get_output_panel("black")
     view.set_read_only(False)
     view.run_command("black_output", {"text": text})
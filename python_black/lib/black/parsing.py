@@ -2,17 +2,27 @@
 Parse Python code and perform AST validation.
 """
 import ast
+import gc
+import multiprocessing
+import pickle
+import re
 import sys
-from typing import Iterable, Iterator, List, Set, Tuple, Final
+import threading
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import zip_longest
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Final
 
 from .mode import VERSION_TO_FEATURES, Feature, TargetVersion, supports_feature
-from .nodes import syms
+from .nodes import STARS, is_simple_decorator_expression, syms
+from .trans import iter_fexpr_spans
 from ..blib2to3 import pygram
-from ..blib2to3.pgen2 import driver
+from ..blib2to3.pgen2 import driver, token
 from ..blib2to3.pgen2.grammar import Grammar
 from ..blib2to3.pgen2.parse import ParseError
-from ..blib2to3.pgen2.tokenize import TokenError
-from ..blib2to3.pytree import Leaf, Node
+from ..blib2to3.pgen2.tokenize import TokenError, generate_source_tokens
+from ..blib2to3.pytree import NL, Leaf, Node
 
 PY2_HINT: Final = "Python 2 support was removed in version 22.0."
 
@@ -54,21 +64,94 @@ def get_grammars(target_versions: Set[TargetVersion]) -> List[Grammar]:
     return grammars
 
 
-def lib2to3_parse(src_txt: str, target_versions: Iterable[TargetVersion] = ()) -> Node:
-    """Given a string with source, return the lib2to3 Node."""
+# Sources shorter than this are parsed in one process: forking processes and
+# sending the trees back would cost more than the parse.
+PARALLEL_PARSE_THRESHOLD: Final = 500_000
+
+
+def lib2to3_parse(
+    src_txt: str, target_versions: Iterable[TargetVersion] = (), workers: int = 0
+) -> Node:
+    """Given a string with source, return the lib2to3 Node.
+
+    With more than one of `workers` and at least PARALLEL_PARSE_THRESHOLD
+    characters, the source is parsed in chunks by as many processes, see
+    _parse_in_chunks().
+    """
     if not src_txt.endswith("\n"):
         src_txt += "\n"
 
-    grammars = get_grammars(set(target_versions))
+    target_versions = set(target_versions)
+    if workers > 1 and len(src_txt) >= PARALLEL_PARSE_THRESHOLD:
+        tree = _parse_in_chunks(src_txt, target_versions, workers)
+        if tree is not None:
+            return tree
+
+    grammars = get_grammars(target_versions)
+    result, _, _ = _parse_with_grammars(src_txt, grammars)
+    return result
+
+
+def _parse_with_grammars(
+    src_txt: str, grammars: List[Grammar], preferred: Optional[Grammar] = None
+) -> Tuple[Node, int, Dict[int, Tuple[int, int]]]:
+    """Parse `src_txt` with the first of `grammars` that accepts it.
+
+    The `preferred` grammar, or else the one guessed from the source, is tried
+    first, and kept if the tree proves that the grammars before it would fail.
+
+    Return the tree, the index of the grammar used, and the range of lines
+    in which each of the grammars before it failed. The features used are
+    collected while parsing, and attached to the tree.
+
+    Once a grammar fails far enough in the source, the source is tokenized, and
+    if that fails too every grammar would: only the latest one, whose error is
+    raised, is tried then.
+    """
+    order = list(range(len(grammars)))
+    first = grammars.index(preferred) if preferred in grammars else None
+    if first is None:
+        first = guess_grammar(src_txt, grammars)
+    if first:
+        order.remove(first)
+        order.insert(0, first)
+
     errors = {}
-    for grammar in grammars:
-        drv = driver.Driver(grammar)
+    error_lines: Dict[int, Tuple[int, int]] = {}
+    result: Optional[NL] = None
+    # The collector of the parse that gave `result`.
+    result_collector: Optional[FeatureCollector] = None
+    index = -1
+    # Whether the source was tokenized, and whether that failed.
+    tokenized = tokens_fail = False
+    latest = max(range(len(grammars)), key=lambda i: grammars[i].version)
+    for attempt in order:
+        if result is not None and attempt > index:
+            break
+        if tokens_fail and attempt != latest:
+            continue
+
+        grammar = grammars[attempt]
+        collector = FeatureCollector()
+        drv = driver.Driver(grammar, hooks=collector.hooks)
+        grammar_stats.attempts += 1
         try:
             result = drv.parse_string(src_txt, True)
+            index = attempt
+            result_collector = collector
+            if attempt == first and attempt > 0:
+                failures = _required_grammar(result, grammars, attempt)
+                if failures is not None:
+                    error_lines.update(failures)
+                    break
+                # Without a proof, the grammars before it still have to be tried.
+                continue
             break
 
         except ParseError as pe:
+            grammar_stats.failed_attempts += 1
             lineno, column = pe.context[1]
+            error_lines[attempt] = (lineno, lineno)
             lines = src_txt.splitlines()
             try:
                 faulty_line = lines[lineno - 1]
@@ -77,21 +160,31 @@ def lib2to3_parse(src_txt: str, target_versions: Iterable[TargetVersion] = ()) -
             errors[grammar.version] = InvalidInput(
                 f"Cannot parse: {lineno}:{column}: {faulty_line}"
             )
+            # Tokenizing takes about a tenth of a parse, which only pays off
+            # if the other grammars would go far before failing.
+            if result is None and not tokenized and lineno * 4 > len(lines):
+                tokenized = True
+                tokens_fail = fails_to_tokenize(src_txt, grammar)
 
         except TokenError as te:
+            grammar_stats.failed_attempts += 1
             # In edge cases these are raised; and typically don't have a "faulty_line".
             lineno, column = te.args[1]
+            error_lines[attempt] = (lineno, lineno)
             errors[grammar.version] = InvalidInput(
                 f"Cannot parse: {lineno}:{column}: {te.args[0]}"
             )
+            # The tokens don't depend on the grammar, so every grammar fails.
+            tokenized = tokens_fail = True
 
-    else:
+    if result is None:
         # Choose the latest version when raising the actual parsing error.
         assert len(errors) >= 1
         exc = errors[max(errors)]
 
-        if matches_grammar(src_txt, pygram.python_grammar) or matches_grammar(
-            src_txt, pygram.python_grammar_no_print_statement
+        if may_be_python2(src_txt, grammars, tokens_fail) and (
+            matches_grammar(src_txt, pygram.python_grammar)
+            or matches_grammar(src_txt, pygram.python_grammar_no_print_statement)
         ):
             original_msg = exc.args[0]
             msg = f"{original_msg}\n{PY2_HINT}"
@@ -101,7 +194,723 @@ def lib2to3_parse(src_txt: str, target_versions: Iterable[TargetVersion] = ()) -
 
     if isinstance(result, Leaf):
         result = Node(syms.file_input, [result])
-    return result
+    assert result_collector is not None
+    result_collector.attach(result)
+    error_lines = {i: lines for i, lines in error_lines.items() if i < index}
+    return result, index, error_lines
+
+
+def _parse_in_chunks(
+    src_txt: str, target_versions: Set[TargetVersion], workers: int
+) -> Optional[Node]:
+    """Parse `src_txt` in chunks of top-level statements, in forked processes.
+
+    The chunks end at the split_points() that cut the source in `workers` parts
+    of about the same size.  Each chunk is parsed on its own, with the lines
+    numbered as in `src_txt`, and the statements of all of them are put under
+    one `file_input`: that is the tree a single parse gives, as long as every
+    chunk needs the same grammar.
+
+    The trees are built, pickled and unpickled with the garbage collector
+    paused: otherwise it walks them again and again while they grow, which takes
+    several times as long as the unpickling itself.  The processes also freeze
+    the objects they inherit, so that their collections skip them.
+
+    Return None if the source can't be split, a chunk fails to parse or needs
+    another grammar, or processes can't be forked.  The source is then parsed
+    in one go, which also raises the usual errors.
+    """
+    try:
+        context = multiprocessing.get_context("fork")
+    except ValueError:
+        return None
+
+    points = split_points(src_txt, workers)
+    if not points:
+        return None
+
+    starts = [0] + [offset for offset, _, _ in points]
+    ends = starts[1:] + [len(src_txt)]
+    chunks = [src_txt[start:end] for start, end in zip(starts, ends)]
+    first_lines = [1] + [line for _, line, _ in points]
+    next_lines: List[Optional[int]] = [line for _, _, line in points]
+    next_lines.append(None)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=context, initializer=gc.freeze
+        ) as pool:
+            pickled = list(
+                pool.map(
+                    _parse_chunk,
+                    chunks,
+                    [target_versions] * len(chunks),
+                    first_lines,
+                    next_lines,
+                )
+            )
+    except Exception:
+        return None
+
+    with gc_paused():
+        results: List[Tuple[Node, int]] = [pickle.loads(data) for data in pickled]
+
+    if len({index for _, index in results}) > 1:
+        return None
+
+    children: List[NL] = []
+    features: Set[Feature] = set()
+    used_names: Set[str] = set()
+    for chunk_tree, _ in results:
+        features |= chunk_tree.features or set()
+        used_names |= chunk_tree.used_names or set()
+        for child in chunk_tree.children:
+            child.parent = None
+            children.append(child)
+    tree = Node(syms.file_input, children)
+    tree.features = features
+    tree.used_names = used_names
+    return tree
+
+
+def _parse_chunk(
+    src_txt: str,
+    target_versions: Set[TargetVersion],
+    first_line: int,
+    next_line: Optional[int],
+) -> bytes:
+    """Parse a chunk of _parse_in_chunks() that starts at `first_line`.
+
+    Unless it is the last chunk, its ENDMARKER is dropped, and the blocks that
+    it closes at its end are closed at `next_line` instead, where the first
+    statement of the next chunk is.  Return the tree and the grammar index,
+    pickled.
+    """
+    with gc_paused():
+        tree, index, _ = _parse_with_grammars(src_txt, get_grammars(target_versions))
+    shift_lines(tree.children, first_line - 1)
+    if next_line is not None:
+        endmarker = tree.children[-1]
+        assert endmarker.type == token.ENDMARKER and not endmarker.prefix
+        endmarker.remove()
+        for leaf in reversed(list(tree.children[-1].leaves())):
+            if leaf.type != token.DEDENT:
+                break
+            leaf.lineno, leaf.column = next_line, 0
+    with gc_paused():
+        return pickle.dumps((tree, index), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+@contextmanager
+def gc_paused() -> Iterator[None]:
+    """Pause the garbage collector, if it runs, in the `with` block."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+# The keywords that continue the compound statement before them.
+CONTINUATION_KEYWORDS: Final = {"elif", "else", "except", "finally"}
+
+
+def split_points(src_txt: str, count: int) -> List[Tuple[int, int, int]]:
+    """Return up to `count - 1` places that cut `src_txt` in parts of about the
+    same size, between top-level statements.
+
+    Each is the offset of the start of a line, the number of that line, and the
+    number of the line of the statement after it.  The source is only split
+    before a statement that starts in column 0, after a complete statement and
+    with nothing but blank lines in between: a comment there could belong to
+    either statement, and a decorator or a keyword like `else` can't be parsed
+    without the statement before.  Brackets, strings and continuation lines
+    never contain one, as the tokens tell.
+
+    The source is tokenized until the last of them; nothing is returned if that
+    fails.
+    """
+    points: List[Tuple[int, int, int]] = []
+    size = len(src_txt) / count
+    depth = 0
+    # Whether the next token starts a logical line, and the end of the NEWLINE
+    # token before it, as long as only blank lines follow it.
+    new_line = True
+    line_start: Optional[int] = None
+    decorated = False
+    try:
+        for type, value, start, end, (lineno, column) in generate_source_tokens(
+            src_txt
+        ):
+            if type == token.INDENT:
+                depth += 1
+            elif type == token.DEDENT:
+                depth -= 1
+            elif type == token.NEWLINE:
+                new_line = True
+                line_start = end
+            elif type == token.COMMENT:
+                line_start = None
+            elif type != token.NL and type != token.ENDMARKER and new_line:
+                if (
+                    line_start is not None
+                    and depth == 0
+                    and column == 0
+                    and not decorated
+                    and value not in CONTINUATION_KEYWORDS
+                    and start >= size * (len(points) + 1)
+                    and not src_txt[line_start:start].strip(" \t\n")
+                ):
+                    gap = src_txt.count("\n", line_start, start)
+                    points.append((line_start, lineno - gap, lineno))
+                    if len(points) == count - 1:
+                        break
+                decorated = value == "@"
+                new_line = False
+                line_start = None
+    except (TokenError, IndentationError):
+        return []
+    return points
+
+
+class GrammarStats:
+    """Count the grammars tried to parse sources, and how many of them failed."""
+
+    def __init__(self) -> None:
+        self.attempts = 0
+        self.failed_attempts = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {"attempts": self.attempts, "failed_attempts": self.failed_attempts}
+
+
+grammar_stats = GrammarStats()
+
+
+class FeatureCollector:
+    """Find the features used in a tree while the parser builds it.
+
+    `hooks`, given to the parser, check each node of the types that can use a
+    feature. attach() then sets the features on the root of the tree, and on
+    each of its children that uses any, so that a tree made of the children of
+    several parses gets its features without looking at the nodes again.
+    """
+
+    def __init__(self) -> None:
+        self.features: Set[Feature] = set()
+        # The nodes using a feature, and the feature.
+        self.uses: List[Tuple[NL, Feature]] = []
+        self.hooks: Dict[int, Callable[[NL], None]] = {
+            token.STRING: self._string,
+            token.NUMBER: self._number,
+            token.COLONEQUAL: self._colonequal,
+            syms.decorator: self._decorator,
+            syms.typedargslist: self._arguments,
+            syms.arglist: self._arguments,
+            syms.varargslist: self._arguments,
+            syms.return_stmt: self._flow,
+            syms.yield_expr: self._flow,
+            syms.annassign: self._annassign,
+            syms.with_stmt: self._with_stmt,
+            syms.match_stmt: self._match_stmt,
+            syms.except_clause: self._except_clause,
+            syms.subscriptlist: self._subscripts,
+            syms.trailer: self._subscripts,
+            syms.tname_star: self._tname_star,
+            syms.type_stmt: self._type_params,
+            syms.typeparams: self._type_params,
+        }
+
+    def attach(self, tree: Node) -> None:
+        """Set the features on `tree`, and on the children of `tree` using any."""
+        tree.features = set(self.features)
+        for node, feature in self.uses:
+            while node.parent is not None and node.parent is not tree:
+                node = node.parent
+            if node.parent is tree:
+                if node.features is None:
+                    node.features = set()
+                node.features.add(feature)
+
+    def _use(self, node: NL, feature: Feature) -> None:
+        self.features.add(feature)
+        self.uses.append((node, feature))
+
+    def _string(self, n: NL) -> None:
+        assert isinstance(n, Leaf)
+        if n.value[:2] in {'f"', 'F"', "f'", "F'", "rf", "fr", "RF", "FR"}:
+            self._use(n, Feature.F_STRINGS)
+            for span_beg, span_end in iter_fexpr_spans(n.value):
+                if n.value[span_beg : span_end - 1].rstrip().endswith("="):
+                    self._use(n, Feature.DEBUG_F_STRINGS)
+                    break
+
+    def _number(self, n: NL) -> None:
+        assert isinstance(n, Leaf)
+        if "_" in n.value:
+            self._use(n, Feature.NUMERIC_UNDERSCORES)
+
+    def _colonequal(self, n: NL) -> None:
+        self._use(n, Feature.ASSIGNMENT_EXPRESSIONS)
+
+    def _decorator(self, n: NL) -> None:
+        if len(n.children) > 1 and not is_simple_decorator_expression(n.children[1]):
+            self._use(n, Feature.RELAXED_DECORATORS)
+
+    def _arguments(self, n: NL) -> None:
+        if any(ch.type == token.SLASH for ch in n.children):
+            self._use(n, Feature.POS_ONLY_ARGUMENTS)
+
+        if n.type == syms.varargslist or n.children[-1].type != token.COMMA:
+            return
+
+        if n.type == syms.typedargslist:
+            feature = Feature.TRAILING_COMMA_IN_DEF
+        else:
+            feature = Feature.TRAILING_COMMA_IN_CALL
+
+        for ch in n.children:
+            if ch.type in STARS:
+                self._use(n, feature)
+
+            if ch.type == syms.argument:
+                for argch in ch.children:
+                    if argch.type in STARS:
+                        self._use(n, feature)
+
+    def _flow(self, n: NL) -> None:
+        if (
+            len(n.children) >= 2
+            and n.children[1].type == syms.testlist_star_expr
+            and any(child.type == syms.star_expr for child in n.children[1].children)
+        ):
+            self._use(n, Feature.UNPACKING_ON_FLOW)
+
+    def _annassign(self, n: NL) -> None:
+        if len(n.children) >= 4 and n.children[3].type == syms.testlist_star_expr:
+            self._use(n, Feature.ANN_ASSIGN_EXTENDED_RHS)
+
+    def _with_stmt(self, n: NL) -> None:
+        if len(n.children) > 2 and n.children[1].type == syms.atom:
+            atom_children = n.children[1].children
+            if (
+                len(atom_children) == 3
+                and atom_children[0].type == token.LPAR
+                and atom_children[1].type == syms.testlist_gexp
+                and atom_children[2].type == token.RPAR
+            ):
+                self._use(n, Feature.PARENTHESIZED_CONTEXT_MANAGERS)
+
+    def _match_stmt(self, n: NL) -> None:
+        self._use(n, Feature.PATTERN_MATCHING)
+
+    def _except_clause(self, n: NL) -> None:
+        if len(n.children) >= 2 and n.children[1].type == token.STAR:
+            self._use(n, Feature.EXCEPT_STAR)
+
+    def _subscripts(self, n: NL) -> None:
+        if any(child.type == syms.star_expr for child in n.children):
+            self._use(n, Feature.VARIADIC_GENERICS)
+
+    def _tname_star(self, n: NL) -> None:
+        if len(n.children) == 3 and n.children[2].type == syms.star_expr:
+            self._use(n, Feature.VARIADIC_GENERICS)
+
+    def _type_params(self, n: NL) -> None:
+        self._use(n, Feature.TYPE_PARAMS)
+
+
+# Lines that look like a `match` statement or a `case` block.
+SOFT_KEYWORD_HINT: Final = re.compile(
+    r"^[ \t]*(?:match|case)\b[^\n=]*:[ \t]*(?:#[^\n]*)?$", re.MULTILINE
+)
+# `async` and `await` used as names.
+ASYNC_IDENTIFIER_HINT: Final = re.compile(
+    r"(?:\.[ \t]*|\bdef[ \t]+|\bimport[ \t]+)(?:async|await)\b"
+    r"|\b(?:async|await)[ \t]*(?:=(?!=)|[,)\]}.])"
+)
+
+
+def guess_grammar(src_txt: str, grammars: List[Grammar]) -> Optional[int]:
+    """Return the index of the grammar that `src_txt` seems to need, if any."""
+    # Looking for the words first is much faster than the patterns.
+    if ("match" in src_txt or "case" in src_txt) and SOFT_KEYWORD_HINT.search(src_txt):
+        for index, grammar in enumerate(grammars):
+            if grammar.soft_keywords:
+                return index
+    elif ("async" in src_txt or "await" in src_txt) and ASYNC_IDENTIFIER_HINT.search(
+        src_txt
+    ):
+        for index, grammar in enumerate(grammars):
+            if not grammar.async_keywords:
+                return index
+    return None
+
+
+def _required_grammar(
+    tree: NL, grammars: List[Grammar], index: int
+) -> Optional[Dict[int, Tuple[int, int]]]:
+    """Check that the grammars before `grammars[index]` can't parse `tree`.
+
+    For each of them, return the range of lines in which it would fail, or
+    return None if one of them might succeed.
+    """
+    grammar = grammars[index]
+    match_line = names_line = 0
+    failures = {}
+    for earlier, other in enumerate(grammars[:index]):
+        if grammar.soft_keywords and not other.soft_keywords:
+            if not match_line:
+                match_line = _first_line(
+                    tree, lambda node: node.type == syms.match_stmt
+                )
+            line = match_line
+        elif not grammar.async_keywords and other.async_keywords:
+            if not names_line:
+                names_line = _first_line(
+                    tree,
+                    lambda node: node.type == token.NAME
+                    and node.value in ("async", "await"),  # type: ignore
+                )
+            line = names_line
+        else:
+            line = 0
+        if not line:
+            return None
+        failures[earlier] = (1, line)
+    return failures
+
+
+def _first_line(tree: NL, predicate: Callable[[NL], bool]) -> int:
+    for node in tree.pre_order():
+        if predicate(node):
+            return node.get_lineno() or 0
+    return 0
+
+
+class IncrementalParser:
+    """Parse successive versions of a source, reusing the unchanged statements.
+
+    Only the top-level statements overlapping the text that changed since the
+    previous version, and the statements right around them, are tokenized and
+    parsed again, with the grammar that accepted the previous version.  The
+    other statements are taken from the previous tree.  Each call returns a
+    fresh copy, so the result may be destroyed like any other tree.
+
+    The features used by each top-level statement are kept with it, so that
+    those of a new version are known without looking at the statements taken
+    from the previous tree.
+
+    With `validate`, every incremental result is compared with a full parse,
+    which is used instead when they differ.
+
+    The error of the last source that failed to parse is raised again, without
+    parsing, for the same source.
+    """
+
+    def __init__(self, validate: bool = False) -> None:
+        self.validate = validate
+        self.full_parses = 0
+        self.incremental_parses = 0
+        self.validation_failures = 0
+        self.cached_failures = 0
+
+        self._lock = threading.Lock()
+        self._src_txt = ""
+        self._tree: Optional[Node] = None
+        self._grammars: List[Grammar] = []
+        self._grammar_index = 0
+        self._error_lines: Dict[int, Tuple[int, int]] = {}
+        # The offset and the first line of each top-level child.
+        self._offsets: List[int] = []
+        self._lines: List[int] = []
+        # The last source that failed to parse, its grammars, and the error.
+        self._failure: Optional[Tuple[str, List[Grammar], Exception]] = None
+
+    def parse(
+        self, src_txt: str, target_versions: Iterable[TargetVersion] = ()
+    ) -> Node:
+        """Given a string with source, return the lib2to3 Node."""
+        if not src_txt.endswith("\n"):
+            src_txt += "\n"
+
+        grammars = get_grammars(set(target_versions))
+        with self._lock:
+            failure = self._failure
+            if failure is not None and failure[0] == src_txt and failure[1] == grammars:
+                self.cached_failures += 1
+                raise failure[2].with_traceback(None)
+
+            tree = None
+            if self._tree is not None and self._grammars == grammars:
+                tree = self._parse_changes(src_txt)
+
+            if tree is None:
+                # The grammar that accepted the previous source most likely
+                # accepts this one too.
+                preferred = (
+                    self._grammars[self._grammar_index] if self._grammars else None
+                )
+                try:
+                    tree, grammar_index, error_lines = _parse_with_grammars(
+                        src_txt, grammars, preferred
+                    )
+                except (InvalidInput, IndentationError) as exc:
+                    self._failure = (src_txt, grammars, exc)
+                    raise
+                self._reset(src_txt, tree, grammars, grammar_index, error_lines)
+                self.full_parses += 1
+            else:
+                self.incremental_parses += 1
+                if self.validate:
+                    self._validate(src_txt, tree)
+
+            assert self._tree is not None
+            tree = self._tree.clone()
+            tree.features = set(self._tree.features or ())
+            return tree
+
+    def _reset(
+        self,
+        src_txt: str,
+        tree: Node,
+        grammars: List[Grammar],
+        grammar_index: int,
+        error_lines: Dict[int, Tuple[int, int]],
+    ) -> None:
+        self._src_txt = src_txt
+        self._tree = tree
+        self._grammars = grammars
+        self._grammar_index = grammar_index
+        self._error_lines = error_lines
+        self._failure = None
+        self._offsets = []
+        self._lines = []
+        offset = 0
+        lineno = 1
+        for child in tree.children:
+            self._offsets.append(offset)
+            self._lines.append(lineno)
+            text = str(child)
+            offset += len(text)
+            lineno += text.count("\n")
+
+    def _validate(self, src_txt: str, tree: Node) -> None:
+        expected, grammar_index, error_lines = _parse_with_grammars(
+            src_txt, self._grammars
+        )
+        if (
+            grammar_index == self._grammar_index
+            and same_tree(tree, expected)
+            and tree.features == expected.features
+        ):
+            return
+
+        self.validation_failures += 1
+        self._reset(src_txt, expected, self._grammars, grammar_index, error_lines)
+
+    def _parse_changes(self, src_txt: str) -> Optional[Node]:
+        """Update the previous tree to `src_txt`, or return None to parse it all."""
+        old_txt = self._src_txt
+        tree = self._tree
+        assert tree is not None
+        if src_txt == old_txt:
+            return tree
+
+        # The changed text is old_txt[start:old_end], now src_txt[start:new_end].
+        limit = min(len(old_txt), len(src_txt))
+        start = common_prefix_length(old_txt, src_txt, limit)
+        end = common_suffix_length(old_txt, src_txt, limit - start)
+        old_end = len(old_txt) - end
+        delta = len(src_txt) - len(old_txt)
+
+        children = tree.children
+        offsets = self._offsets
+        last_index = len(children) - 1
+
+        # The statement before the changes may be continued by them, and
+        # comments added at the start of a statement may belong to the block
+        # ending the statement before.
+        first = max(bisect_right(offsets, max(start - 1, 0)) - 1, 0)
+        if first > 0 and start <= offsets[first] + len(children[first].prefix):
+            first -= 1
+        # Comments at the start of the statement after the changes may now
+        # belong to a block ending them.
+        last = bisect_right(offsets, old_end) - 1
+        if old_end != offsets[last]:
+            last += 1
+        last = min(last, last_index)
+
+        if first == 0 and last == last_index:
+            return None
+
+        first_line = self._lines[first]
+        if last < last_index:
+            chunk_end = offsets[last + 1]
+            last_line = self._lines[last + 1] - 1
+        else:
+            chunk_end = len(old_txt)
+            last_line = old_txt.count("\n") + 1
+        # A grammar that failed before the chunk would still fail on the same
+        # line, and one that failed after it would fail there again.
+        if any(
+            start <= last_line and first_line <= end
+            for start, end in self._error_lines.values()
+        ):
+            return None
+
+        old_chunk = old_txt[offsets[first] : chunk_end]
+        new_chunk = src_txt[offsets[first] : chunk_end + delta]
+        collector = FeatureCollector()
+        drv = driver.Driver(self._grammars[self._grammar_index], hooks=collector.hooks)
+        try:
+            chunk_tree = drv.parse_string(new_chunk, True)
+        except (ParseError, TokenError, IndentationError):
+            return None
+
+        if isinstance(chunk_tree, Leaf) or chunk_tree.type != syms.file_input:
+            return None
+
+        collector.attach(chunk_tree)
+
+        new_children = chunk_tree.children
+        if last < last_index:
+            endmarker = new_children[-1]
+            if endmarker.prefix:
+                return None
+            new_children = new_children[:-1]
+
+        for child in new_children:
+            child.parent = None
+        shift_lines(new_children, first_line - 1)
+        line_delta = new_chunk.count("\n") - old_chunk.count("\n")
+        shift_lines(children[last + 1 :], line_delta)
+
+        for child in children[first : last + 1]:
+            child.parent = None
+        for child in new_children:
+            child.parent = tree
+        children[first : last + 1] = new_children
+        tree.invalidate_sibling_maps()
+        features: Set[Feature] = set()
+        for child in children:
+            if child.features:
+                features |= child.features
+        tree.features = features
+        if last < last_index and new_children:
+            # The blocks closing at the end of the chunk were closed at its
+            # end of file, instead of at the first token of the next statement.
+            following = next(children[first + len(new_children)].leaves())
+            for leaf in reversed(list(new_children[-1].leaves())):
+                if leaf.type != token.DEDENT:
+                    break
+                leaf.lineno, leaf.column = following.lineno, following.column
+
+        new_offsets = []
+        new_lines = []
+        offset = offsets[first]
+        lineno = first_line
+        for child in new_children:
+            new_offsets.append(offset)
+            new_lines.append(lineno)
+            text = str(child)
+            offset += len(text)
+            lineno += text.count("\n")
+        offsets[first : last + 1] = new_offsets
+        self._lines[first : last + 1] = new_lines
+        for index in range(first + len(new_children), len(children)):
+            offsets[index] += delta
+            self._lines[index] += line_delta
+
+        self._error_lines = {
+            index: (start + line_delta, end + line_delta)
+            if start > last_line
+            else (start, end)
+            for index, (start, end) in self._error_lines.items()
+        }
+        self._src_txt = src_txt
+        return tree
+
+
+def common_prefix_length(a: str, b: str, limit: int) -> int:
+    """Return the length of the common prefix of `a` and `b`, at most `limit`."""
+    low, high = 0, limit
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[:middle] == b[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def common_suffix_length(a: str, b: str, limit: int) -> int:
+    """Return the length of the common suffix of `a` and `b`, at most `limit`."""
+    low, high = 0, limit
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[len(a) - middle :] == b[len(b) - middle :]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def shift_lines(nodes: Iterable[NL], delta: int) -> None:
+    if not delta:
+        return
+
+    for node in nodes:
+        for leaf in node.leaves():
+            leaf.lineno += delta
+
+
+def same_tree(a: NL, b: NL) -> bool:
+    """Return True if both trees have the same nodes, values, prefixes and positions."""
+    for x, y in zip_longest(a.pre_order(), b.pre_order()):
+        if x is None or y is None or x.type != y.type:
+            return False
+        if isinstance(x, Leaf):
+            if not isinstance(y, Leaf) or (
+                x.value,
+                x.prefix,
+                x.lineno,
+                x.column,
+            ) != (y.value, y.prefix, y.lineno, y.column):
+                return False
+        elif isinstance(y, Leaf):
+            return False
+    return True
+
+
+def fails_to_tokenize(src_txt: str, grammar: Grammar) -> bool:
+    """Return whether tokenizing `src_txt` ends in a TokenError.
+
+    The tokenizer only raises it at the end of the source, whatever the
+    grammar, so then no grammar can parse the source.
+    """
+    try:
+        for _ in generate_source_tokens(src_txt, grammar):
+            pass
+    except TokenError:
+        return True
+    except IndentationError:
+        pass
+    return False
+
+
+def may_be_python2(src_txt: str, grammars: List[Grammar], tokens_fail: bool) -> bool:
+    """Return whether the Python 2 grammars might parse what `grammars` failed to.
+
+    They don't if the tokenizer failed. They only differ from the Python 3.0-3.6
+    grammar by the `print` and `exec` keywords.
+    """
+    if tokens_fail:
+        return False
+    if pygram.python_grammar_no_print_statement_no_exec_statement not in grammars:
+        return True
+    return "print" in src_txt or "exec" in src_txt
 
 
 def matches_grammar(src_txt: str, grammar: Grammar) -> bool:
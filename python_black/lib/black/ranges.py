@@ -0,0 +1,317 @@
+"""Formatting of the statements overlapping given line ranges.
+
+Instead of the whole file, only the statements that overlap the ranges go
+through `LineGenerator` and `transform_line`.  Their neighbouring statements
+are still fed to the `EmptyLineTracker`, so that the empty lines around the
+formatted statements are the same as if the whole file had been formatted.
+The rest of the source is left untouched.
+
+When all the ranges fall inside the indented block of a compound statement,
+the statements of that block are selected instead of the whole compound
+statement, recursively.
+"""
+
+import difflib
+import re
+from dataclasses import dataclass
+from itertools import chain
+from typing import Collection, Dict, Iterator, List, Optional, Tuple
+
+from ..blib2to3.pgen2 import token
+from ..blib2to3.pytree import Node
+from .linegen import LineGenerator, transform_line_strings
+from .lines import EmptyLineTracker, LinesBlock
+from .mode import Feature, Mode
+from .nodes import LN, syms
+
+# 1-based, inclusive.
+LineRange = Tuple[int, int]
+# A replacement of `source[start:end]`.
+Edit = Tuple[int, int, str]
+
+BLANK_LINES = re.compile(r"(?:[ \t\f]*\n)*")
+COMPOUND_WRAPPERS = {syms.decorated, syms.async_stmt, syms.async_funcdef}
+
+# Blocks with fewer statements are always formatted with their parent.
+MIN_BLOCK_STATEMENTS = 4
+
+
+@dataclass
+class Statement:
+    node: LN
+    start: int
+    end: int
+    first_line: int
+    last_line: int
+
+    def overlaps(self, first: int, last: int) -> bool:
+        return self.first_line <= last and first <= self.last_line
+
+
+def get_statements(nodes: List[LN], offset: int, lineno: int) -> List[Statement]:
+    """Return the statements in `nodes`, the first of them at `offset` and `lineno`."""
+    statements = []
+    for node in nodes:
+        text = str(node)
+        newlines = text.count("\n")
+        last_line = lineno + newlines - (1 if text.endswith("\n") else 0)
+        statements.append(
+            Statement(node, offset, offset + len(text), lineno, max(lineno, last_line))
+        )
+        offset += len(text)
+        lineno += newlines
+    return statements
+
+
+def get_blocks(statement: Statement) -> Iterator[List[Statement]]:
+    """Yield the statements of each indented block of a compound statement."""
+    node = statement.node
+    while node.type in COMPOUND_WRAPPERS:
+        node = node.children[-1]
+
+    text = str(statement.node)
+    skipped = len(text) - len(str(node))
+    offset = statement.start + skipped
+    lineno = statement.first_line + text.count("\n", 0, skipped)
+    yield from _get_blocks(node, offset, lineno)
+
+
+def _get_blocks(node: LN, offset: int, lineno: int) -> Iterator[List[Statement]]:
+    for child in node.children:
+        text = str(child)
+        if (
+            child.type == syms.suite
+            and len(child.children) > 3
+            and child.children[1].type == token.INDENT
+        ):
+            header = str(child.children[0]) + str(child.children[1])
+            yield get_statements(
+                child.children[2:-1], offset + len(header), lineno + header.count("\n")
+            )
+        elif child.type == syms.case_block:
+            yield from _get_blocks(child, offset, lineno)
+        offset += len(text)
+        lineno += text.count("\n")
+
+
+def content_end(text: str) -> int:
+    """Return the offset right after the last line of `text` that isn't blank."""
+    newline = text.find("\n", len(text.rstrip(" \t\f\n")))
+    return len(text) if newline == -1 else newline + 1
+
+
+@dataclass
+class StatementFormatter:
+    src_contents: str
+    mode: Mode
+    features: Collection[Feature]
+    split_line_features: Collection[Feature]
+
+    def format_statements(
+        self, statements: List[Statement], lines: Collection[LineRange], depth: int
+    ) -> Optional[List[Edit]]:
+        """Return the edits formatting the `statements` that overlap `lines`.
+
+        Return None if the statements can't be formatted on their own: when
+        all of them are selected at the top level, or when one of the first two
+        or the last statement of a block is selected.
+        """
+        selected = [
+            index
+            for index, statement in enumerate(statements)
+            if any(statement.overlaps(first, last) for first, last in lines)
+        ]
+        if not selected:
+            return []
+
+        runs: List[List[int]] = []
+        for index in selected:
+            if runs and runs[-1][1] == index - 1:
+                runs[-1][1] = index
+            else:
+                runs.append([index, index])
+
+        last = len(statements) - 1
+        if depth == 0:
+            # Trailing comments and empty lines live in the prefix of the
+            # `ENDMARKER`, which is formatted along with the last statement.
+            if runs[-1][1] == last - 1:
+                runs[-1][1] = last
+            if runs[0] == [0, last]:
+                return None
+        elif runs[0][0] < 2 or runs[-1][1] == last:
+            # The empty lines after the first statement of a block depend on
+            # the line opening the block (e.g. class docstrings), and the ones
+            # after the last statement on the statements after the block.
+            return None
+
+        edits: List[Edit] = []
+        remaining: List[List[int]] = []
+        for i, (start, end) in enumerate(runs):
+            isolated = (i == 0 or runs[i - 1][1] < start - 2) and (
+                i == len(runs) - 1 or runs[i + 1][0] > end + 2
+            )
+            if start == end and isolated:
+                nested = self.format_nested(statements[start], lines, depth)
+                if nested is not None:
+                    edits.extend(nested)
+                    continue
+            remaining.append([start, end])
+
+        edits.extend(self.format_runs(statements, remaining, depth))
+        edits.sort()
+        return edits
+
+    def format_nested(
+        self, statement: Statement, lines: Collection[LineRange], depth: int
+    ) -> Optional[List[Edit]]:
+        """Format only the statements of the block of `statement` covering `lines`."""
+        clipped = [
+            (max(first, statement.first_line), min(last, statement.last_line))
+            for first, last in lines
+            if statement.overlaps(first, last)
+        ]
+        for block in get_blocks(statement):
+            if len(block) < MIN_BLOCK_STATEMENTS:
+                continue
+
+            if all(
+                block[0].first_line <= first and last <= block[-1].last_line
+                for first, last in clipped
+            ):
+                return self.format_statements(block, clipped, depth + 1)
+
+        return None
+
+    def format_runs(
+        self, statements: List[Statement], runs: List[List[int]], depth: int
+    ) -> List[Edit]:
+        # Every run is formatted after the statement before it went through the
+        # `EmptyLineTracker`, and the statement after it is needed to know how
+        # many empty lines separate them.
+        formatted: Dict[int, bool] = {}
+        for start, end in runs:
+            if start > 0:
+                formatted.setdefault(start - 1, False)
+            for index in range(start, end + 1):
+                formatted[index] = True
+            if end < len(statements) - 1:
+                formatted.setdefault(end + 1, False)
+
+        blocks: Dict[int, List[LinesBlock]] = {}
+        previous = -2
+        for index in sorted(formatted):
+            if index != previous + 1:
+                line_generator = LineGenerator(mode=self.mode, features=self.features)
+                line_generator.current_line.depth = depth
+                elt = EmptyLineTracker(mode=self.mode)
+            previous = index
+
+            blocks[index] = []
+            for current_line in chain(
+                line_generator.visit(statements[index].node), line_generator.line()
+            ):
+                block = elt.maybe_empty_lines(current_line)
+                blocks[index].append(block)
+                if not formatted[index]:
+                    continue
+
+                content_lines, _ = transform_line_strings(
+                    current_line, self.mode, self.split_line_features
+                )
+                block.content_lines.extend(content_lines)
+
+        return [self._splice(statements, blocks, start, end) for start, end in runs]
+
+    def _splice(
+        self,
+        statements: List[Statement],
+        blocks: Dict[int, List[LinesBlock]],
+        start: int,
+        end: int,
+    ) -> Edit:
+        """Return the edit replacing the statements from `start` to `end`."""
+        run_blocks = [
+            block for index in range(start, end + 1) for block in blocks[index]
+        ]
+
+        if start > 0:
+            previous = statements[start - 1]
+            previous_text = self.src_contents[previous.start : previous.end]
+            edit_start = previous.start + content_end(previous_text)
+            previous_blocks = blocks[start - 1]
+            empty_before = previous_blocks[-1].after if previous_blocks else 0
+        else:
+            edit_start = 0
+            empty_before = 0
+
+        if end < len(statements) - 1:
+            following = statements[end + 1]
+            following_text = self.src_contents[following.start : following.end]
+            edit_end = following.start + BLANK_LINES.match(following_text).end()
+            following_blocks = blocks[end + 1]
+            empty_after = max(following_blocks[0].before, 0) if following_blocks else 0
+        else:
+            edit_end = len(self.src_contents)
+            empty_after = 0
+            if run_blocks:
+                run_blocks[-1].after = 0
+            else:
+                empty_before = 0
+
+        dst_contents = ["\n" * empty_before]
+        for block in run_blocks:
+            dst_contents.extend(block.all_lines())
+        dst_contents.append("\n" * empty_after)
+        return edit_start, edit_end, "".join(dst_contents)
+
+
+def format_statements(
+    src_contents: str,
+    src_node: Node,
+    lines: Collection[LineRange],
+    *,
+    mode: Mode,
+    features: Collection[Feature],
+    split_line_features: Collection[Feature],
+) -> Optional[str]:
+    """Format the statements of `src_node` that overlap `lines`.
+
+    Return None if the whole file has to be formatted instead.  `src_node`
+    must be parsed from `src_contents.lstrip()`, and is destroyed in the
+    process like it is by `LineGenerator`.
+    """
+    if "\r" in src_contents or "fmt:" in src_contents or "yapf:" in src_contents:
+        # Line endings aren't normalized here, and `# fmt: off` regions span
+        # several statements.
+        return None
+
+    offset = len(src_contents) - len(src_contents.lstrip())
+    lineno = 1 + src_contents.count("\n", 0, offset)
+    statements = get_statements(src_node.children, offset, lineno)
+
+    formatter = StatementFormatter(src_contents, mode, features, split_line_features)
+    edits = formatter.format_statements(statements, lines, depth=0)
+    if edits is None:
+        return None
+
+    dst_contents = []
+    position = 0
+    for start, end, text in edits:
+        dst_contents.append(src_contents[position:start])
+        dst_contents.append(text)
+        position = end
+    dst_contents.append(src_contents[position:])
+    return "".join(dst_contents)
+
+
+def changed_lines(src_contents: str, dst_contents: str) -> List[LineRange]:
+    """Return the ranges of lines of `dst_contents` that differ from `src_contents`."""
+    src_lines = src_contents.splitlines()
+    dst_lines = dst_contents.splitlines()
+    matcher = difflib.SequenceMatcher(None, src_lines, dst_lines, autojunk=False)
+    return [
+        (j1 + 1, max(j1 + 1, j2))
+        for tag, _, _, j1, j2 in matcher.get_opcodes()
+        if tag != "equal"
+    ]
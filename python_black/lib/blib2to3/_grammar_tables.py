@@ -0,0 +1,547 @@
+# Generated by `python -m python_black.lib.blib2to3.pygram`, do not edit.
+
+GRAMMAR_HASH = "1d9163c41d79a8b8dfe8787579b680b42d79f9795317aa7974b120ed344ed080"
+GRAMMAR_TABLES = (
+    b"\x80\x04\x95GD\x00\x00\x00\x00\x00\x00}\x94(\x8c\rsymbol2number\x94}\x94(\x8c\nfi"
+    b"le_input\x94M\x00\x01\x8c\x08and_expr\x94M\x01\x01\x8c\x08and_test\x94M\x02\x01"
+    b"\x8c\tannassign\x94M\x03\x01\x8c\x07arglist\x94M\x04\x01\x8c\x08argument\x94M\x05"
+    b"\x01\x8c\narith_expr\x94M\x06\x01\x8c\x0basexpr_test\x94M\x07\x01\x8c\x0bassert_s"
+    b"tmt\x94M\x08\x01\x8c\rasync_funcdef\x94M\t\x01\x8c\nasync_stmt\x94M\n\x01\x8c\x04"
+    b"atom\x94M\x0b\x01\x8c\taugassign\x94M\x0c\x01\x8c\nbreak_stmt\x94M\r\x01\x8c\ncas"
+    b"e_block\x94M\x0e\x01\x8c\x08classdef\x94M\x0f\x01\x8c\x08comp_for\x94M\x10\x01"
+    b"\x8c\x07comp_if\x94M\x11\x01\x8c\tcomp_iter\x94M\x12\x01\x8c\x07comp_op\x94M\x13"
+    b"\x01\x8c\ncomparison\x94M\x14\x01\x8c\rcompound_stmt\x94M\x15\x01\x8c\rcontinue_s"
+    b"tmt\x94M\x16\x01\x8c\tdecorated\x94M\x17\x01\x8c\tdecorator\x94M\x18\x01\x8c\ndec"
+    b"orators\x94M\x19\x01\x8c\x08del_stmt\x94M\x1a\x01\x8c\x0cdictsetmaker\x94M\x1b"
+    b"\x01\x8c\x0edotted_as_name\x94M\x1c\x01\x8c\x0fdotted_as_names\x94M\x1d\x01\x8c"
+    b"\x0bdotted_name\x94M\x1e\x01\x8c\rencoding_decl\x94M\x1f\x01\x8c\neval_input\x94M"
+    b' \x01\x8c\rexcept_clause\x94M!\x01\x8c\texec_stmt\x94M"\x01\x8c\x04expr\x94M#\x01'
+    b"\x8c\texpr_stmt\x94M$\x01\x8c\x08exprlist\x94M%\x01\x8c\x06factor\x94M&\x01\x8c\t"
+    b"flow_stmt\x94M'\x01\x8c\x08for_stmt\x94M(\x01\x8c\x07funcdef\x94M)\x01\x8c\x0bglo"
+    b"bal_stmt\x94M*\x01\x8c\x05guard\x94M+\x01\x8c\x07if_stmt\x94M,\x01\x8c\x0eimport_"
+    b"as_name\x94M-\x01\x8c\x0fimport_as_names\x94M.\x01\x8c\x0bimport_from\x94M/\x01"
+    b"\x8c\x0bimport_name\x94M0\x01\x8c\x0bimport_stmt\x94M1\x01\x8c\x07lambdef\x94M2"
+    b"\x01\x8c\tlistmaker\x94M3\x01\x8c\nmatch_stmt\x94M4\x01\x8c\x0enamedexpr_test\x94"
+    b"M5\x01\x8c\x08not_test\x94M6\x01\x8c\x0cold_comp_for\x94M7\x01\x8c\x0bold_comp_if"
+    b"\x94M8\x01\x8c\rold_comp_iter\x94M9\x01\x8c\x0bold_lambdef\x94M:\x01\x8c\x08old_t"
+    b"est\x94M;\x01\x8c\x07or_test\x94M<\x01\x8c\nparameters\x94M=\x01\x8c\tparamspec"
+    b"\x94M>\x01\x8c\tpass_stmt\x94M?\x01\x8c\x07pattern\x94M@\x01\x8c\x08patterns\x94M"
+    b"A\x01\x8c\x05power\x94MB\x01\x8c\nprint_stmt\x94MC\x01\x8c\nraise_stmt\x94MD\x01"
+    b"\x8c\x0breturn_stmt\x94ME\x01\x8c\nshift_expr\x94MF\x01\x8c\x0bsimple_stmt\x94MG"
+    b"\x01\x8c\x0csingle_input\x94MH\x01\x8c\x07sliceop\x94MI\x01\x8c\nsmall_stmt\x94MJ"
+    b"\x01\x8c\tstar_expr\x94MK\x01\x8c\x04stmt\x94ML\x01\x8c\x0csubject_expr\x94MM\x01"
+    b"\x8c\tsubscript\x94MN\x01\x8c\rsubscriptlist\x94MO\x01\x8c\x05suite\x94MP\x01\x8c"
+    b"\x04term\x94MQ\x01\x8c\x04test\x94MR\x01\x8c\x08testlist\x94MS\x01\x8c\ttestlist1"
+    b"\x94MT\x01\x8c\rtestlist_gexp\x94MU\x01\x8c\rtestlist_safe\x94MV\x01\x8c\x12testl"
+    b"ist_star_expr\x94MW\x01\x8c\x06tfpdef\x94MX\x01\x8c\x07tfplist\x94MY\x01\x8c\x05t"
+    b"name\x94MZ\x01\x8c\ntname_star\x94M[\x01\x8c\x07trailer\x94M\\\x01\x8c\x08try_stm"
+    b"t\x94M]\x01\x8c\ttype_stmt\x94M^\x01\x8c\rtypedargslist\x94M_\x01\x8c\ttypeparam"
+    b"\x94M`\x01\x8c\ntypeparams\x94Ma\x01\x8c\x07typevar\x94Mb\x01\x8c\x0ctypevartuple"
+    b"\x94Mc\x01\x8c\x0bvarargslist\x94Md\x01\x8c\x06vfpdef\x94Me\x01\x8c\x07vfplist"
+    b"\x94Mf\x01\x8c\x05vname\x94Mg\x01\x8c\nwhile_stmt\x94Mh\x01\x8c\twith_stmt\x94Mi"
+    b"\x01\x8c\x08xor_expr\x94Mj\x01\x8c\tyield_arg\x94Mk\x01\x8c\nyield_expr\x94Ml\x01"
+    b"\x8c\nyield_stmt\x94Mm\x01u\x8c\rnumber2symbol\x94}\x94(M\x00\x01h\x03M\x01\x01h"
+    b"\x04M\x02\x01h\x05M\x03\x01h\x06M\x04\x01h\x07M\x05\x01h\x08M\x06\x01h\tM\x07\x01"
+    b"h\nM\x08\x01h\x0bM\t\x01h\x0cM\n\x01h\rM\x0b\x01h\x0eM\x0c\x01h\x0fM\r\x01h\x10M"
+    b"\x0e\x01h\x11M\x0f\x01h\x12M\x10\x01h\x13M\x11\x01h\x14M\x12\x01h\x15M\x13\x01h"
+    b"\x16M\x14\x01h\x17M\x15\x01h\x18M\x16\x01h\x19M\x17\x01h\x1aM\x18\x01h\x1bM\x19"
+    b"\x01h\x1cM\x1a\x01h\x1dM\x1b\x01h\x1eM\x1c\x01h\x1fM\x1d\x01h M\x1e\x01h!M\x1f"
+    b"\x01h\"M \x01h#M!\x01h$M\"\x01h%M#\x01h&M$\x01h'M%\x01h(M&\x01h)M'\x01h*M(\x01h+M"
+    b")\x01h,M*\x01h-M+\x01h.M,\x01h/M-\x01h0M.\x01h1M/\x01h2M0\x01h3M1\x01h4M2\x01h5M3"
+    b"\x01h6M4\x01h7M5\x01h8M6\x01h9M7\x01h:M8\x01h;M9\x01h<M:\x01h=M;\x01h>M<\x01h?M="
+    b"\x01h@M>\x01hAM?\x01hBM@\x01hCMA\x01hDMB\x01hEMC\x01hFMD\x01hGME\x01hHMF\x01hIMG"
+    b"\x01hJMH\x01hKMI\x01hLMJ\x01hMMK\x01hNML\x01hOMM\x01hPMN\x01hQMO\x01hRMP\x01hSMQ"
+    b"\x01hTMR\x01hUMS\x01hVMT\x01hWMU\x01hXMV\x01hYMW\x01hZMX\x01h[MY\x01h\\MZ\x01h]M["
+    b"\x01h^M\\\x01h_M]\x01h`M^\x01haM_\x01hbM`\x01hcMa\x01hdMb\x01heMc\x01hfMd\x01hgMe"
+    b"\x01hhMf\x01hiMg\x01hjMh\x01hkMi\x01hlMj\x01hmMk\x01hnMl\x01hoMm\x01hpu\x8c\x06st"
+    b"ates\x94]\x94(]\x94(]\x94(K\x01K\x01\x86\x94K\x02K\x00\x86\x94K\x03K\x00\x86\x94e"
+    b"]\x94K\x00K\x01\x86\x94ae]\x94(]\x94K,K\x01\x86\x94a]\x94(K-K\x00\x86\x94K\x00K"
+    b"\x01\x86\x94ee]\x94(]\x94K.K\x01\x86\x94a]\x94(K/K\x00\x86\x94K\x00K\x01\x86\x94e"
+    b"e]\x94(]\x94K0K\x01\x86\x94a]\x94K1K\x02\x86\x94a]\x94(K2K\x03\x86\x94K\x00K\x02"
+    b"\x86\x94e]\x94(K3K\x04\x86\x94K4K\x04\x86\x94e]\x94K\x00K\x04\x86\x94ae]\x94(]"
+    b"\x94K5K\x01\x86\x94a]\x94(K6K\x02\x86\x94K\x00K\x01\x86\x94e]\x94(K5K\x01\x86\x94"
+    b"K\x00K\x02\x86\x94ee]\x94(]\x94(K\x07K\x01\x86\x94K7K\x01\x86\x94K1K\x02\x86\x94e"
+    b"]\x94K1K\x03\x86\x94a]\x94(K8K\x04\x86\x94K2K\x05\x86\x94K9K\x01\x86\x94K:K\x03"
+    b"\x86\x94K\x00K\x02\x86\x94e]\x94K\x00K\x03\x86\x94a]\x94K1K\x06\x86\x94a]\x94K;K"
+    b"\x03\x86\x94a]\x94(K:K\x03\x86\x94K\x00K\x06\x86\x94ee]\x94(]\x94K<K\x01\x86\x94a"
+    b"]\x94(K\x08K\x00\x86\x94K\tK\x00\x86\x94K\x00K\x01\x86\x94ee]\x94(]\x94K1K\x01"
+    b"\x86\x94a]\x94(K9K\x02\x86\x94K\x00K\x01\x86\x94e]\x94K1K\x03\x86\x94a]\x94K\x00K"
+    b"\x03\x86\x94ae]\x94(]\x94K\x0eK\x01\x86\x94a]\x94K1K\x02\x86\x94a]\x94(K6K\x03"
+    b"\x86\x94K\x00K\x02\x86\x94e]\x94K1K\x04\x86\x94a]\x94K\x00K\x04\x86\x94ae]\x94(]"
+    b"\x94K'K\x01\x86\x94a]\x94K=K\x02\x86\x94a]\x94K\x00K\x02\x86\x94ae]\x94(]\x94K'K"
+    b"\x01\x86\x94a]\x94(K>K\x02\x86\x94K=K\x02\x86\x94K?K\x02\x86\x94e]\x94K\x00K\x02"
+    b"\x86\x94ae]\x94(]\x94(K\x06K\x01\x86\x94K\nK\x02\x86\x94K\x0cK\x03\x86\x94K\rK"
+    b"\x04\x86\x94K%K\x05\x86\x94K)K\x06\x86\x94K*K\x06\x86\x94K+K\x07\x86\x94e]\x94(K@"
+    b"K\x06\x86\x94KAK\x08\x86\x94K4K\x08\x86\x94e]\x94K\nK\t\x86\x94a]\x94(KBK\x06\x86"
+    b"\x94KCK\n\x86\x94e]\x94KDK\x0b\x86\x94a]\x94(KEK\x06\x86\x94KFK\x0c\x86\x94e]\x94"
+    b"K\x00K\x06\x86\x94a]\x94(K+K\x07\x86\x94K\x00K\x07\x86\x94e]\x94K@K\x06\x86\x94a]"
+    b"\x94K\nK\x06\x86\x94a]\x94KBK\x06\x86\x94a]\x94K\rK\x06\x86\x94a]\x94KEK\x06\x86"
+    b"\x94ae]\x94(]\x94(KGK\x01\x86\x94KHK\x01\x86\x94KIK\x01\x86\x94KJK\x01\x86\x94KKK"
+    b"\x01\x86\x94KLK\x01\x86\x94KMK\x01\x86\x94KNK\x01\x86\x94KOK\x01\x86\x94KPK\x01"
+    b"\x86\x94KQK\x01\x86\x94KRK\x01\x86\x94KSK\x01\x86\x94e]\x94K\x00K\x01\x86\x94ae]"
+    b"\x94(]\x94K\x0fK\x01\x86\x94a]\x94K\x00K\x01\x86\x94ae]\x94(]\x94KTK\x01\x86\x94a"
+    b"]\x94KUK\x02\x86\x94a]\x94(K0K\x03\x86\x94KVK\x04\x86\x94e]\x94KWK\x05\x86\x94a]"
+    b"\x94K0K\x03\x86\x94a]\x94K\x00K\x05\x86\x94ae]\x94(]\x94K\x10K\x01\x86\x94a]\x94K"
+    b")K\x02\x86\x94a]\x94(K\x06K\x03\x86\x94K0K\x04\x86\x94KXK\x05\x86\x94e]\x94(K@K"
+    b"\x06\x86\x94KYK\x07\x86\x94e]\x94KWK\x08\x86\x94a]\x94(K\x06K\x03\x86\x94K0K\x04"
+    b"\x86\x94e]\x94K0K\x04\x86\x94a]\x94K@K\x06\x86\x94a]\x94K\x00K\x08\x86\x94ae]\x94"
+    b"(]\x94(K\x15K\x01\x86\x94K'K\x02\x86\x94e]\x94KZK\x03\x86\x94a]\x94K\x15K\x01\x86"
+    b"\x94a]\x94K[K\x04\x86\x94a]\x94K\\K\x05\x86\x94a]\x94(K]K\x06\x86\x94K\x00K\x05"
+    b"\x86\x94e]\x94K\x00K\x06\x86\x94ae]\x94(]\x94K\x18K\x01\x86\x94a]\x94K^K\x02\x86"
+    b"\x94a]\x94(K]K\x03\x86\x94K\x00K\x02\x86\x94e]\x94K\x00K\x03\x86\x94ae]\x94(]\x94"
+    b"(K:K\x01\x86\x94K_K\x01\x86\x94e]\x94K\x00K\x01\x86\x94ae]\x94(]\x94(K`K\x01\x86"
+    b"\x94KaK\x01\x86\x94KbK\x01\x86\x94K`K\x01\x86\x94KcK\x01\x86\x94KdK\x01\x86\x94Ke"
+    b"K\x01\x86\x94K[K\x01\x86\x94KfK\x02\x86\x94K\x1cK\x03\x86\x94e]\x94K\x00K\x01\x86"
+    b"\x94a]\x94(K\x1cK\x01\x86\x94K\x00K\x02\x86\x94e]\x94K[K\x01\x86\x94ae]\x94(]\x94"
+    b"KgK\x01\x86\x94a]\x94(KhK\x00\x86\x94K\x00K\x01\x86\x94ee]\x94(]\x94(KiK\x01\x86"
+    b"\x94KjK\x01\x86\x94KkK\x01\x86\x94K>K\x01\x86\x94K=K\x01\x86\x94KlK\x01\x86\x94Km"
+    b"K\x01\x86\x94KnK\x01\x86\x94KoK\x01\x86\x94K?K\x01\x86\x94e]\x94K\x00K\x01\x86"
+    b"\x94ae]\x94(]\x94K\x11K\x01\x86\x94a]\x94K\x00K\x01\x86\x94ae]\x94(]\x94KpK\x01"
+    b"\x86\x94a]\x94(KqK\x02\x86\x94KjK\x02\x86\x94K=K\x02\x86\x94e]\x94K\x00K\x02\x86"
+    b"\x94ae]\x94(]\x94K\x0bK\x01\x86\x94a]\x94KrK\x02\x86\x94a]\x94K\x02K\x03\x86\x94a"
+    b"]\x94K\x00K\x03\x86\x94ae]\x94(]\x94KsK\x01\x86\x94a]\x94(KsK\x01\x86\x94K\x00K"
+    b"\x01\x86\x94ee]\x94(]\x94K\x13K\x01\x86\x94a]\x94KZK\x02\x86\x94a]\x94K\x00K\x02"
+    b"\x86\x94ae]\x94(]\x94(K7K\x01\x86\x94KtK\x02\x86\x94K1K\x03\x86\x94e]\x94KgK\x04"
+    b"\x86\x94a]\x94(K6K\x05\x86\x94K:K\x06\x86\x94K\x00K\x02\x86\x94e]\x94(K6K\x05\x86"
+    b"\x94K0K\x07\x86\x94K8K\x08\x86\x94K:K\x06\x86\x94K\x00K\x03\x86\x94e]\x94(K6K\t"
+    b"\x86\x94K:K\x06\x86\x94K\x00K\x04\x86\x94e]\x94(KtK\n\x86\x94K1K\x0b\x86\x94K\x00"
+    b"K\x05\x86\x94e]\x94K\x00K\x06\x86\x94a]\x94K;K\x04\x86\x94a]\x94K1K\x02\x86\x94a]"
+    b"\x94(K7K\x0c\x86\x94K1K\r\x86\x94K\x00K\t\x86\x94e]\x94(K6K\x05\x86\x94K\x00K\n"
+    b"\x86\x94e]\x94(K6K\x05\x86\x94K8K\x0e\x86\x94K\x00K\x0b\x86\x94e]\x94KgK\x0f\x86"
+    b"\x94a]\x94K0K\x10\x86\x94a]\x94K1K\n\x86\x94a]\x94(K6K\t\x86\x94K\x00K\x0f\x86"
+    b"\x94e]\x94K;K\x0f\x86\x94ae]\x94(]\x94KuK\x01\x86\x94a]\x94(K9K\x02\x86\x94K\x00K"
+    b"\x01\x86\x94e]\x94K)K\x03\x86\x94a]\x94K\x00K\x03\x86\x94ae]\x94(]\x94KvK\x01\x86"
+    b"\x94a]\x94(K6K\x00\x86\x94K\x00K\x01\x86\x94ee]\x94(]\x94K)K\x01\x86\x94a]\x94(K"
+    b"\nK\x00\x86\x94K\x00K\x01\x86\x94ee]\x94(]\x94K)K\x01\x86\x94a]\x94K\x00K\x01\x86"
+    b"\x94ae]\x94(]\x94KwK\x01\x86\x94a]\x94(K\x01K\x02\x86\x94K\x02K\x01\x86\x94e]\x94"
+    b"K\x00K\x02\x86\x94ae]\x94(]\x94KxK\x01\x86\x94a]\x94(K\x07K\x02\x86\x94K1K\x03"
+    b"\x86\x94K\x00K\x01\x86\x94e]\x94(K1K\x03\x86\x94K\x00K\x02\x86\x94e]\x94(K6K\x04"
+    b"\x86\x94K9K\x04\x86\x94K\x00K\x03\x86\x94e]\x94K1K\x05\x86\x94a]\x94K\x00K\x05"
+    b"\x86\x94ae]\x94(]\x94K\x14K\x01\x86\x94a]\x94KgK\x02\x86\x94a]\x94(K[K\x03\x86"
+    b"\x94K\x00K\x02\x86\x94e]\x94K1K\x04\x86\x94a]\x94(K6K\x05\x86\x94K\x00K\x04\x86"
+    b"\x94e]\x94K1K\x06\x86\x94a]\x94K\x00K\x06\x86\x94ae]\x94(]\x94KyK\x01\x86\x94a]"
+    b"\x94(KzK\x00\x86\x94K\x00K\x01\x86\x94ee]\x94(]\x94K3K\x01\x86\x94a]\x94(K2K\x02"
+    b"\x86\x94K{K\x03\x86\x94K|K\x04\x86\x94K\x00K\x01\x86\x94e]\x94(K3K\x05\x86\x94K4K"
+    b"\x05\x86\x94e]\x94K\x00K\x03\x86\x94a]\x94(KwK\x03\x86\x94K4K\x03\x86\x94e]\x94(K"
+    b"2K\x02\x86\x94K\x00K\x05\x86\x94ee]\x94(]\x94(KgK\x01\x86\x94KtK\x01\x86\x94e]"
+    b"\x94(K6K\x02\x86\x94K\x00K\x01\x86\x94e]\x94(KgK\x01\x86\x94KtK\x01\x86\x94K\x00K"
+    b"\x02\x86\x94ee]\x94(]\x94(K\x08K\x01\x86\x94K\tK\x01\x86\x94K&K\x01\x86\x94K}K"
+    b"\x02\x86\x94e]\x94K~K\x02\x86\x94a]\x94K\x00K\x02\x86\x94ae]\x94(]\x94(K\x7fK\x01"
+    b"\x86\x94K\x80K\x01\x86\x94K\x81K\x01\x86\x94K\x82K\x01\x86\x94K\x83K\x01\x86\x94e"
+    b"]\x94K\x00K\x01\x86\x94ae]\x94(]\x94K\x15K\x01\x86\x94a]\x94KZK\x02\x86\x94a]\x94"
+    b"K[K\x03\x86\x94a]\x94K3K\x04\x86\x94a]\x94K0K\x05\x86\x94a]\x94KWK\x06\x86\x94a]"
+    b"\x94(K\x84K\x07\x86\x94K\x00K\x06\x86\x94e]\x94K0K\x08\x86\x94a]\x94KWK\t\x86\x94"
+    b"a]\x94K\x00K\t\x86\x94ae]\x94(]\x94K\x12K\x01\x86\x94a]\x94K)K\x02\x86\x94a]\x94("
+    b"K\x85K\x03\x86\x94KXK\x04\x86\x94e]\x94(K\x86K\x05\x86\x94K0K\x06\x86\x94e]\x94K"
+    b"\x85K\x03\x86\x94a]\x94K1K\x07\x86\x94a]\x94KWK\x08\x86\x94a]\x94K0K\x06\x86\x94a"
+    b"]\x94K\x00K\x08\x86\x94ae]\x94(]\x94(K\x17K\x01\x86\x94K\x1bK\x01\x86\x94e]\x94K)"
+    b"K\x02\x86\x94a]\x94(K6K\x01\x86\x94K\x00K\x02\x86\x94ee]\x94(]\x94K\x18K\x01\x86"
+    b"\x94a]\x94KrK\x02\x86\x94a]\x94K\x00K\x02\x86\x94ae]\x94(]\x94K\x18K\x01\x86\x94a"
+    b"]\x94KrK\x02\x86\x94a]\x94K0K\x03\x86\x94a]\x94KWK\x04\x86\x94a]\x94(K\x87K\x01"
+    b"\x86\x94K\x84K\x05\x86\x94K\x00K\x04\x86\x94e]\x94K0K\x06\x86\x94a]\x94KWK\x07"
+    b"\x86\x94a]\x94K\x00K\x07\x86\x94ae]\x94(]\x94K)K\x01\x86\x94a]\x94(K9K\x02\x86"
+    b"\x94K\x00K\x01\x86\x94e]\x94K)K\x03\x86\x94a]\x94K\x00K\x03\x86\x94ae]\x94(]\x94K"
+    b"\x88K\x01\x86\x94a]\x94(K6K\x02\x86\x94K\x00K\x01\x86\x94e]\x94(K\x88K\x01\x86"
+    b"\x94K\x00K\x02\x86\x94ee]\x94(]\x94K\x16K\x01\x86\x94a]\x94(K\nK\x02\x86\x94KuK"
+    b"\x03\x86\x94e]\x94(K\nK\x02\x86\x94K\x19K\x04\x86\x94KuK\x03\x86\x94e]\x94K\x19K"
+    b"\x04\x86\x94a]\x94(K\x06K\x05\x86\x94K\x07K\x06\x86\x94K\x89K\x06\x86\x94e]\x94K"
+    b"\x89K\x07\x86\x94a]\x94K\x00K\x06\x86\x94a]\x94K@K\x06\x86\x94ae]\x94(]\x94K\x19K"
+    b"\x01\x86\x94a]\x94K\x8aK\x02\x86\x94a]\x94K\x00K\x02\x86\x94ae]\x94(]\x94(K\x8bK"
+    b"\x01\x86\x94K\x8cK\x01\x86\x94e]\x94K\x00K\x01\x86\x94ae]\x94(]\x94K\x1aK\x01\x86"
+    b"\x94a]\x94(K0K\x02\x86\x94K\x8dK\x03\x86\x94e]\x94K1K\x04\x86\x94a]\x94K0K\x02"
+    b"\x86\x94a]\x94K\x00K\x04\x86\x94ae]\x94(]\x94(KrK\x01\x86\x94KtK\x01\x86\x94e]"
+    b"\x94(K6K\x02\x86\x94K\x8eK\x03\x86\x94K\x00K\x01\x86\x94e]\x94(KrK\x04\x86\x94KtK"
+    b"\x04\x86\x94K\x00K\x02\x86\x94e]\x94K\x00K\x03\x86\x94a]\x94(K6K\x02\x86\x94K\x00"
+    b"K\x04\x86\x94ee]\x94(]\x94K\x04K\x01\x86\x94a]\x94K\x8fK\x02\x86\x94a]\x94K0K\x03"
+    b"\x86\x94a]\x94K\x02K\x04\x86\x94a]\x94K\x90K\x05\x86\x94a]\x94K\x91K\x06\x86\x94a"
+    b"]\x94(K\x92K\x07\x86\x94K\x91K\x06\x86\x94e]\x94K\x00K\x07\x86\x94ae]\x94(]\x94K;"
+    b"K\x01\x86\x94a]\x94(K8K\x02\x86\x94K\x00K\x01\x86\x94e]\x94K;K\x03\x86\x94a]\x94K"
+    b"\x00K\x03\x86\x94ae]\x94(]\x94(K\x1cK\x01\x86\x94K\x93K\x02\x86\x94e]\x94K.K\x02"
+    b"\x86\x94a]\x94K\x00K\x02\x86\x94ae]\x94(]\x94(K\x15K\x01\x86\x94K'K\x02\x86\x94e]"
+    b"\x94KZK\x03\x86\x94a]\x94K\x15K\x01\x86\x94a]\x94K[K\x04\x86\x94a]\x94K\x94K\x05"
+    b"\x86\x94a]\x94(K\x95K\x06\x86\x94K\x00K\x05\x86\x94e]\x94K\x00K\x06\x86\x94ae]"
+    b"\x94(]\x94K\x18K\x01\x86\x94a]\x94K^K\x02\x86\x94a]\x94(K\x95K\x03\x86\x94K\x00K"
+    b"\x02\x86\x94e]\x94K\x00K\x03\x86\x94ae]\x94(]\x94(K\x8eK\x01\x86\x94K\x96K\x01"
+    b"\x86\x94e]\x94K\x00K\x01\x86\x94ae]\x94(]\x94K\x1aK\x01\x86\x94a]\x94(K0K\x02\x86"
+    b"\x94K\x8dK\x03\x86\x94e]\x94K^K\x04\x86\x94a]\x94K0K\x02\x86\x94a]\x94K\x00K\x04"
+    b"\x86\x94ae]\x94(]\x94(K\x97K\x01\x86\x94K\\K\x01\x86\x94e]\x94K\x00K\x01\x86\x94a"
+    b"e]\x94(]\x94K\x98K\x01\x86\x94a]\x94(K\x99K\x00\x86\x94K\x00K\x01\x86\x94ee]\x94("
+    b"]\x94K\x06K\x01\x86\x94a]\x94(K@K\x02\x86\x94K\x9aK\x03\x86\x94e]\x94K\x00K\x02"
+    b"\x86\x94a]\x94K@K\x02\x86\x94ae]\x94(]\x94K7K\x01\x86\x94a]\x94K)K\x02\x86\x94a]"
+    b"\x94K\x00K\x02\x86\x94ae]\x94(]\x94K\x1dK\x01\x86\x94a]\x94K\x00K\x01\x86\x94ae]"
+    b"\x94(]\x94(KgK\x01\x86\x94KtK\x01\x86\x94e]\x94(K9K\x02\x86\x94K\x00K\x01\x86\x94"
+    b"e]\x94KgK\x03\x86\x94a]\x94K\x00K\x03\x86\x94ae]\x94(]\x94K\x9bK\x01\x86\x94a]"
+    b"\x94(K6K\x02\x86\x94K\x00K\x01\x86\x94e]\x94(K\x9bK\x01\x86\x94K\x00K\x02\x86\x94"
+    b"ee]\x94(]\x94(K(K\x01\x86\x94K\x9cK\x02\x86\x94e]\x94K\x9cK\x02\x86\x94a]\x94(K7K"
+    b"\x03\x86\x94K\x9dK\x02\x86\x94K\x00K\x02\x86\x94e]\x94K~K\x04\x86\x94a]\x94K\x00K"
+    b"\x04\x86\x94ae]\x94(]\x94K\x1eK\x01\x86\x94a]\x94(K\x9eK\x02\x86\x94K1K\x03\x86"
+    b"\x94K\x00K\x01\x86\x94e]\x94K1K\x04\x86\x94a]\x94(K6K\x05\x86\x94K\x00K\x03\x86"
+    b"\x94e]\x94(K6K\x06\x86\x94K\x00K\x04\x86\x94e]\x94(K1K\x03\x86\x94K\x00K\x05\x86"
+    b"\x94e]\x94K1K\x07\x86\x94a]\x94(K6K\x08\x86\x94K\x00K\x07\x86\x94e]\x94(K1K\x07"
+    b"\x86\x94K\x00K\x08\x86\x94ee]\x94(]\x94K\x1fK\x01\x86\x94a]\x94(K1K\x02\x86\x94K"
+    b"\x00K\x01\x86\x94e]\x94(K6K\x03\x86\x94K\x16K\x04\x86\x94K\x00K\x02\x86\x94e]\x94"
+    b"K1K\x05\x86\x94a]\x94K1K\x06\x86\x94a]\x94(K6K\x04\x86\x94K\x00K\x05\x86\x94e]"
+    b"\x94K\x00K\x06\x86\x94ae]\x94(]\x94K K\x01\x86\x94a]\x94(K3K\x02\x86\x94K\x00K"
+    b"\x01\x86\x94e]\x94K\x00K\x02\x86\x94ae]\x94(]\x94K\x9fK\x01\x86\x94a]\x94(K\xa0K"
+    b"\x00\x86\x94K\x9eK\x00\x86\x94K\x00K\x01\x86\x94ee]\x94(]\x94K\xa1K\x01\x86\x94a]"
+    b"\x94(K\xa2K\x02\x86\x94K\x02K\x03\x86\x94e]\x94(K\x02K\x03\x86\x94K\xa1K\x01\x86"
+    b"\x94e]\x94K\x00K\x03\x86\x94ae]\x94(]\x94(K\x02K\x01\x86\x94K\xa3K\x02\x86\x94K"
+    b"\xa4K\x01\x86\x94e]\x94K\x00K\x01\x86\x94a]\x94K\x02K\x01\x86\x94ae]\x94(]\x94K0K"
+    b"\x01\x86\x94a]\x94(K1K\x02\x86\x94K\x00K\x01\x86\x94e]\x94K\x00K\x02\x86\x94ae]"
+    b"\x94(]\x94(K\xa5K\x01\x86\x94K\xa6K\x01\x86\x94K\xa7K\x01\x86\x94K\xa8K\x01\x86"
+    b"\x94K\xa9K\x01\x86\x94K\xaaK\x01\x86\x94K\xabK\x01\x86\x94K\xacK\x01\x86\x94K\xad"
+    b"K\x01\x86\x94K\xaeK\x01\x86\x94e]\x94K\x00K\x01\x86\x94ae]\x94(]\x94K\x07K\x01"
+    b"\x86\x94a]\x94KgK\x02\x86\x94a]\x94K\x00K\x02\x86\x94ae]\x94(]\x94(K\xa3K\x01\x86"
+    b"\x94K\xa4K\x01\x86\x94e]\x94K\x00K\x01\x86\x94ae]\x94(]\x94(KrK\x01\x86\x94KtK"
+    b"\x01\x86\x94e]\x94(K6K\x02\x86\x94K\x00K\x01\x86\x94e]\x94(KrK\x01\x86\x94KtK\x01"
+    b"\x86\x94K\x00K\x02\x86\x94ee]\x94(]\x94(K0K\x01\x86\x94K1K\x02\x86\x94e]\x94(K"
+    b"\xafK\x03\x86\x94K1K\x04\x86\x94K\x00K\x01\x86\x94e]\x94(K0K\x01\x86\x94K8K\x05"
+    b"\x86\x94K\x00K\x02\x86\x94e]\x94K\x00K\x03\x86\x94a]\x94(K\xafK\x03\x86\x94K\x00K"
+    b"\x04\x86\x94e]\x94K1K\x03\x86\x94ae]\x94(]\x94(KtK\x01\x86\x94K\xb0K\x01\x86\x94e"
+    b"]\x94(K6K\x02\x86\x94K\x00K\x01\x86\x94e]\x94(KtK\x01\x86\x94K\xb0K\x01\x86\x94K"
+    b"\x00K\x02\x86\x94ee]\x94(]\x94(K\x02K\x01\x86\x94K\xa4K\x02\x86\x94e]\x94K\x90K"
+    b"\x03\x86\x94a]\x94K\x00K\x02\x86\x94a]\x94K\x03K\x04\x86\x94a]\x94(K\x92K\x02\x86"
+    b"\x94K\x03K\x04\x86\x94ee]\x94(]\x94K~K\x01\x86\x94a]\x94(K\xb1K\x00\x86\x94K\x07K"
+    b"\x00\x86\x94K\xb2K\x00\x86\x94K\xb3K\x00\x86\x94K\x0bK\x00\x86\x94K\x00K\x01\x86"
+    b"\x94ee]\x94(]\x94(K\xb4K\x01\x86\x94K\\K\x02\x86\x94e]\x94K\x00K\x01\x86\x94a]"
+    b"\x94(K\x18K\x03\x86\x94K\x00K\x02\x86\x94e]\x94K\\K\x04\x86\x94a]\x94K\x84K\x05"
+    b"\x86\x94a]\x94K1K\x01\x86\x94ae]\x94(]\x94K1K\x01\x86\x94a]\x94(K6K\x02\x86\x94K"
+    b"\x00K\x01\x86\x94e]\x94(K1K\x01\x86\x94K\x00K\x02\x86\x94ee]\x94(]\x94K1K\x01\x86"
+    b"\x94a]\x94(K6K\x00\x86\x94K\x00K\x01\x86\x94ee]\x94(]\x94(KrK\x01\x86\x94KtK\x01"
+    b"\x86\x94e]\x94(K6K\x02\x86\x94K\x8eK\x03\x86\x94K\x00K\x01\x86\x94e]\x94(KrK\x04"
+    b"\x86\x94KtK\x04\x86\x94K\x00K\x02\x86\x94e]\x94K\x00K\x03\x86\x94a]\x94(K6K\x02"
+    b"\x86\x94K\x00K\x04\x86\x94ee]\x94(]\x94K^K\x01\x86\x94a]\x94(K6K\x02\x86\x94K\x00"
+    b"K\x01\x86\x94e]\x94K^K\x03\x86\x94a]\x94(K6K\x04\x86\x94K\x00K\x03\x86\x94e]\x94("
+    b"K^K\x03\x86\x94K\x00K\x04\x86\x94ee]\x94(]\x94(KtK\x01\x86\x94K1K\x01\x86\x94e]"
+    b"\x94(K6K\x02\x86\x94K\x00K\x01\x86\x94e]\x94(KtK\x01\x86\x94K1K\x01\x86\x94K\x00K"
+    b"\x02\x86\x94ee]\x94(]\x94(K\x06K\x01\x86\x94K\xb5K\x02\x86\x94e]\x94K\xb6K\x03"
+    b"\x86\x94a]\x94K\x00K\x02\x86\x94a]\x94K@K\x02\x86\x94ae]\x94(]\x94K\xb7K\x01\x86"
+    b"\x94a]\x94(K6K\x02\x86\x94K\x00K\x01\x86\x94e]\x94(K\xb7K\x01\x86\x94K\x00K\x02"
+    b"\x86\x94ee]\x94(]\x94K)K\x01\x86\x94a]\x94(K0K\x02\x86\x94K\x00K\x01\x86\x94e]"
+    b"\x94K1K\x03\x86\x94a]\x94K\x00K\x03\x86\x94ae]\x94(]\x94K)K\x01\x86\x94a]\x94(K0K"
+    b"\x02\x86\x94K\x00K\x01\x86\x94e]\x94(KtK\x03\x86\x94K1K\x03\x86\x94e]\x94K\x00K"
+    b"\x03\x86\x94ae]\x94(]\x94(K\x06K\x01\x86\x94K\nK\x02\x86\x94K\x0cK\x03\x86\x94e]"
+    b"\x94(K@K\x04\x86\x94KYK\x05\x86\x94e]\x94K)K\x04\x86\x94a]\x94K\xb8K\x06\x86\x94a"
+    b"]\x94K\x00K\x04\x86\x94a]\x94K@K\x04\x86\x94a]\x94KBK\x04\x86\x94ae]\x94(]\x94K!K"
+    b"\x01\x86\x94a]\x94K0K\x02\x86\x94a]\x94KWK\x03\x86\x94a]\x94(K\xb9K\x04\x86\x94K"
+    b"\xbaK\x05\x86\x94e]\x94K0K\x06\x86\x94a]\x94K0K\x07\x86\x94a]\x94KWK\x08\x86\x94a"
+    b"]\x94KWK\t\x86\x94a]\x94K\x00K\x08\x86\x94a]\x94(K\x84K\n\x86\x94K\xb9K\x04\x86"
+    b"\x94K\xbaK\x05\x86\x94K\x00K\t\x86\x94e]\x94K0K\x0b\x86\x94a]\x94KWK\x0c\x86\x94a"
+    b"]\x94(K\xb9K\x04\x86\x94K\x00K\x0c\x86\x94ee]\x94(]\x94K\x05K\x01\x86\x94a]\x94K)"
+    b"K\x02\x86\x94a]\x94(K2K\x03\x86\x94KXK\x04\x86\x94e]\x94KgK\x05\x86\x94a]\x94K2K"
+    b"\x03\x86\x94a]\x94K\x00K\x05\x86\x94ae]\x94(]\x94(K\x07K\x01\x86\x94K7K\x02\x86"
+    b"\x94K\xb7K\x03\x86\x94e]\x94(K6K\x04\x86\x94K\xbbK\x05\x86\x94K\x00K\x01\x86\x94e"
+    b"]\x94K\xb5K\x06\x86\x94a]\x94(K6K\x07\x86\x94K2K\x08\x86\x94K\x00K\x03\x86\x94e]"
+    b"\x94(K7K\x02\x86\x94K\xb5K\t\x86\x94K\x00K\x04\x86\x94e]\x94(K6K\x04\x86\x94K\x00"
+    b"K\x05\x86\x94e]\x94(K6K\n\x86\x94K\x00K\x06\x86\x94e]\x94(K\x07K\x01\x86\x94K7K"
+    b"\x02\x86\x94K\xb2K\x0b\x86\x94K\xb7K\x03\x86\x94K\x00K\x07\x86\x94e]\x94K1K\x0c"
+    b"\x86\x94a]\x94(K6K\x04\x86\x94K2K\r\x86\x94K\x00K\t\x86\x94e]\x94K\x00K\n\x86\x94"
+    b"a]\x94(K6K\x0e\x86\x94K\x00K\x0b\x86\x94e]\x94(K6K\x07\x86\x94K\x00K\x0c\x86\x94e"
+    b"]\x94K1K\x05\x86\x94a]\x94(K\x07K\x0f\x86\x94K7K\x02\x86\x94K\xb7K\x10\x86\x94K"
+    b"\x00K\x0e\x86\x94e]\x94(K6K\x11\x86\x94K\xbbK\x12\x86\x94K\x00K\x0f\x86\x94e]\x94"
+    b"(K6K\x0e\x86\x94K2K\x13\x86\x94K\x00K\x10\x86\x94e]\x94(K7K\x02\x86\x94K\xb5K\x14"
+    b"\x86\x94K\x00K\x11\x86\x94e]\x94(K6K\x11\x86\x94K\x00K\x12\x86\x94e]\x94K1K\x0b"
+    b"\x86\x94a]\x94(K6K\x11\x86\x94K2K\x15\x86\x94K\x00K\x14\x86\x94e]\x94K1K\x12\x86"
+    b"\x94ae]\x94(]\x94(K\xbcK\x01\x86\x94K\xbdK\x01\x86\x94K\xbeK\x01\x86\x94e]\x94K"
+    b"\x00K\x01\x86\x94ae]\x94(]\x94K\x0cK\x01\x86\x94a]\x94K\xbfK\x02\x86\x94a]\x94(K6"
+    b"K\x03\x86\x94KBK\x04\x86\x94e]\x94(KBK\x04\x86\x94K\xbfK\x02\x86\x94e]\x94K\x00K"
+    b"\x04\x86\x94ae]\x94(]\x94K)K\x01\x86\x94a]\x94(K0K\x02\x86\x94K\x00K\x01\x86\x94e"
+    b"]\x94KgK\x03\x86\x94a]\x94K\x00K\x03\x86\x94ae]\x94(]\x94K\x07K\x01\x86\x94a]\x94"
+    b"K)K\x02\x86\x94a]\x94K\x00K\x02\x86\x94ae]\x94(]\x94(K\x07K\x01\x86\x94K7K\x02"
+    b"\x86\x94K\xc0K\x03\x86\x94e]\x94(K6K\x04\x86\x94K\xc1K\x05\x86\x94K\x00K\x01\x86"
+    b"\x94e]\x94K\xc1K\x06\x86\x94a]\x94(K6K\x07\x86\x94K2K\x08\x86\x94K\x00K\x03\x86"
+    b"\x94e]\x94(K7K\x02\x86\x94K\xc1K\t\x86\x94K\x00K\x04\x86\x94e]\x94(K6K\x04\x86"
+    b"\x94K\x00K\x05\x86\x94e]\x94(K6K\n\x86\x94K\x00K\x06\x86\x94e]\x94(K\x07K\x01\x86"
+    b"\x94K7K\x02\x86\x94K\xb2K\x0b\x86\x94K\xc0K\x03\x86\x94K\x00K\x07\x86\x94e]\x94K1"
+    b"K\x0c\x86\x94a]\x94(K6K\x04\x86\x94K2K\r\x86\x94K\x00K\t\x86\x94e]\x94K\x00K\n"
+    b"\x86\x94a]\x94(K6K\x0e\x86\x94K\x00K\x0b\x86\x94e]\x94(K6K\x07\x86\x94K\x00K\x0c"
+    b"\x86\x94e]\x94K1K\x05\x86\x94a]\x94(K\x07K\x0f\x86\x94K7K\x02\x86\x94K\xc0K\x10"
+    b"\x86\x94K\x00K\x0e\x86\x94e]\x94(K6K\x11\x86\x94K\xc1K\x12\x86\x94K\x00K\x0f\x86"
+    b"\x94e]\x94(K6K\x0e\x86\x94K2K\x13\x86\x94K\x00K\x10\x86\x94e]\x94(K7K\x02\x86\x94"
+    b"K\xc1K\x14\x86\x94K\x00K\x11\x86\x94e]\x94(K6K\x11\x86\x94K\x00K\x12\x86\x94e]"
+    b"\x94K1K\x0b\x86\x94a]\x94(K6K\x11\x86\x94K2K\x15\x86\x94K\x00K\x14\x86\x94e]\x94K"
+    b"1K\x12\x86\x94ae]\x94(]\x94(K\x06K\x01\x86\x94K\xc1K\x02\x86\x94e]\x94K\xc2K\x03"
+    b"\x86\x94a]\x94K\x00K\x02\x86\x94a]\x94K@K\x02\x86\x94ae]\x94(]\x94K\xc0K\x01\x86"
+    b"\x94a]\x94(K6K\x02\x86\x94K\x00K\x01\x86\x94e]\x94(K\xc0K\x01\x86\x94K\x00K\x02"
+    b'\x86\x94ee]\x94(]\x94K)K\x01\x86\x94a]\x94K\x00K\x01\x86\x94ae]\x94(]\x94K"K\x01'
+    b"\x86\x94a]\x94KrK\x02\x86\x94a]\x94K0K\x03\x86\x94a]\x94KWK\x04\x86\x94a]\x94(K"
+    b"\x84K\x05\x86\x94K\x00K\x04\x86\x94e]\x94K0K\x06\x86\x94a]\x94KWK\x07\x86\x94a]"
+    b"\x94K\x00K\x07\x86\x94ae]\x94(]\x94K#K\x01\x86\x94a]\x94K;K\x02\x86\x94a]\x94(K6K"
+    b"\x01\x86\x94K0K\x03\x86\x94e]\x94KWK\x04\x86\x94a]\x94K\x00K\x04\x86\x94ae]\x94(]"
+    b"\x94K\xc3K\x01\x86\x94a]\x94(K\xc4K\x00\x86\x94K\x00K\x01\x86\x94ee]\x94(]\x94(K"
+    b"\x16K\x01\x86\x94K3K\x02\x86\x94e]\x94K1K\x02\x86\x94a]\x94K\x00K\x02\x86\x94ae]"
+    b"\x94(]\x94K$K\x01\x86\x94a]\x94(K\xc5K\x02\x86\x94K\x00K\x01\x86\x94e]\x94K\x00K"
+    b"\x02\x86\x94ae]\x94(]\x94K4K\x01\x86\x94a]\x94K\x00K\x01\x86\x94aee\x8c\x04dfas"
+    b"\x94}\x94(M\x00\x01hu}\x94(K\x04K\x01K\x05K\x01K\x06K\x01K\x07K\x01K\x08K\x01K\tK"
+    b"\x01K\nK\x01K\x0bK\x01K\x0cK\x01K\rK\x01K\x0eK\x01K\x0fK\x01K\x10K\x01K\x11K\x01K"
+    b"\x12K\x01K\x13K\x01K\x14K\x01K\x15K\x01K\x16K\x01K\x17K\x01K\x18K\x01K\x19K\x01K"
+    b'\x1aK\x01K\x1bK\x01K\x1cK\x01K\x1dK\x01K\x1eK\x01K\x1fK\x01K K\x01K!K\x01K"K\x01K'
+    b"#K\x01K$K\x01K%K\x01K&K\x01K'K\x01K(K\x01K\x01K\x01K)K\x01K\x02K\x01K*K\x01K+K"
+    b"\x01u\x86\x94M\x01\x01h|}\x94(K\x06K\x01K\x08K\x01K\tK\x01K\nK\x01K\x0cK\x01K\rK"
+    b"\x01K%K\x01K&K\x01K(K\x01K)K\x01K*K\x01K+K\x01u\x86\x94M\x02\x01h\x82}\x94(K\x06K"
+    b"\x01K\x08K\x01K\tK\x01K\nK\x01K\x0cK\x01K\rK\x01K\x1cK\x01K%K\x01K&K\x01K(K\x01K)"
+    b"K\x01K*K\x01K+K\x01u\x86\x94M\x03\x01h\x88}\x94K0K\x01s\x86\x94M\x04\x01h\x95}"
+    b"\x94(K\x06K\x01K\x07K\x01K7K\x01K\x08K\x01K\tK\x01K\nK\x01K\x0cK\x01K\rK\x01K\x1a"
+    b"K\x01K\x1cK\x01K%K\x01K&K\x01K(K\x01K)K\x01K*K\x01K+K\x01u\x86\x94M\x05\x01h\x9e}"
+    b"\x94(K\x06K\x01K\x07K\x01K7K\x01K\x08K\x01K\tK\x01K\nK\x01K\x0cK\x01K\rK\x01K\x1a"
+    b"K\x01K\x1cK\x01K%K\x01K&K\x01K(K\x01K)K\x01K*K\x01K+K\x01u\x86\x94M\x06\x01h\xb4}"
+    b"\x94(K\x06K\x01K\x08K\x01K\tK\x01K\nK\x01K\x0cK\x01K\rK\x01K%K\x01K&K\x01K(K\x01K"
+    b")K\x01K*K\x01K+K\x01u\x86\x94M\x07\x01h\xbb}\x94(K\x06K\x01K\x08K\x01K\tK\x01K\nK"
+    b"\x01K\x0cK\x01K\rK\x01K\x1aK\x01K\x1cK\x01K%K\x01K&K\x01K(K\x01K)K\x01K*K\x01K+K"
+    b"\x01u\x86\x94M\x08\x01h\xc5}\x94K\x0eK\x01s\x86\x94M\t\x01h\xd1}\x94K'K\x01s\x86"
+    b"\x94M\n\x01h\xd8}\x94K'K\x01s\x86\x94M\x0b\x01h\xe1}\x94(K\x06K\x01K\nK\x01K\x0cK"
+    b"\x01K\rK\x01K%K\x01K)K\x01K*K\x01K+K\x01u\x86\x94M\x0c\x01j\x08\x01\x00\x00}\x94("
+    b"KGK\x01KHK\x01KIK\x01KJK\x01KKK\x01KLK\x01KMK\x01KNK\x01KOK\x01KPK\x01KQK\x01KRK"
+    b"\x01KSK\x01u\x86\x94M\r\x01j\x19\x01\x00\x00}\x94K\x0fK\x01s\x86\x94M\x0e\x01j"
+    b"\x1e\x01\x00\x00}\x94KTK\x01s\x86\x94M\x0f\x01j,\x01\x00\x00}\x94K\x10K\x01s\x86"
+    b"\x94M\x10\x01jC\x01\x00\x00}\x94(K\x15K\x01K'K\x01u\x86\x94M\x11\x01jT\x01\x00"
+    b"\x00}\x94K\x18K\x01s\x86\x94M\x12\x01j^\x01\x00\x00}\x94(K\x15K\x01K\x18K\x01K'K"
+    b"\x01u\x86\x94M\x13\x01jd\x01\x00\x00}\x94(K`K\x01KaK\x01KbK\x01KcK\x01KdK\x01KeK"
+    b"\x01K[K\x01KfK\x01K\x1cK\x01u\x86\x94M\x14\x01jw\x01\x00\x00}\x94(K\x06K\x01K\x08"
+    b"K\x01K\tK\x01K\nK\x01K\x0cK\x01K\rK\x01K%K\x01K&K\x01K(K\x01K)K\x01K*K\x01K+K\x01"
+    b"u\x86\x94M\x15\x01j}\x01\x00\x00}\x94(K\x04K\x01K\x0bK\x01K\x10K\x01K\x12K\x01K"
+    b"\x15K\x01K\x18K\x01K!K\x01K\"K\x01K#K\x01K'K\x01u\x86\x94M\x16\x01j\x8b\x01\x00"
+    b"\x00}\x94K\x11K\x01s\x86\x94M\x17\x01j\x90\x01\x00\x00}\x94K\x0bK\x01s\x86\x94M"
+    b"\x18\x01j\x99\x01\x00\x00}\x94K\x0bK\x01s\x86\x94M\x19\x01j\xa2\x01\x00\x00}\x94K"
+    b"\x0bK\x01s\x86\x94M\x1a\x01j\xa8\x01\x00\x00}\x94K\x13K\x01s\x86\x94M\x1b\x01j"
+    b"\xaf\x01\x00\x00}\x94(K\x06K\x01K\x07K\x01K7K\x01K\x08K\x01K\tK\x01K\nK\x01K\x0cK"
+    b"\x01K\rK\x01K\x1aK\x01K\x1cK\x01K%K\x01K&K\x01K(K\x01K)K\x01K*K\x01K+K\x01u\x86"
+    b"\x94M\x1c\x01j\xe4\x01\x00\x00}\x94K)K\x01s\x86\x94M\x1d\x01j\xee\x01\x00\x00}"
+    b"\x94K)K\x01s\x86\x94M\x1e\x01j\xf4\x01\x00\x00}\x94K)K\x01s\x86\x94M\x1f\x01j\xfa"
+    b"\x01\x00\x00}\x94K)K\x01s\x86\x94M \x01j\xff\x01\x00\x00}\x94(K\x06K\x01K\x08K"
+    b"\x01K\tK\x01K\nK\x01K\x0cK\x01K\rK\x01K\x1aK\x01K\x1cK\x01K%K\x01K&K\x01K(K\x01K)"
+    b'K\x01K*K\x01K+K\x01u\x86\x94M!\x01j\x07\x02\x00\x00}\x94KxK\x01s\x86\x94M"\x01j'
+    b"\x19\x02\x00\x00}\x94K\x14K\x01s\x86\x94M#\x01j*\x02\x00\x00}\x94(K\x06K\x01K\x08"
+    b"K\x01K\tK\x01K\nK\x01K\x0cK\x01K\rK\x01K%K\x01K&K\x01K(K\x01K)K\x01K*K\x01K+K\x01"
+    b"u\x86\x94M$\x01j0\x02\x00\x00}\x94(K\x06K\x01K\x07K\x01K\x08K\x01K\tK\x01K\nK\x01"
+    b"K\x0cK\x01K\rK\x01K\x1aK\x01K\x1cK\x01K%K\x01K&K\x01K(K\x01K)K\x01K*K\x01K+K\x01u"
+    b"\x86\x94M%\x01jC\x02\x00\x00}\x94(K\x06K\x01K\x07K\x01K\x08K\x01K\tK\x01K\nK\x01K"
+    b"\x0cK\x01K\rK\x01K%K\x01K&K\x01K(K\x01K)K\x01K*K\x01K+K\x01u\x86\x94M&\x01jN\x02"
+    b"\x00\x00}\x94(K\x06K\x01K\x08K\x01K\tK\x01K\nK\x01K\x0cK\x01K\rK\x01K%K\x01K&K"
+    b"\x01K(K\x01K)K\x01K*K\x01K+K\x01u\x86\x94M'\x01jX\x02\x00\x00}\x94(K\x0fK\x01K"
+    b"\x11K\x01K\x1fK\x01K K\x01K$K\x01u\x86\x94M(\x01ja\x02\x00\x00}\x94K\x15K\x01s"
+    b"\x86\x94M)\x01jw\x02\x00\x00}\x94K\x12K\x01s\x86\x94M*\x01j\x8c\x02\x00\x00}\x94("
+    b"K\x17K\x01K\x1bK\x01u\x86\x94M+\x01j\x95\x02\x00\x00}\x94K\x18K\x01s\x86\x94M,"
+    b"\x01j\x9c\x02\x00\x00}\x94K\x18K\x01s\x86\x94M-\x01j\xaf\x02\x00\x00}\x94K)K\x01s"
+    b"\x86\x94M.\x01j\xb9\x02\x00\x00}\x94K)K\x01s\x86\x94M/\x01j\xc2\x02\x00\x00}\x94K"
+    b"\x16K\x01s\x86\x94M0\x01j\xd8\x02\x00\x00}\x94K\x19K\x01s\x86\x94M1\x01j\xdf\x02"
+    b"\x00\x00}\x94(K\x16K\x01K\x19K\x01u\x86\x94M2\x01j\xe5\x02\x00\x00}\x94K\x1aK\x01"
+    b"s\x86\x94M3\x01j\xf1\x02\x00\x00}\x94(K\x06K\x01K\x07K\x01K\x08K\x01K\tK\x01K\nK"
+    b"\x01K\x0cK\x01K\rK\x01K\x1aK\x01K\x1cK\x01K%K\x01K&K\x01K(K\x01K)K\x01K*K\x01K+K"
+    b"\x01u\x86\x94M4\x01j\x02\x03\x00\x00}\x94K\x04K\x01s\x86\x94M5\x01j\x14\x03\x00"
+    b"\x00}\x94(K\x06K\x01K\x08K\x01K\tK\x01K\nK\x01K\x0cK\x01K\rK\x01K\x1aK\x01K\x1cK"
+    b"\x01K%K\x01K&K\x01K(K\x01K)K\x01K*K\x01K+K\x01u\x86\x94M6\x01j\x1e\x03\x00\x00}"
+    b"\x94(K\x06K\x01K\x08K\x01K\tK\x01K\nK\x01K\x0cK\x01K\rK\x01K\x1cK\x01K%K\x01K&K"
+    b"\x01K(K\x01K)K\x01K*K\x01K+K\x01u\x86\x94M7\x01j&\x03\x00\x00}\x94(K\x15K\x01K'K"
+    b"\x01u\x86\x94M8\x01j7\x03\x00\x00}\x94K\x18K\x01s\x86\x94M9\x01jA\x03\x00\x00}"
+    b"\x94(K\x15K\x01K\x18K\x01K'K\x01u\x86\x94M:\x01jG\x03\x00\x00}\x94K\x1aK\x01s\x86"
+    b"\x94M;\x01jS\x03\x00\x00}\x94(K\x06K\x01K\x08K\x01K\tK\x01K\nK\x01K\x0cK\x01K\rK"
+    b"\x01K\x1aK\x01K\x1cK\x01K%K\x01K&K\x01K(K\x01K)K\x01K*K\x01K+K\x01u\x86\x94M<\x01"
+    b"jY\x03\x00\x00}\x94(K\x06K\x01K\x08K\x01K\tK\x01K\nK\x01K\x0cK\x01K\rK\x01K\x1cK"
+    b"\x01K%K\x01K&K\x01K(K\x01K)K\x01K*K\x01K+K\x01u\x86\x94M=\x01j_\x03\x00\x00}\x94K"
+    b"\x06K\x01s\x86\x94M>\x01ji\x03\x00\x00}\x94K7K\x01s\x86\x94M?\x01jp\x03\x00\x00}"
+    b"\x94K\x1dK\x01s\x86\x94M@\x01ju\x03\x00\x00}\x94(K\x06K\x01K\x07K\x01K\x08K\x01K"
+    b"\tK\x01K\nK\x01K\x0cK\x01K\rK\x01K%K\x01K&K\x01K(K\x01K)K\x01K*K\x01K+K\x01u\x86"
+    b"\x94MA\x01j\x80\x03\x00\x00}\x94(K\x06K\x01K\x07K\x01K\x08K\x01K\tK\x01K\nK\x01K"
+    b"\x0cK\x01K\rK\x01K%K\x01K&K\x01K(K\x01K)K\x01K*K\x01K+K\x01u\x86\x94MB\x01j\x89"
+    b"\x03\x00\x00}\x94(K\x06K\x01K\nK\x01K\x0cK\x01K\rK\x01K%K\x01K(K\x01K)K\x01K*K"
+    b"\x01K+K\x01u\x86\x94MC\x01j\x97\x03\x00\x00}\x94K\x1eK\x01s\x86\x94MD\x01j\xb1"
+    b"\x03\x00\x00}\x94K\x1fK\x01s\x86\x94ME\x01j\xc4\x03\x00\x00}\x94K K\x01s\x86\x94M"
+    b"F\x01j\xcc\x03\x00\x00}\x94(K\x06K\x01K\x08K\x01K\tK\x01K\nK\x01K\x0cK\x01K\rK"
+    b"\x01K%K\x01K&K\x01K(K\x01K)K\x01K*K\x01K+K\x01u\x86\x94MG\x01j\xd3\x03\x00\x00}"
+    b"\x94(K\x05K\x01K\x06K\x01K\x07K\x01K\x08K\x01K\tK\x01K\nK\x01K\x0cK\x01K\rK\x01K"
+    b"\x0eK\x01K\x0fK\x01K\x11K\x01K\x13K\x01K\x14K\x01K\x16K\x01K\x17K\x01K\x19K\x01K"
+    b"\x1aK\x01K\x1bK\x01K\x1cK\x01K\x1dK\x01K\x1eK\x01K\x1fK\x01K K\x01K$K\x01K%K\x01K"
+    b"&K\x01K(K\x01K)K\x01K*K\x01K+K\x01u\x86\x94MH\x01j\xde\x03\x00\x00}\x94(K\x04K"
+    b"\x01K\x05K\x01K\x06K\x01K\x07K\x01K\x08K\x01K\tK\x01K\nK\x01K\x0bK\x01K\x0cK\x01K"
+    b"\rK\x01K\x0eK\x01K\x0fK\x01K\x10K\x01K\x11K\x01K\x12K\x01K\x13K\x01K\x14K\x01K"
+    b"\x15K\x01K\x16K\x01K\x17K\x01K\x18K\x01K\x19K\x01K\x1aK\x01K\x1bK\x01K\x1cK\x01K"
+    b"\x1dK\x01K\x1eK\x01K\x1fK\x01K K\x01K!K\x01K\"K\x01K#K\x01K$K\x01K%K\x01K&K\x01K'"
+    b"K\x01K(K\x01K)K\x01K\x02K\x01K*K\x01K+K\x01u\x86\x94MI\x01j\xe7\x03\x00\x00}\x94K"
+    b"0K\x01s\x86\x94MJ\x01j\xef\x03\x00\x00}\x94(K\x05K\x01K\x06K\x01K\x07K\x01K\x08K"
+    b"\x01K\tK\x01K\nK\x01K\x0cK\x01K\rK\x01K\x0eK\x01K\x0fK\x01K\x11K\x01K\x13K\x01K"
+    b"\x14K\x01K\x16K\x01K\x17K\x01K\x19K\x01K\x1aK\x01K\x1bK\x01K\x1cK\x01K\x1dK\x01K"
+    b"\x1eK\x01K\x1fK\x01K K\x01K$K\x01K%K\x01K&K\x01K(K\x01K)K\x01K*K\x01K+K\x01u\x86"
+    b"\x94MK\x01j\xfd\x03\x00\x00}\x94K\x07K\x01s\x86\x94ML\x01j\x04\x04\x00\x00}\x94(K"
+    b"\x04K\x01K\x05K\x01K\x06K\x01K\x07K\x01K\x08K\x01K\tK\x01K\nK\x01K\x0bK\x01K\x0cK"
+    b"\x01K\rK\x01K\x0eK\x01K\x0fK\x01K\x10K\x01K\x11K\x01K\x12K\x01K\x13K\x01K\x14K"
+    b"\x01K\x15K\x01K\x16K\x01K\x17K\x01K\x18K\x01K\x19K\x01K\x1aK\x01K\x1bK\x01K\x1cK"
+    b'\x01K\x1dK\x01K\x1eK\x01K\x1fK\x01K K\x01K!K\x01K"K\x01K#K\x01K$K\x01K%K\x01K&K'
+    b"\x01K'K\x01K(K\x01K)K\x01K*K\x01K+K\x01u\x86\x94MM\x01j\n\x04\x00\x00}\x94(K\x06K"
+    b"\x01K\x07K\x01K\x08K\x01K\tK\x01K\nK\x01K\x0cK\x01K\rK\x01K\x1aK\x01K\x1cK\x01K%K"
+    b"\x01K&K\x01K(K\x01K)K\x01K*K\x01K+K\x01u\x86\x94MN\x01j\x15\x04\x00\x00}\x94(K"
+    b"\x06K\x01K\x08K\x01K\tK\x01K\nK\x01K0K\x01K\x0cK\x01K\rK\x01K\x1aK\x01K\x1cK\x01K"
+    b"%K\x01K&K\x01K(K\x01K)K\x01K*K\x01K+K\x01u\x86\x94MO\x01j(\x04\x00\x00}\x94(K\x06"
+    b"K\x01K\x07K\x01K\x08K\x01K\tK\x01K\nK\x01K0K\x01K\x0cK\x01K\rK\x01K\x1aK\x01K\x1c"
+    b"K\x01K%K\x01K&K\x01K(K\x01K)K\x01K*K\x01K+K\x01u\x86\x94MP\x01j3\x04\x00\x00}\x94"
+    b"(K\x05K\x01K\x06K\x01K\x07K\x01K\x08K\x01K\tK\x01K\nK\x01K\x0cK\x01K\rK\x01K\x0eK"
+    b"\x01K\x0fK\x01K\x11K\x01K\x13K\x01K\x14K\x01K\x16K\x01K\x17K\x01K\x19K\x01K\x1aK"
+    b"\x01K\x1bK\x01K\x1cK\x01K\x1dK\x01K\x1eK\x01K\x1fK\x01K K\x01K$K\x01K%K\x01K&K"
+    b"\x01K(K\x01K)K\x01K\x02K\x01K*K\x01K+K\x01u\x86\x94MQ\x01j@\x04\x00\x00}\x94(K"
+    b"\x06K\x01K\x08K\x01K\tK\x01K\nK\x01K\x0cK\x01K\rK\x01K%K\x01K&K\x01K(K\x01K)K\x01"
+    b"K*K\x01K+K\x01u\x86\x94MR\x01jJ\x04\x00\x00}\x94(K\x06K\x01K\x08K\x01K\tK\x01K\nK"
+    b"\x01K\x0cK\x01K\rK\x01K\x1aK\x01K\x1cK\x01K%K\x01K&K\x01K(K\x01K)K\x01K*K\x01K+K"
+    b"\x01u\x86\x94MS\x01jY\x04\x00\x00}\x94(K\x06K\x01K\x08K\x01K\tK\x01K\nK\x01K\x0cK"
+    b"\x01K\rK\x01K\x1aK\x01K\x1cK\x01K%K\x01K&K\x01K(K\x01K)K\x01K*K\x01K+K\x01u\x86"
+    b"\x94MT\x01jb\x04\x00\x00}\x94(K\x06K\x01K\x08K\x01K\tK\x01K\nK\x01K\x0cK\x01K\rK"
+    b"\x01K\x1aK\x01K\x1cK\x01K%K\x01K&K\x01K(K\x01K)K\x01K*K\x01K+K\x01u\x86\x94MU\x01"
+    b"jh\x04\x00\x00}\x94(K\x06K\x01K\x07K\x01K\x08K\x01K\tK\x01K\nK\x01K\x0cK\x01K\rK"
+    b"\x01K\x1aK\x01K\x1cK\x01K%K\x01K&K\x01K(K\x01K)K\x01K*K\x01K+K\x01u\x86\x94MV\x01"
+    b"jy\x04\x00\x00}\x94(K\x06K\x01K\x08K\x01K\tK\x01K\nK\x01K\x0cK\x01K\rK\x01K\x1aK"
+    b"\x01K\x1cK\x01K%K\x01K&K\x01K(K\x01K)K\x01K*K\x01K+K\x01u\x86\x94MW\x01j\x87\x04"
+    b"\x00\x00}\x94(K\x06K\x01K\x07K\x01K\x08K\x01K\tK\x01K\nK\x01K\x0cK\x01K\rK\x01K"
+    b"\x1aK\x01K\x1cK\x01K%K\x01K&K\x01K(K\x01K)K\x01K*K\x01K+K\x01u\x86\x94MX\x01j\x92"
+    b"\x04\x00\x00}\x94(K\x06K\x01K)K\x01u\x86\x94MY\x01j\x9c\x04\x00\x00}\x94(K\x06K"
+    b"\x01K)K\x01u\x86\x94MZ\x01j\xa5\x04\x00\x00}\x94K)K\x01s\x86\x94M[\x01j\xaf\x04"
+    b"\x00\x00}\x94K)K\x01s\x86\x94M\\\x01j\xba\x04\x00\x00}\x94(K\x06K\x01K\nK\x01K"
+    b"\x0cK\x01u\x86\x94M]\x01j\xcc\x04\x00\x00}\x94K!K\x01s\x86\x94M^\x01j\xec\x04\x00"
+    b"\x00}\x94K\x05K\x01s\x86\x94M_\x01j\xfa\x04\x00\x00}\x94(K\x06K\x01K\x07K\x01K7K"
+    b"\x01K)K\x01u\x86\x94M`\x01jE\x05\x00\x00}\x94(K\x07K\x01K7K\x01K)K\x01u\x86\x94Ma"
+    b"\x01jL\x05\x00\x00}\x94K\x0cK\x01s\x86\x94Mb\x01jY\x05\x00\x00}\x94K)K\x01s\x86"
+    b"\x94Mc\x01jc\x05\x00\x00}\x94K\x07K\x01s\x86\x94Md\x01jj\x05\x00\x00}\x94(K\x06K"
+    b"\x01K\x07K\x01K7K\x01K)K\x01u\x86\x94Me\x01j\xb5\x05\x00\x00}\x94(K\x06K\x01K)K"
+    b"\x01u\x86\x94Mf\x01j\xbf\x05\x00\x00}\x94(K\x06K\x01K)K\x01u\x86\x94Mg\x01j\xc8"
+    b'\x05\x00\x00}\x94K)K\x01s\x86\x94Mh\x01j\xcd\x05\x00\x00}\x94K"K\x01s\x86\x94Mi'
+    b"\x01j\xdf\x05\x00\x00}\x94K#K\x01s\x86\x94Mj\x01j\xeb\x05\x00\x00}\x94(K\x06K\x01"
+    b"K\x08K\x01K\tK\x01K\nK\x01K\x0cK\x01K\rK\x01K%K\x01K&K\x01K(K\x01K)K\x01K*K\x01K+"
+    b"K\x01u\x86\x94Mk\x01j\xf1\x05\x00\x00}\x94(K\x06K\x01K\x07K\x01K\x08K\x01K\tK\x01"
+    b"K\nK\x01K\x0cK\x01K\rK\x01K\x16K\x01K\x1aK\x01K\x1cK\x01K%K\x01K&K\x01K(K\x01K)K"
+    b"\x01K*K\x01K+K\x01u\x86\x94Ml\x01j\xf9\x05\x00\x00}\x94K$K\x01s\x86\x94Mm\x01j"
+    b"\x01\x06\x00\x00}\x94K$K\x01s\x86\x94u\x8c\x06labels\x94]\x94(K\x00\x8c\x05EMPTY"
+    b"\x94\x86\x94K\x00N\x86\x94K\x04N\x86\x94ML\x01N\x86\x94K\x01\x8c\x05match\x94\x86"
+    b"\x94K\x01\x8c\x04type\x94\x86\x94K\x07N\x86\x94K\x10N\x86\x94K\x0eN\x86\x94K\x0fN"
+    b"\x86\x94K\x17N\x86\x94K2N\x86\x94K\tN\x86\x94K\x19N\x86\x94K\x01\x8c\x06assert"
+    b"\x94\x86\x94K\x01\x8c\x05break\x94\x86\x94K\x01\x8c\x05class\x94\x86\x94K\x01\x8c"
+    b"\x08continue\x94\x86\x94K\x01\x8c\x03def\x94\x86\x94K\x01\x8c\x03del\x94\x86\x94K"
+    b"\x01\x8c\x04exec\x94\x86\x94K\x01\x8c\x03for\x94\x86\x94K\x01\x8c\x04from\x94\x86"
+    b"\x94K\x01\x8c\x06global\x94\x86\x94K\x01\x8c\x02if\x94\x86\x94K\x01\x8c\x06import"
+    b"\x94\x86\x94K\x01\x8c\x06lambda\x94\x86\x94K\x01\x8c\x08nonlocal\x94\x86\x94K\x01"
+    b"\x8c\x03not\x94\x86\x94K\x01\x8c\x04pass\x94\x86\x94K\x01\x8c\x05print\x94\x86"
+    b"\x94K\x01\x8c\x05raise\x94\x86\x94K\x01\x8c\x06return\x94\x86\x94K\x01\x8c\x03try"
+    b"\x94\x86\x94K\x01\x8c\x05while\x94\x86\x94K\x01\x8c\x04with\x94\x86\x94K\x01\x8c"
+    b"\x05yield\x94\x86\x94K\x1aN\x86\x94K N\x86\x94K9N\x86\x94K8N\x86\x94K\x01N\x86"
+    b"\x94K\x02N\x86\x94K\x03N\x86\x94MF\x01N\x86\x94K\x13N\x86\x94M6\x01N\x86\x94K\x01"
+    b"\x8c\x03and\x94\x86\x94K\x0bN\x86\x94MR\x01N\x86\x94K\x16N\x86\x94MW\x01N\x86\x94"
+    b"Ml\x01N\x86\x94M\x05\x01N\x86\x94K\x0cN\x86\x94K$N\x86\x94K;N\x86\x94K\x01\x8c"
+    b"\x02as\x94\x86\x94M\x10\x01N\x86\x94M\x07\x01N\x86\x94MQ\x01N\x86\x94M)\x01N\x86"
+    b"\x94M(\x01N\x86\x94Mi\x01N\x86\x94K\x08N\x86\x94MU\x01N\x86\x94K\nN\x86\x94M3\x01"
+    b"N\x86\x94MT\x01N\x86\x94K\x1bN\x86\x94M\x1b\x01N\x86\x94K)N\x86\x94K*N\x86\x94K/N"
+    b"\x86\x94K'N\x86\x94K%N\x86\x94K&N\x86\x94K1N\x86\x94K(N\x86\x94K-N\x86\x94K.N\x86"
+    b"\x94K3N\x86\x94K,N\x86\x94K+N\x86\x94K\x01\x8c\x04case\x94\x86\x94MA\x01N\x86\x94"
+    b"M+\x01N\x86\x94MP\x01N\x86\x94Ma\x01N\x86\x94M\x04\x01N\x86\x94M%\x01N\x86\x94K"
+    b"\x01\x8c\x02in\x94\x86\x94M<\x01N\x86\x94M\x12\x01N\x86\x94M;\x01N\x86\x94M\x11"
+    b"\x01N\x86\x94K\x1dN\x86\x94K\x14N\x86\x94K\x1eN\x86\x94K\x1cN\x86\x94K\x15N\x86"
+    b"\x94K\x1fN\x86\x94K\x01\x8c\x02is\x94\x86\x94M#\x01N\x86\x94M\x13\x01N\x86\x94M\n"
+    b"\x01N\x86\x94M\x0f\x01N\x86\x94M\x17\x01N\x86\x94M,\x01N\x86\x94M4\x01N\x86\x94M]"
+    b"\x01N\x86\x94Mh\x01N\x86\x94M\x19\x01N\x86\x94M\t\x01N\x86\x94M5\x01N\x86\x94M"
+    b"\x18\x01N\x86\x94MK\x01N\x86\x94M\x1e\x01N\x86\x94M\x1c\x01N\x86\x94MS\x01N\x86"
+    b"\x94K\x01\x8c\x06except\x94\x86\x94Mj\x01N\x86\x94K\x12N\x86\x94M\x03\x01N\x86"
+    b"\x94M\x0c\x01N\x86\x94MB\x01N\x86\x94M&\x01N\x86\x94M\r\x01N\x86\x94M\x16\x01N"
+    b"\x86\x94MD\x01N\x86\x94ME\x01N\x86\x94Mm\x01N\x86\x94K\x01\x8c\x04else\x94\x86"
+    b"\x94M=\x01N\x86\x94K7N\x86\x94K\x01\x8c\x04elif\x94\x86\x94M-\x01N\x86\x94M.\x01N"
+    b"\x86\x94M\x1d\x01N\x86\x94M/\x01N\x86\x94M0\x01N\x86\x94Md\x01N\x86\x94M7\x01N"
+    b"\x86\x94MM\x01N\x86\x94K\x05N\x86\x94M\x0e\x01N\x86\x94K\x06N\x86\x94M\x14\x01N"
+    b"\x86\x94MV\x01N\x86\x94M9\x01N\x86\x94M8\x01N\x86\x94M:\x01N\x86\x94M\x02\x01N"
+    b"\x86\x94K\x01\x8c\x02or\x94\x86\x94M_\x01N\x86\x94M@\x01N\x86\x94M\x0b\x01N\x86"
+    b'\x94M\\\x01N\x86\x94K#N\x86\x94M\x06\x01N\x86\x94K"N\x86\x94MJ\x01N\x86\x94K\rN'
+    b'\x86\x94M\x15\x01N\x86\x94MG\x01N\x86\x94M\x08\x01N\x86\x94M\x1a\x01N\x86\x94M"'
+    b"\x01N\x86\x94M$\x01N\x86\x94M'\x01N\x86\x94M*\x01N\x86\x94M1\x01N\x86\x94M?\x01N"
+    b"\x86\x94MC\x01N\x86\x94M^\x01N\x86\x94MI\x01N\x86\x94MN\x01N\x86\x94K\x18N\x86"
+    b"\x94K\x11N\x86\x94K0N\x86\x94M2\x01N\x86\x94MZ\x01N\x86\x94MY\x01N\x86\x94MX\x01N"
+    b"\x86\x94MO\x01N\x86\x94K\x01\x8c\x07finally\x94\x86\x94M!\x01N\x86\x94M[\x01N\x86"
+    b"\x94M>\x01N\x86\x94Mb\x01N\x86\x94Mc\x01N\x86\x94M`\x01N\x86\x94Me\x01N\x86\x94Mg"
+    b"\x01N\x86\x94Mf\x01N\x86\x94M\x01\x01N\x86\x94K!N\x86\x94Mk\x01N\x86\x94e\x8c\x08"
+    b"keywords\x94}\x94(j\xf7\x06\x00\x00K\x0ej\xf9\x06\x00\x00K\x0fj\xfb\x06\x00\x00K"
+    b"\x10j\xfd\x06\x00\x00K\x11j\xff\x06\x00\x00K\x12j\x01\x07\x00\x00K\x13j\x03\x07"
+    b"\x00\x00K\x14j\x05\x07\x00\x00K\x15j\x07\x07\x00\x00K\x16j\t\x07\x00\x00K\x17j"
+    b"\x0b\x07\x00\x00K\x18j\r\x07\x00\x00K\x19j\x0f\x07\x00\x00K\x1aj\x11\x07\x00\x00K"
+    b"\x1bj\x13\x07\x00\x00K\x1cj\x15\x07\x00\x00K\x1dj\x17\x07\x00\x00K\x1ej\x19\x07"
+    b'\x00\x00K\x1fj\x1b\x07\x00\x00K j\x1d\x07\x00\x00K!j\x1f\x07\x00\x00K"j!\x07\x00'
+    b"\x00K#j#\x07\x00\x00K$j/\x07\x00\x00K/j:\x07\x00\x00K9j^\x07\x00\x00K[jj\x07\x00"
+    b"\x00Kfj}\x07\x00\x00Kxj\x8a\x07\x00\x00K\x84j\x8e\x07\x00\x00K\x87j\xa1\x07\x00"
+    b"\x00K\x99j\xc2\x07\x00\x00K\xb9u\x8c\rsoft_keywords\x94}\x94(j\xeb\x06\x00\x00K"
+    b"\x04j\xed\x06\x00\x00K\x05jV\x07\x00\x00KTu\x8c\x06tokens\x94}\x94(K\x00K\x01K"
+    b"\x04K\x02K\x07K\x06K\x10K\x07K\x0eK\x08K\x0fK\tK\x17K\nK2K\x0bK\tK\x0cK\x19K\rK"
+    b"\x1aK%K K&K9K'K8K(K\x01K)K\x02K*K\x03K+K\x13K-K\x0bK0K\x16K2K\x0cK6K$K7K;K8K\x08K"
+    b"@K\nKBK\x1bKEK)KGK*KHK/KIK'KJK%KKK&KLK1KMK(KNK-KOK.KPK3KQK,KRK+KSK\x1dK`K\x14KaK"
+    b'\x1eKbK\x1cKcK\x15KdK\x1fKeK\x12KzK7K\x86K\x05K\x90K\x06K\x92K#K\x9eK"K\xa0K\rK'
+    b"\xa2K\x18K\xb1K\x11K\xb2K0K\xb3K!K\xc4u\x8c\x0csymbol2label\x94}\x94(\x8c\x04stmt"
+    b"\x94K\x03\x8c\nshift_expr\x94K,\x8c\x08not_test\x94K.\x8c\x04test\x94K1\x8c\x12te"
+    b"stlist_star_expr\x94K3\x8c\nyield_expr\x94K4\x8c\x08argument\x94K5\x8c\x08comp_fo"
+    b"r\x94K:\x8c\x0basexpr_test\x94K;\x8c\x04term\x94K<\x8c\x07funcdef\x94K=\x8c\x08fo"
+    b"r_stmt\x94K>\x8c\twith_stmt\x94K?\x8c\rtestlist_gexp\x94KA\x8c\tlistmaker\x94KC"
+    b"\x8c\ttestlist1\x94KD\x8c\x0cdictsetmaker\x94KF\x8c\x08patterns\x94KU\x8c\x05guar"
+    b"d\x94KV\x8c\x05suite\x94KW\x8c\ntypeparams\x94KX\x8c\x07arglist\x94KY\x8c\x08expr"
+    b"list\x94KZ\x8c\x07or_test\x94K\\\x8c\tcomp_iter\x94K]\x8c\x08old_test\x94K^\x8c"
+    b"\x07comp_if\x94K_\x8c\x04expr\x94Kg\x8c\x07comp_op\x94Kh\x8c\nasync_stmt\x94Ki"
+    b"\x8c\x08classdef\x94Kj\x8c\tdecorated\x94Kk\x8c\x07if_stmt\x94Kl\x8c\nmatch_stmt"
+    b"\x94Km\x8c\x08try_stmt\x94Kn\x8c\nwhile_stmt\x94Ko\x8c\ndecorators\x94Kp\x8c\rasy"
+    b"nc_funcdef\x94Kq\x8c\x0enamedexpr_test\x94Kr\x8c\tdecorator\x94Ks\x8c\tstar_expr"
+    b"\x94Kt\x8c\x0bdotted_name\x94Ku\x8c\x0edotted_as_name\x94Kv\x8c\x08testlist\x94Kw"
+    b"\x8c\x08xor_expr\x94Ky\x8c\tannassign\x94K{\x8c\taugassign\x94K|\x8c\x05power\x94"
+    b"K}\x8c\x06factor\x94K~\x8c\nbreak_stmt\x94K\x7f\x8c\rcontinue_stmt\x94K\x80\x8c\n"
+    b"raise_stmt\x94K\x81\x8c\x0breturn_stmt\x94K\x82\x8c\nyield_stmt\x94K\x83\x8c\npar"
+    b"ameters\x94K\x85\x8c\x0eimport_as_name\x94K\x88\x8c\x0fimport_as_names\x94K\x89"
+    b"\x8c\x0fdotted_as_names\x94K\x8a\x8c\x0bimport_from\x94K\x8b\x8c\x0bimport_name"
+    b"\x94K\x8c\x8c\x0bvarargslist\x94K\x8d\x8c\x0cold_comp_for\x94K\x8e\x8c\x0csubject"
+    b"_expr\x94K\x8f\x8c\ncase_block\x94K\x91\x8c\ncomparison\x94K\x93\x8c\rtestlist_sa"
+    b"fe\x94K\x94\x8c\rold_comp_iter\x94K\x95\x8c\x0bold_comp_if\x94K\x96\x8c\x0bold_la"
+    b"mbdef\x94K\x97\x8c\x08and_test\x94K\x98\x8c\rtypedargslist\x94K\x9a\x8c\x07patter"
+    b"n\x94K\x9b\x8c\x04atom\x94K\x9c\x8c\x07trailer\x94K\x9d\x8c\narith_expr\x94K\x9f"
+    b"\x8c\nsmall_stmt\x94K\xa1\x8c\rcompound_stmt\x94K\xa3\x8c\x0bsimple_stmt\x94K\xa4"
+    b"\x8c\x0bassert_stmt\x94K\xa5\x8c\x08del_stmt\x94K\xa6\x8c\texec_stmt\x94K\xa7\x8c"
+    b"\texpr_stmt\x94K\xa8\x8c\tflow_stmt\x94K\xa9\x8c\x0bglobal_stmt\x94K\xaa\x8c\x0bi"
+    b"mport_stmt\x94K\xab\x8c\tpass_stmt\x94K\xac\x8c\nprint_stmt\x94K\xad\x8c\ttype_st"
+    b"mt\x94K\xae\x8c\x07sliceop\x94K\xaf\x8c\tsubscript\x94K\xb0\x8c\x07lambdef\x94K"
+    b"\xb4\x8c\x05tname\x94K\xb5\x8c\x07tfplist\x94K\xb6\x8c\x06tfpdef\x94K\xb7\x8c\rsu"
+    b"bscriptlist\x94K\xb8\x8c\rexcept_clause\x94K\xba\x8c\ntname_star\x94K\xbb\x8c\tpa"
+    b"ramspec\x94K\xbc\x8c\x07typevar\x94K\xbd\x8c\x0ctypevartuple\x94K\xbe\x8c\ttypepa"
+    b"ram\x94K\xbf\x8c\x06vfpdef\x94K\xc0\x8c\x05vname\x94K\xc1\x8c\x07vfplist\x94K\xc2"
+    b"\x8c\x08and_expr\x94K\xc3\x8c\tyield_arg\x94K\xc5u\x8c\x07version\x94K\x00K\x00"
+    b"\x86\x94\x8c\x05start\x94M\x00\x01\x8c\x0easync_keywords\x94\x89u."
+)
+
+PATTERN_GRAMMAR_HASH = (
+    "ee5ba5db3b6722a0e2fbe2560ebc1c883e72328ef9c3b4da1c7c5d1cc649bce3"
+)
+PATTERN_GRAMMAR_TABLES = (
+    b"\x80\x04\x95\xf2\x04\x00\x00\x00\x00\x00\x00}\x94(\x8c\rsymbol2number\x94}\x94("
+    b"\x8c\x07Matcher\x94M\x00\x01\x8c\x0bAlternative\x94M\x01\x01\x8c\x0cAlternatives"
+    b"\x94M\x02\x01\x8c\x07Details\x94M\x03\x01\x8c\x0bNegatedUnit\x94M\x04\x01\x8c\x08"
+    b"Repeater\x94M\x05\x01\x8c\x04Unit\x94M\x06\x01u\x8c\rnumber2symbol\x94}\x94(M\x00"
+    b"\x01h\x03M\x01\x01h\x04M\x02\x01h\x05M\x03\x01h\x06M\x04\x01h\x07M\x05\x01h\x08M"
+    b"\x06\x01h\tu\x8c\x06states\x94]\x94(]\x94(]\x94K\x01K\x01\x86\x94a]\x94K\x02K\x02"
+    b"\x86\x94a]\x94K\x00K\x02\x86\x94ae]\x94(]\x94(K\x08K\x01\x86\x94K\tK\x01\x86\x94e"
+    b"]\x94(K\x08K\x01\x86\x94K\tK\x01\x86\x94K\x00K\x01\x86\x94ee]\x94(]\x94K\nK\x01"
+    b"\x86\x94a]\x94(K\x0bK\x00\x86\x94K\x00K\x01\x86\x94ee]\x94(]\x94K\x0cK\x01\x86"
+    b"\x94a]\x94K\x01K\x02\x86\x94a]\x94K\rK\x03\x86\x94a]\x94K\x00K\x03\x86\x94ae]\x94"
+    b"(]\x94K\x05K\x01\x86\x94a]\x94(K\x03K\x02\x86\x94K\x06K\x03\x86\x94K\x07K\x04\x86"
+    b"\x94e]\x94K\x01K\x05\x86\x94a]\x94(K\x0eK\x04\x86\x94K\x00K\x03\x86\x94e]\x94K"
+    b"\x00K\x04\x86\x94a]\x94K\x0fK\x04\x86\x94ae]\x94(]\x94(K\x10K\x01\x86\x94K\x11K"
+    b"\x01\x86\x94K\x12K\x02\x86\x94e]\x94K\x00K\x01\x86\x94a]\x94K\x13K\x03\x86\x94a]"
+    b"\x94(K\x14K\x04\x86\x94K\x15K\x01\x86\x94e]\x94K\x13K\x05\x86\x94a]\x94K\x15K\x01"
+    b"\x86\x94ae]\x94(]\x94(K\x03K\x01\x86\x94K\x04K\x02\x86\x94K\x06K\x03\x86\x94K\x07"
+    b"K\x04\x86\x94e]\x94K\x01K\x05\x86\x94a]\x94K\x01K\x06\x86\x94a]\x94(K\x16K\x07"
+    b"\x86\x94K\x0eK\x04\x86\x94K\x17K\x08\x86\x94K\x00K\x03\x86\x94e]\x94(K\x17K\x08"
+    b"\x86\x94K\x00K\x04\x86\x94e]\x94K\x0fK\x04\x86\x94a]\x94K\x18K\x08\x86\x94a]\x94("
+    b"K\x03K\x01\x86\x94K\x04K\x02\x86\x94K\x06K\t\x86\x94K\x07K\x04\x86\x94e]\x94K\x00"
+    b"K\x08\x86\x94a]\x94(K\x0eK\x04\x86\x94K\x17K\x08\x86\x94K\x00K\t\x86\x94eee\x8c"
+    b"\x04dfas\x94}\x94(M\x00\x01h\x0e}\x94(K\x03K\x01K\x04K\x01K\x05K\x01K\x06K\x01K"
+    b"\x07K\x01u\x86\x94M\x01\x01h\x15}\x94(K\x03K\x01K\x04K\x01K\x05K\x01K\x06K\x01K"
+    b"\x07K\x01u\x86\x94M\x02\x01h\x1d}\x94(K\x03K\x01K\x04K\x01K\x05K\x01K\x06K\x01K"
+    b"\x07K\x01u\x86\x94M\x03\x01h#}\x94K\x0cK\x01s\x86\x94M\x04\x01h,}\x94K\x05K\x01s"
+    b"\x86\x94M\x05\x01h<}\x94(K\x10K\x01K\x11K\x01K\x12K\x01u\x86\x94M\x06\x01hL}\x94("
+    b"K\x03K\x01K\x04K\x01K\x06K\x01K\x07K\x01u\x86\x94u\x8c\x06labels\x94]\x94(K\x00"
+    b"\x8c\x05EMPTY\x94\x86\x94M\x02\x01N\x86\x94K\x00N\x86\x94K\x07N\x86\x94K\tN\x86"
+    b"\x94K\x01\x8c\x03not\x94\x86\x94K\x01N\x86\x94K\x03N\x86\x94M\x04\x01N\x86\x94M"
+    b"\x06\x01N\x86\x94M\x01\x01N\x86\x94K\x12N\x86\x94K\x14N\x86\x94K\x15N\x86\x94M"
+    b"\x03\x01N\x86\x94K\x08N\x86\x94K\x10N\x86\x94K\x0eN\x86\x94K\x1aN\x86\x94K\x02N"
+    b"\x86\x94K\x0cN\x86\x94K\x1bN\x86\x94K\x16N\x86\x94M\x05\x01N\x86\x94K\nN\x86\x94e"
+    b"\x8c\x08keywords\x94}\x94h\x85K\x05s\x8c\rsoft_keywords\x94}\x94\x8c\x06tokens"
+    b"\x94}\x94(K\x00K\x02K\x07K\x03K\tK\x04K\x01K\x06K\x03K\x07K\x12K\x0bK\x14K\x0cK"
+    b"\x15K\rK\x08K\x0fK\x10K\x10K\x0eK\x11K\x1aK\x12K\x02K\x13K\x0cK\x14K\x1bK\x15K"
+    b"\x16K\x16K\nK\x18u\x8c\x0csymbol2label\x94}\x94(\x8c\x0cAlternatives\x94K\x01\x8c"
+    b"\x0bNegatedUnit\x94K\x08\x8c\x04Unit\x94K\t\x8c\x0bAlternative\x94K\n\x8c\x07Deta"
+    b"ils\x94K\x0e\x8c\x08Repeater\x94K\x17u\x8c\x07version\x94K\x00K\x00\x86\x94\x8c"
+    b"\x05start\x94M\x00\x01\x8c\x0easync_keywords\x94\x89u."
+)
@@ -20,6 +20,7 @@ import io
 import os
 import logging
 import pkgutil
+import re
 import sys
 from typing import (
     Any,
@@ -40,7 +41,7 @@ from . import grammar, parse, token, tokenize, pgen
 from logging import Logger
 from ..pytree import NL
 from .grammar import Grammar
-from .tokenize import GoodTokenInfo
+from .tokenize import GoodTokenInfo, SourceToken
 
 Path = Union[str, "os.PathLike[str]"]
 
@@ -87,10 +88,20 @@ class TokenProxy:
         return self
 
     def __next__(self) -> Any:
+        # The ranges that end before the current position are done with;
+        # keeping them would make every token slower than the previous one.
+        release_ranges = self._release_ranges
+        while (
+            release_ranges
+            and release_ranges[0].end is not None
+            and release_ranges[0].end <= self._counter
+        ):
+            del release_ranges[0]
+
         # If the current position is already compromised (looked up)
         # return the eaten token, if not just go further on the given
         # token producer.
-        for release_range in self._release_ranges:
+        for release_range in release_ranges:
             assert release_range.end is not None
 
             start, end = release_range.start, release_range.end
@@ -114,25 +125,34 @@ class TokenProxy:
 
 
 class Driver:
-    def __init__(self, grammar: Grammar, logger: Optional[Logger] = None) -> None:
+    def __init__(
+        self,
+        grammar: Grammar,
+        logger: Optional[Logger] = None,
+        hooks: Optional[parse.Hooks] = None,
+    ) -> None:
         self.grammar = grammar
         if logger is None:
             logger = logging.getLogger(__name__)
         self.logger = logger
+        # Given to the parser, see parse.Parser.
+        self.hooks = hooks
 
     def parse_tokens(self, tokens: Iterable[GoodTokenInfo], debug: bool = False) -> NL:
         """Parse a series of tokens and return the syntax tree."""
         # XXX Move the prefix computation into a wrapper around tokenize.
         proxy = TokenProxy(tokens)
 
-        p = parse.Parser(self.grammar)
+        p = parse.Parser(self.grammar, hooks=self.hooks)
         p.setup(proxy=proxy)
 
         lineno = 1
         column = 0
         indent_columns: List[int] = []
         type = value = start = end = line_text = None
-        prefix = ""
+        # The whitespace and comments before the next token are joined once,
+        # when it is added.
+        prefix_parts: List[str] = []
 
         for quintuple in proxy:
             type, value, start, end, line_text = quintuple
@@ -140,19 +160,21 @@ class Driver:
                 assert (lineno, column) <= start, ((lineno, column), start)
                 s_lineno, s_column = start
                 if lineno < s_lineno:
-                    prefix += "\n" * (s_lineno - lineno)
+                    prefix_parts.append("\n" * (s_lineno - lineno))
                     lineno = s_lineno
                     column = 0
                 if column < s_column:
-                    prefix += line_text[column:s_column]
+                    prefix_parts.append(line_text[column:s_column])
                     column = s_column
             if type in (tokenize.COMMENT, tokenize.NL):
-                prefix += value
+                prefix_parts.append(value)
                 lineno, column = end
                 if value.endswith("\n"):
                     lineno += 1
                     column = 0
                 continue
+            prefix = "".join(prefix_parts)
+            prefix_parts.clear()
             if type == token.OP:
                 type = grammar.opmap[value]
             if debug:
@@ -172,9 +194,8 @@ class Driver:
                 if debug:
                     self.logger.debug("Stop.")
                 break
-            prefix = ""
             if type in {token.INDENT, token.DEDENT}:
-                prefix = _prefix
+                prefix_parts.append(_prefix)
             lineno, column = end
             if value.endswith("\n"):
                 lineno += 1
@@ -182,7 +203,9 @@ class Driver:
         else:
             # We never broke out -- EOF is too soon (how can this happen???)
             assert start is not None
-            raise parse.ParseError("incomplete input", type, value, (prefix, start))
+            raise parse.ParseError(
+                "incomplete input", type, value, ("".join(prefix_parts), start)
+            )
         assert p.rootnode is not None
         return p.rootnode
 
@@ -202,39 +225,99 @@ class Driver:
         with open(filename, encoding=encoding) as stream:
             return self.parse_stream(stream, debug)
 
+    def parse_source(
+        self, source: str, tokens: Iterable[SourceToken], debug: bool = False
+    ) -> NL:
+        """Parse the tokens of `source` and return the syntax tree.
+
+        The tokens come from tokenize.generate_source_tokens(), and the prefix
+        of each leaf is sliced from `source` once, when it is added. The source
+        must end with a newline.
+        """
+        proxy = TokenProxy(tokens)
+
+        p = parse.Parser(self.grammar, hooks=self.hooks)
+        p.setup(proxy=proxy)
+
+        indent_columns: List[int] = []
+        type = value = start = end = spos = None
+        # The offset of the whitespace and comments before the next token
+        prefix_start = 0
+
+        for type, value, start, end, spos in proxy:
+            if type in (tokenize.COMMENT, tokenize.NL):
+                continue
+            prefix = source[prefix_start:start]
+            if type == token.OP:
+                type = grammar.opmap[value]
+            if debug:
+                assert type is not None
+                self.logger.debug(
+                    "%s %r (prefix=%r)", token.tok_name[type], value, prefix
+                )
+            if type == token.INDENT:
+                indent_columns.append(end - start)
+                # The indentation goes in the prefix of the next token.
+                prefix = value = ""
+                next_prefix_start = prefix_start
+            elif type == token.DEDENT:
+                _indent_col = indent_columns.pop()
+                next_prefix_start = self._prefix_split(
+                    source, prefix_start, start, _indent_col
+                )
+                prefix = source[prefix_start:next_prefix_start]
+            else:
+                next_prefix_start = end
+            if p.addtoken(cast(int, type), value, (prefix, spos)):
+                if debug:
+                    self.logger.debug("Stop.")
+                break
+            prefix_start = next_prefix_start
+        else:
+            # We never broke out -- EOF is too soon (how can this happen???)
+            assert spos is not None
+            raise parse.ParseError(
+                "incomplete input", type, value, (source[prefix_start:end], spos)
+            )
+        assert p.rootnode is not None
+        return p.rootnode
+
     def parse_string(self, text: str, debug: bool = False) -> NL:
         """Parse a string and return the syntax tree."""
-        tokens = tokenize.generate_tokens(
-            io.StringIO(text).readline, grammar=self.grammar
-        )
-        return self.parse_tokens(tokens, debug)
+        if not text.endswith("\n"):
+            # The tokens after the last line are on a line of their own, which
+            # only the prefixes of parse_tokens() account for.
+            tokens = tokenize.generate_tokens(
+                io.StringIO(text).readline, grammar=self.grammar
+            )
+            return self.parse_tokens(tokens, debug)
+        source_tokens = tokenize.generate_source_tokens(text, grammar=self.grammar)
+        return self.parse_source(text, source_tokens, debug)
 
     def _partially_consume_prefix(self, prefix: str, column: int) -> Tuple[str, str]:
-        lines: List[str] = []
-        current_line = ""
-        current_column = 0
-        wait_for_nl = False
-        for char in prefix:
-            current_line += char
-            if wait_for_nl:
-                if char == "\n":
-                    if current_line.strip() and current_column < column:
-                        res = "".join(lines)
-                        return res, prefix[len(res) :]
-
-                    lines.append(current_line)
-                    current_line = ""
-                    current_column = 0
-                    wait_for_nl = False
-            elif char in " \t":
-                current_column += 1
-            elif char == "\n":
-                # unexpected empty line
-                current_column = 0
-            else:
-                # indent is finished
-                wait_for_nl = True
-        return "".join(lines), current_line
+        """Split `prefix` before its first comment indented less than `column`.
+
+        Blank lines go with the line after them, and an unfinished last line
+        goes in the second part.
+        """
+        pos = self._prefix_split(prefix, 0, len(prefix), column)
+        return prefix[:pos], prefix[pos:]
+
+    def _prefix_split(self, source: str, pos: int, end: int, column: int) -> int:
+        """Return where _partially_consume_prefix() splits source[pos:end]."""
+        while True:
+            match = _PREFIX_LINE.match(source, pos, end)
+            if not match:
+                break
+            if len(match.group(1)) < column and match.group(2).strip():
+                break
+            pos = match.end()
+        return pos
+
+
+# A line of a prefix with the blank lines before it: its indentation, and the
+# rest of the line.
+_PREFIX_LINE = re.compile(r"(?:[ \t]*\n)*([ \t]*)([^ \t\n][^\n]*\n)")
 
 
 def _generate_pickle_name(gt: Path, cache_dir: Optional[Path] = None) -> str:
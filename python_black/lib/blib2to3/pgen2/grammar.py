@@ -100,6 +100,14 @@ class Grammar:
     def dump(self, filename: Path) -> None:
         """Dump the grammar tables to a pickle file."""
 
+        with tempfile.NamedTemporaryFile(
+            dir=os.path.dirname(filename), delete=False
+        ) as f:
+            f.write(self.dumps(pickle.HIGHEST_PROTOCOL))
+        os.replace(f.name, filename)
+
+    def dumps(self, protocol: int = pickle.HIGHEST_PROTOCOL) -> bytes:
+        """Dump the grammar tables to a pickle bytes object."""
         # mypyc generates objects that don't have a __dict__, but they
         # do have __getstate__ methods that will return an equivalent
         # dictionary
@@ -107,12 +115,7 @@ class Grammar:
             d = self.__dict__
         else:
             d = self.__getstate__()  # type: ignore
-
-        with tempfile.NamedTemporaryFile(
-            dir=os.path.dirname(filename), delete=False
-        ) as f:
-            pickle.dump(d, f, pickle.HIGHEST_PROTOCOL)
-        os.replace(f.name, filename)
+        return pickle.dumps(d, protocol)
 
     def _update(self, attrs: Dict[str, Any]) -> None:
         for k, v in attrs.items():
@@ -9,7 +9,9 @@ See Parser/parser.c in the Python distribution for additional info on
 how this parsing engine works.
 
 """
+from array import array
 from contextlib import contextmanager
+from weakref import WeakKeyDictionary
 
 # Local imports
 from . import grammar, token, tokenize
@@ -34,8 +36,11 @@ if TYPE_CHECKING:
 
 Results = Dict[str, NL]
 Convert = Callable[[Grammar, RawNode], Union[Node, Leaf]]
-DFA = List[List[Tuple[int, int]]]
-DFAS = Tuple[DFA, Dict[int, int]]
+# Functions to call on each node of a type, once it is built, by type.
+Hooks = Dict[int, Callable[[NL], None]]
+# A stack entry is (the index of the first state of its DFA in the parse
+# table, the state in the DFA, the node).
+StackEntry = Tuple[int, int, RawNode]
 
 
 def lam_sub(grammar: Grammar, node: RawNode) -> NL:
@@ -47,13 +52,159 @@ def lam_sub(grammar: Grammar, node: RawNode) -> NL:
 DUMMY_NODE = (-1, None, None, None)
 
 
-def stack_copy(
-    stack: List[Tuple[DFAS, int, RawNode]]
-) -> List[Tuple[DFAS, int, RawNode]]:
+def stack_copy(stack: List[StackEntry]) -> List[StackEntry]:
     """Nodeless stack copy."""
     return [(dfa, label, DUMMY_NODE) for dfa, label, _ in stack]
 
 
+# The kinds of actions in a `ParseTable`.
+ERROR = 0
+SHIFT = 1
+PUSH = 2
+POP = 3
+
+
+class ParseTable:
+    """The DFAs of a grammar compiled into a dense table of actions.
+
+    The states of all the DFAs are numbered one after the other, the states
+    of the DFA of `symbol` starting at `bases[symbol - 256]`, and
+    `actions[state * nlabels + ilabel]` tells what to do with a token of
+    label `ilabel` in that state. An action is one of:
+
+    - `SHIFT | newstate << 2`: shift the token and go to `newstate`;
+    - `PUSH | newstate << 2 | (symbol - 256) << state_bits`: go to
+      `newstate`, then push the DFA of `symbol`;
+    - `POP`: the state is accepting and has no arc for the token;
+    - `ERROR`.
+
+    This is what looking through the arcs of the state would find, first
+    arc first, so the parser needs a single lookup per step.
+    `accept_only[state]` is 1 if the only arc of the state is its accepting
+    arc, so that the DFA is popped as soon as it is reached.
+    """
+
+    def __init__(self, grammar: Grammar) -> None:
+        self.nlabels = nlabels = len(grammar.labels)
+        symbols = sorted(grammar.dfas)
+        self.bases: List[int] = [0] * (symbols[-1] - 255)
+        nstates = 0
+        for symbol in symbols:
+            self.bases[symbol - 256] = nstates
+            nstates += len(grammar.dfas[symbol][0])
+
+        max_states = max(len(grammar.dfas[symbol][0]) for symbol in symbols)
+        self.state_bits = state_bits = 2 + (max_states - 1).bit_length()
+        max_action = (symbols[-1] - 256) << state_bits | (1 << state_bits) - 1
+        self.actions = array("H" if max_action < 1 << 16 else "I")
+        self.actions.extend(bytes(nstates * nlabels))
+        self.accept_only = array("B", bytes(nstates))
+
+        actions = self.actions
+        for symbol in symbols:
+            states, _ = grammar.dfas[symbol]
+            for state, arcs in enumerate(states):
+                index = self.bases[symbol - 256] + state
+                if arcs == [(0, state)]:
+                    self.accept_only[index] = 1
+
+                row = index * nlabels
+                for i, newstate in arcs:
+                    t = grammar.labels[i][0]
+                    if t >= 256:
+                        action = PUSH | newstate << 2 | (t - 256) << state_bits
+                        for ilabel in grammar.dfas[t][1]:
+                            if not actions[row + ilabel]:
+                                actions[row + ilabel] = action
+                    elif i and not actions[row + i]:
+                        actions[row + i] = SHIFT | newstate << 2
+
+                if (0, state) in arcs:
+                    for ilabel in range(nlabels):
+                        if not actions[row + ilabel]:
+                            actions[row + ilabel] = POP
+
+
+class StackFork:
+    """A copy-on-write view of a parser stack, to try tokens on it.
+
+    The entries of `stack` below `shared` are shared with the parser and never
+    modified. The ones pushed or changed since are in `top`, without nodes.
+    """
+
+    def __init__(self, table: ParseTable, stack: List[StackEntry]) -> None:
+        self.table = table
+        self.stack = stack
+        self.shared = len(stack)
+        self.top: List[Tuple[int, int]] = []
+
+    def _pop(self) -> Optional[Tuple[int, int]]:
+        if self.top:
+            return self.top.pop()
+        if self.shared:
+            self.shared -= 1
+            dfa, state, _ = self.stack[self.shared]
+            return dfa, state
+        return None
+
+    def addtoken(self, ilabel: int) -> bool:
+        """Add a token like `Parser._addtoken`; return False on a parse error."""
+        table = self.table
+        entry = self._pop()
+        while entry is not None:
+            dfa, state = entry
+            action = table.actions[(dfa + state) * table.nlabels + ilabel]
+            kind = action & 3
+            if kind == PUSH:
+                newstate = (action & (1 << table.state_bits) - 1) >> 2
+                self.top.append((dfa, newstate))
+                self.top.append((table.bases[action >> table.state_bits], 0))
+                entry = self._pop()
+
+            elif kind == SHIFT:
+                state = action >> 2
+                while table.accept_only[dfa + state]:
+                    entry = self._pop()
+                    if entry is None:
+                        return True
+                    dfa, state = entry
+                self.top.append((dfa, state))
+                return True
+
+            elif kind == POP:
+                entry = self._pop()
+
+            else:
+                return False
+
+        return False
+
+
+class SoftKeywordStats:
+    """Count the soft keywords that had to be looked past to be parsed."""
+
+    def __init__(self) -> None:
+        self.lookaheads = 0
+        self.backtracks = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {"lookaheads": self.lookaheads, "backtracks": self.backtracks}
+
+
+soft_keyword_stats = SoftKeywordStats()
+
+
+_parse_tables: "WeakKeyDictionary[Grammar, ParseTable]" = WeakKeyDictionary()
+
+
+def get_parse_table(grammar: Grammar) -> ParseTable:
+    """Return the parse table of `grammar`, compiling it on first use."""
+    table = _parse_tables.get(grammar)
+    if table is None:
+        table = _parse_tables[grammar] = ParseTable(grammar)
+    return table
+
+
 class Recorder:
     def __init__(self, parser: "Parser", ilabels: List[int], context: Context) -> None:
         self.parser = parser
@@ -171,7 +322,12 @@ class Parser:
 
     """
 
-    def __init__(self, grammar: Grammar, convert: Optional[Convert] = None) -> None:
+    def __init__(
+        self,
+        grammar: Grammar,
+        convert: Optional[Convert] = None,
+        hooks: Optional[Hooks] = None,
+    ) -> None:
         """Constructor.
 
         The grammar argument is a grammar.Grammar instance; see the
@@ -204,10 +360,17 @@ class Parser:
         An abstract syntax tree node may be anything; this is entirely
         up to the converter function.
 
+        The optional hooks argument maps node types to a function called
+        with each new Leaf or Node of that type, once its children are
+        built, which allows looking at the tree while it is built instead
+        of walking it afterwards.
+
         """
         self.grammar = grammar
+        self.table = get_parse_table(grammar)
         # See note in docstring above. TL;DR this is ignored.
         self.convert = convert or lam_sub
+        self.hooks = hooks
         self.is_backtracking = False
 
     def setup(self, proxy: "TokenProxy", start: Optional[int] = None) -> None:
@@ -225,12 +388,13 @@ class Parser:
         """
         if start is None:
             start = self.grammar.start
-        # Each stack entry is a tuple: (dfa, state, node).
+        # Each stack entry is a tuple: (dfa, state, node), where dfa is the
+        # index of the first state of the DFA in the parse table.
         # A node is a tuple: (type, value, context, children),
         # where children is a list of nodes or None, and context may be None.
         newnode: RawNode = (start, None, None, [])
-        stackentry = (self.grammar.dfas[start], 0, newnode)
-        self.stack: List[Tuple[DFAS, int, RawNode]] = [stackentry]
+        stackentry = (self.table.bases[start - 256], 0, newnode)
+        self.stack: List[StackEntry] = [stackentry]
         self.rootnode: Optional[NL] = None
         self.used_names: Set[str] = set()
         self.proxy = proxy
@@ -257,76 +421,146 @@ class Parser:
         # https://tree.science/what-the-backtracking.html
 
         with self.proxy.release() as proxy:
-            counter, force = 0, False
-            recorder = Recorder(self, ilabels, context)
-            recorder.add_token(type, value, raw=True)
+            soft_keyword_stats.lookaheads += 1
+            ilabel = self._lookahead(proxy, ilabels, value, context)
+            if ilabel is None:
+                soft_keyword_stats.backtracks += 1
+                ilabel = self._backtrack(proxy, ilabels, type, value, context)
+
+        return self._addtoken(ilabel, type, value, context)
+
+    def _lookahead(
+        self, proxy: "TokenProxy", ilabels: List[int], value: str, context: Context
+    ) -> Optional[int]:
+        """Choose between `ilabels` by trying the next tokens on forks of the stack.
+
+        This makes the same choice as `_backtrack()`, without copying the stack
+        or building nodes. Returns None if there is a soft keyword among the
+        tokens looked at, which needs backtracking.
+        """
+        forks = {ilabel: StackFork(self.table, self.stack) for ilabel in ilabels}
+        dead = {ilabel for ilabel, fork in forks.items() if not fork.addtoken(ilabel)}
+
+        counter = 0
+        next_token_value = value
+        while True:
+            alive = dead.symmetric_difference(ilabels)
+            if not alive:
+                *_, most_successful_ilabel = dead
+                raise ParseError(
+                    "bad input", most_successful_ilabel, next_token_value, context
+                )
 
-            next_token_value = value
-            while recorder.determine_route(next_token_value) is None:
-                if not proxy.can_advance(counter):
-                    force = True
-                    break
+            ilabel, *rest = alive
+            if not rest or not proxy.can_advance(counter):
+                return ilabel
 
-                next_token_type, next_token_value, *_ = proxy.eat(counter)
-                if next_token_type in (tokenize.COMMENT, tokenize.NL):
-                    counter += 1
-                    continue
+            next_token_type, next_token_value, *_ = proxy.eat(counter)
+            counter += 1
+            if next_token_type in (tokenize.COMMENT, tokenize.NL):
+                continue
 
-                if next_token_type == tokenize.OP:
-                    next_token_type = grammar.opmap[next_token_value]
+            if next_token_type == tokenize.OP:
+                next_token_type = grammar.opmap[next_token_value]
 
-                recorder.add_token(next_token_type, next_token_value)
+            try:
+                next_ilabels = self.classify(next_token_type, next_token_value, context)
+            except ParseError:
+                dead.update(alive)
+                continue
+            if len(next_ilabels) > 1:
+                return None
+
+            for ilabel in alive:
+                if not forks[ilabel].addtoken(next_ilabels[0]):
+                    dead.add(ilabel)
+
+    def _backtrack(
+        self,
+        proxy: "TokenProxy",
+        ilabels: List[int],
+        type: int,
+        value: str,
+        context: Context,
+    ) -> int:
+        """Choose between `ilabels` by parsing the next tokens with each of them.
+
+        The tokens already eaten from `proxy` are replayed.
+        """
+        counter, force = 0, False
+        recorder = Recorder(self, ilabels, context)
+        recorder.add_token(type, value, raw=True)
+
+        next_token_value = value
+        while recorder.determine_route(next_token_value) is None:
+            if not proxy.can_advance(counter):
+                force = True
+                break
+
+            next_token_type, next_token_value, *_ = proxy.eat(counter)
+            if next_token_type in (tokenize.COMMENT, tokenize.NL):
                 counter += 1
+                continue
 
-            ilabel = cast(int, recorder.determine_route(next_token_value, force=force))
-            assert ilabel is not None
+            if next_token_type == tokenize.OP:
+                next_token_type = grammar.opmap[next_token_value]
 
-        return self._addtoken(ilabel, type, value, context)
+            recorder.add_token(next_token_type, next_token_value)
+            counter += 1
+
+        ilabel = cast(int, recorder.determine_route(next_token_value, force=force))
+        assert ilabel is not None
+        return ilabel
 
     def _addtoken(self, ilabel: int, type: int, value: str, context: Context) -> bool:
+        table = self.table
+        actions = table.actions
+        nlabels = table.nlabels
+        state_bits = table.state_bits
+        state_mask = (1 << state_bits) - 1
+        stack = self.stack
         # Loop until the token is shifted; may raise exceptions
         while True:
-            dfa, state, node = self.stack[-1]
-            states, first = dfa
-            arcs = states[state]
-            # Look for a state with this label
-            for i, newstate in arcs:
-                t = self.grammar.labels[i][0]
-                if t >= 256:
-                    # See if it's a symbol and if we're in its first set
-                    itsdfa = self.grammar.dfas[t]
-                    itsstates, itsfirst = itsdfa
-                    if ilabel in itsfirst:
-                        # Push a symbol
-                        self.push(t, itsdfa, newstate, context)
-                        break  # To continue the outer while loop
-
-                elif ilabel == i:
-                    # Look it up in the list of labels
-                    # Shift a token; we're done with it
-                    self.shift(type, value, newstate, context)
-                    # Pop while we are in an accept-only state
-                    state = newstate
-                    while states[state] == [(0, state)]:
-                        self.pop()
-                        if not self.stack:
-                            # Done parsing!
-                            return True
-                        dfa, state, node = self.stack[-1]
-                        states, first = dfa
-                    # Done with this token
-                    return False
+            dfa, state, node = stack[-1]
+            action = actions[(dfa + state) * nlabels + ilabel]
+            kind = action & 3
+            if kind == PUSH:
+                # Push a symbol. This is by far the most frequent step, so
+                # push() is inlined.
+                t = (action >> state_bits) + 256
+                newdfa = table.bases[t - 256]
+                newstate = (action & state_mask) >> 2
+                if self.is_backtracking:
+                    stack[-1] = (dfa, newstate, DUMMY_NODE)
+                    stack.append((newdfa, 0, DUMMY_NODE))
+                else:
+                    stack[-1] = (dfa, newstate, node)
+                    stack.append((newdfa, 0, (t, None, context, [])))
+
+            elif kind == SHIFT:
+                # Shift a token; we're done with it
+                state = action >> 2
+                self.shift(type, value, state, context)
+                # Pop while we are in an accept-only state
+                while table.accept_only[dfa + state]:
+                    self.pop()
+                    if not stack:
+                        # Done parsing!
+                        return True
+                    dfa, state, node = stack[-1]
+                # Done with this token
+                return False
+
+            elif kind == POP:
+                # An accepting state, pop it and try something else
+                self.pop()
+                if not stack:
+                    # Done parsing, but another token is input
+                    raise ParseError("too much input", type, value, context)
 
             else:
-                if (0, state) in arcs:
-                    # An accepting state, pop it and try something else
-                    self.pop()
-                    if not self.stack:
-                        # Done parsing, but another token is input
-                        raise ParseError("too much input", type, value, context)
-                else:
-                    # No success finding a transition
-                    raise ParseError("bad input", type, value, context)
+                # No success finding a transition
+                raise ParseError("bad input", type, value, context)
 
     def classify(self, type: int, value: str, context: Context) -> List[int]:
         """Turn a token into a label.  (Internal)
@@ -360,11 +594,15 @@ class Parser:
             dfa, state, node = self.stack[-1]
             rawnode: RawNode = (type, value, context, None)
             newnode = convert(self.grammar, rawnode)
+            if self.hooks:
+                hook = self.hooks.get(type)
+                if hook is not None:
+                    hook(newnode)
             assert node[-1] is not None
             node[-1].append(newnode)
             self.stack[-1] = (dfa, newstate, node)
 
-    def push(self, type: int, newdfa: DFAS, newstate: int, context: Context) -> None:
+    def push(self, type: int, newdfa: int, newstate: int, context: Context) -> None:
         """Push a nonterminal.  (Internal)"""
         if self.is_backtracking:
             dfa, state, _ = self.stack[-1]
@@ -382,7 +620,17 @@ class Parser:
             self.stack.pop()
         else:
             popdfa, popstate, popnode = self.stack.pop()
-            newnode = convert(self.grammar, popnode)
+            children = popnode[-1]
+            assert children is not None
+            # Most nodes only have one child, which convert() would return.
+            if len(children) == 1:
+                newnode = children[0]
+            else:
+                newnode = convert(self.grammar, popnode)
+                if self.hooks:
+                    hook = self.hooks.get(newnode.type)
+                    if hook is not None:
+                        hook(newnode)
             if self.stack:
                 dfa, state, node = self.stack[-1]
                 assert node[-1] is not None
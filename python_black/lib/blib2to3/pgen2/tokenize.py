@@ -7,8 +7,8 @@
 
 generate_tokens(readline) is a generator that breaks a stream of
 text into Python tokens.  It accepts a readline-like method which is called
-repeatedly to get the next line of input (or "" for EOF).  It generates
-5-tuples with these members:
+repeatedly to get the lines of input up to EOF (""), all of them before the
+first token.  It generates 5-tuples with these members:
 
     the token type (see token.py)
     the token (a string)
@@ -20,6 +20,9 @@ It is designed to match the working of the Python tokenizer exactly, except
 that it produces COMMENT tokens for comments and gives type OP for all
 operators
 
+generate_source_tokens(source) does the same work on a string, and gives
+offsets into it instead of copies of the lines.
+
 Older entry points
     tokenize_loop(readline, tokeneater)
     tokenize(readline, tokeneater=printtoken)
@@ -50,13 +53,16 @@ __author__ = "Ka-Ping Yee <ping@lfw.org>"
 __credits__ = "GvR, ESR, Tim Peters, Thomas Wouters, Fred Drake, Skip Montanaro"
 
 import re
+from bisect import bisect_left
 from codecs import BOM_UTF8, lookup
+from itertools import accumulate
 
 from . import token
 
 __all__ = [x for x in dir(token) if x[0] != "_"] + [
     "tokenize",
     "generate_tokens",
+    "generate_source_tokens",
     "untokenize",
 ]
 del token
@@ -143,6 +149,25 @@ PseudoExtras = group(r"\\\r?\n", Comment, Triple)
 PseudoToken = Whitespace + group(PseudoExtras, Number, Funny, ContStr, Name)
 
 pseudoprog: Final = re.compile(PseudoToken, re.UNICODE)
+
+# The alternatives of PseudoToken in the same order, named after the kind of
+# token they match. The fast path of generate_source_tokens() only takes the
+# tokens that need no more checks: names with an ASCII initial, numbers,
+# operators, newlines, comments and strings on one line.
+_fast_alternatives = [
+    r"(?P<continuation>\\\r?\n)",
+    f"(?P<comment>{Comment})",
+    f"(?P<triple>{Triple})",
+    f"(?P<number>{Number})",
+    f"(?P<op>{Operator}|{Bracket}|[:;.,`@])",
+    r"(?P<newline>\r?\n)",
+    f"(?P<string>{ContStr})",
+    f"(?P<name>(?=[A-Za-z_]){Name})",
+    f"(?P<other_name>{Name})",
+]
+FastToken = Whitespace + "(?:" + "|".join(_fast_alternatives) + ")"
+
+fastprog: Final = re.compile(FastToken, re.UNICODE)
 single3prog = re.compile(Single3)
 double3prog = re.compile(Double3)
 
@@ -225,6 +250,7 @@ def tokenize_loop(readline: Callable[[], str], tokeneater: TokenEater) -> None:
 
 
 GoodTokenInfo = Tuple[int, str, Coord, Coord, str]
+SourceToken = Tuple[int, Optional[str], int, int, Coord]
 TokenInfo = Union[Tuple[int, str], GoodTokenInfo]
 
 
@@ -415,6 +441,12 @@ def generate_tokens(
     can be a callable function terminating with StopIteration:
         readline = open(myfile).next    # Example of alternate readline
 
+    Unlike the tokenizer it replaced, it isn't driven by the lines: readline
+    is called until EOF before the first token is produced, and the whole
+    input is then tokenized by generate_source_tokens().  A stream is read
+    to its end, and an interactive reader blocks until it ends, so input
+    that has to be tokenized as it arrives can't be given to it.
+
     The generator produces 5-tuples with these members: the token type; the
     token string; a 2-tuple (srow, scol) of ints specifying the row and
     column where the token begins in the source; a 2-tuple (erow, ecol) of
@@ -422,74 +454,119 @@ def generate_tokens(
     and the line on which the token was found. The line passed is the
     logical line; continuation lines are included.
     """
+    lines: List[str] = []
+    while 1:
+        try:
+            line = readline()
+        except StopIteration:
+            line = ""
+        if not line:
+            break
+        lines.append(line)
+
+    source = "".join(lines)
+    line_ends = list(accumulate(map(len, lines)))
+    for type, value, start, end, spos in generate_source_tokens(
+        source, grammar, line_ends
+    ):
+        if start == len(source) and type in (DEDENT, ENDMARKER):
+            yield (type, "", spos, spos, "")  # after the last line
+            continue
+
+        if value is None:
+            value = source[start:end]
+        srow, scol = spos
+        if end > line_ends[srow - 1]:  # a string continued on other lines
+            erow = bisect_left(line_ends, end) + 1
+            epos = (erow, end - line_ends[erow - 2])
+            if type == ERRORTOKEN:  # unterminated, the last line is left out
+                erow -= 1
+            line = "".join(lines[srow - 1 : erow])
+        else:
+            epos = (srow, scol + len(value))
+            line = lines[srow - 1]
+        yield (type, value, spos, epos, line)
+
+
+def generate_source_tokens(
+    source: str,
+    grammar: Optional[Grammar] = None,
+    line_ends: Optional[Iterable[int]] = None,
+    fast: bool = True,
+) -> Iterator[SourceToken]:
+    """Break `source` into tokens, like generate_tokens().
+
+    The tokens are 5-tuples with these members: the token type; the token
+    string, or None for COMMENT and NL tokens; the offsets where the token
+    starts and ends in `source`; and a 2-tuple (srow, scol) of ints specifying
+    the row and column where the token begins. The source is never split
+    into lines, a token string is only sliced from it when the token can
+    become a leaf.
+
+    Lines end after each newline, unless `line_ends` gives their end offsets.
+    Most tokens are matched by a fast path, which `fast` turns off; both give
+    the same tokens.
+    """
     lnum = parenlev = continued = 0
     numchars: Final[str] = "0123456789"
-    contstr, needcont = "", 0
-    contline: Optional[str] = None
+    contstart: Optional[int] = None
+    needcont = 0
     indents = [0]
 
     # If we know we're parsing 3.7+, we can unconditionally parse `async` and
     # `await` as keywords.
     async_keywords = False if grammar is None else grammar.async_keywords
     # 'stashed' and 'async_*' are used for async/await parsing
-    stashed: Optional[GoodTokenInfo] = None
+    stashed: Optional[SourceToken] = None
     async_def = False
     async_def_indent = 0
     async_def_nl = False
 
-    strstart: Tuple[int, int]
+    strstart: Coord
     endprog: Pattern[str]
 
-    while 1:  # loop over lines in stream
-        try:
-            line = readline()
-        except StopIteration:
-            line = ""
+    eof = len(source)
+    ends = None if line_ends is None else iter(line_ends)
+    max = 0
+    while 1:  # loop over lines in source
+        # pos and max are offsets in source, columns are counted from line_start
+        pos = line_start = max
+        if ends is None:
+            max = source.find("\n", pos) + 1 or eof
+        else:
+            max = next(ends, eof)
         lnum += 1
-        pos, max = 0, len(line)
 
-        if contstr:  # continued string
-            assert contline is not None
-            if not line:
+        if contstart is not None:  # continued string
+            if line_start == max:
                 raise TokenError("EOF in multi-line string", strstart)
-            endmatch = endprog.match(line)
+            endmatch = endprog.match(source, pos, max)
             if endmatch:
                 pos = end = endmatch.end(0)
-                yield (
-                    STRING,
-                    contstr + line[:end],
-                    strstart,
-                    (lnum, end),
-                    contline + line,
-                )
-                contstr, needcont = "", 0
-                contline = None
-            elif needcont and line[-2:] != "\\\n" and line[-3:] != "\\\r\n":
-                yield (
-                    ERRORTOKEN,
-                    contstr + line,
-                    strstart,
-                    (lnum, len(line)),
-                    contline,
-                )
-                contstr = ""
-                contline = None
+                yield (STRING, source[contstart:end], contstart, end, strstart)
+                contstart, needcont = None, 0
+            elif (
+                needcont
+                and not source.endswith("\\\n", line_start, max)
+                and not source.endswith("\\\r\n", line_start, max)
+            ):
+                yield (ERRORTOKEN, source[contstart:max], contstart, max, strstart)
+                contstart = None
                 continue
             else:
-                contstr = contstr + line
-                contline = contline + line
                 continue
 
         elif parenlev == 0 and not continued:  # new statement
-            if not line:
+            if line_start == max:
                 break
             column = 0
             while pos < max:  # measure leading whitespace
-                if line[pos] == " ":
+                char = source[pos]
+                if char == " ":
                     column += 1
-                elif line[pos] == "\t":
+                elif char == "\t":
                     column = (column // tabsize + 1) * tabsize
-                elif line[pos] == "\f":
+                elif char == "\f":
                     column = 0
                 else:
                     break
@@ -501,32 +578,28 @@ def generate_tokens(
                 yield stashed
                 stashed = None
 
-            if line[pos] in "\r\n":  # skip blank lines
-                yield (NL, line[pos:], (lnum, pos), (lnum, len(line)), line)
+            char = source[pos]
+            if char in "\r\n":  # skip blank lines
+                yield (NL, None, pos, max, (lnum, pos - line_start))
                 continue
 
-            if line[pos] == "#":  # skip comments
-                comment_token = line[pos:].rstrip("\r\n")
-                nl_pos = pos + len(comment_token)
-                yield (
-                    COMMENT,
-                    comment_token,
-                    (lnum, pos),
-                    (lnum, nl_pos),
-                    line,
-                )
-                yield (NL, line[nl_pos:], (lnum, nl_pos), (lnum, len(line)), line)
+            if char == "#":  # skip comments
+                nl_pos = max
+                while nl_pos > pos and source[nl_pos - 1] in "\r\n":
+                    nl_pos -= 1
+                yield (COMMENT, None, pos, nl_pos, (lnum, pos - line_start))
+                yield (NL, None, nl_pos, max, (lnum, nl_pos - line_start))
                 continue
 
             if column > indents[-1]:  # count indents
                 indents.append(column)
-                yield (INDENT, line[:pos], (lnum, 0), (lnum, pos), line)
+                yield (INDENT, source[line_start:pos], line_start, pos, (lnum, 0))
 
             while column < indents[-1]:  # count dedents
                 if column not in indents:
                     raise IndentationError(
                         "unindent does not match any outer indentation level",
-                        ("<tokenize>", lnum, pos, line),
+                        ("<tokenize>", lnum, pos - line_start, source[line_start:max]),
                     )
                 indents = indents[:-1]
 
@@ -535,7 +608,7 @@ def generate_tokens(
                     async_def_nl = False
                     async_def_indent = 0
 
-                yield (DEDENT, "", (lnum, pos), (lnum, pos), line)
+                yield (DEDENT, "", pos, pos, (lnum, pos - line_start))
 
             if async_def and async_def_nl and async_def_indent >= indents[-1]:
                 async_def = False
@@ -543,141 +616,184 @@ def generate_tokens(
                 async_def_indent = 0
 
         else:  # continued statement
-            if not line:
+            if line_start == max:
                 raise TokenError("EOF in multi-line statement", (lnum, 0))
             continued = 0
 
         while pos < max:
-            pseudomatch = pseudoprog.match(line, pos)
-            if pseudomatch:  # scan for tokens
-                start, end = pseudomatch.span(1)
-                spos, epos, pos = (lnum, start), (lnum, end), end
-                token, initial = line[start:end], line[start]
-
-                if initial in numchars or (
-                    initial == "." and token != "."
-                ):  # ordinary number
-                    yield (NUMBER, token, spos, epos, line)
-                elif initial in "\r\n":
-                    newline = NEWLINE
+            # A stashed async NAME is also left to the general path.
+            fastmatch = None
+            if fast and not stashed:
+                fastmatch = fastprog.match(source, pos, max)
+            if fastmatch:
+                kind = fastmatch.lastgroup
+                start, end = fastmatch.span(kind)
+                if kind == "name":
+                    token_type = NAME
+                    token = source[start:end]
+                    if token == "async" or token == "await":
+                        token_type = None
+                elif kind == "op":
+                    token_type = OP
+                    token = source[start:end]
+                    initial = token[0]
+                    if initial in "([{":
+                        parenlev += 1
+                    elif initial in ")]}":
+                        parenlev -= 1
+                elif kind == "number":
+                    token_type = NUMBER
+                    token = source[start:end]
+                elif kind == "newline":
                     if parenlev > 0:
-                        newline = NL
-                    elif async_def:
+                        token_type, token = NL, None
+                    else:
+                        token_type, token = NEWLINE, source[start:end]
+                        if async_def:
+                            async_def_nl = True
+                elif kind == "comment":
+                    token_type, token = COMMENT, None
+                elif kind == "string" and source[end - 1] != "\n":
+                    token_type = STRING
+                    token = source[start:end]
+                else:  # left to the general path
+                    token_type = None
+                if token_type is not None:
+                    pos = end
+                    yield (token_type, token, start, end, (lnum, start - line_start))
+                    continue
+
+            pseudomatch = pseudoprog.match(source, pos, max)
+            if not pseudomatch:
+                yield (ERRORTOKEN, source[pos], pos, pos + 1, (lnum, pos - line_start))
+                pos += 1
+                continue
+
+            # scan for tokens
+            start, end = pseudomatch.span(1)
+            spos, pos = (lnum, start - line_start), end
+            initial = source[start]
+
+            if initial in "\r\n":
+                if parenlev > 0:
+                    newline, token = NL, None
+                else:
+                    newline, token = NEWLINE, source[start:end]
+                    if async_def:
                         async_def_nl = True
+                if stashed:
+                    yield stashed
+                    stashed = None
+                yield (newline, token, start, end, spos)
+                continue
+
+            if initial == "#":
+                if stashed:
+                    yield stashed
+                    stashed = None
+                yield (COMMENT, None, start, end, spos)
+                continue
+
+            token = source[start:end]
+            if initial in numchars or (
+                initial == "." and token != "."
+            ):  # ordinary number
+                yield (NUMBER, token, start, end, spos)
+            elif token in triple_quoted:
+                endprog = endprogs[token]
+                endmatch = endprog.match(source, pos, max)
+                if endmatch:  # all on one line
+                    pos = endmatch.end(0)
                     if stashed:
                         yield stashed
                         stashed = None
-                    yield (newline, token, spos, epos, line)
-
-                elif initial == "#":
-                    assert not token.endswith("\n")
+                    yield (STRING, source[start:pos], start, pos, spos)
+                else:
+                    strstart = spos  # multiple lines
+                    contstart = start
+                    break
+            elif (
+                initial in single_quoted
+                or token[:2] in single_quoted
+                or token[:3] in single_quoted
+            ):
+                if token[-1] == "\n":  # continued string
+                    strstart = spos
+                    maybe_endprog = (
+                        endprogs.get(initial)
+                        or endprogs.get(token[1])
+                        or endprogs.get(token[2])
+                    )
+                    assert maybe_endprog is not None, f"endprog not found for {token}"
+                    endprog = maybe_endprog
+                    contstart, needcont = start, 1
+                    break
+                else:  # ordinary string
                     if stashed:
                         yield stashed
                         stashed = None
-                    yield (COMMENT, token, spos, epos, line)
-                elif token in triple_quoted:
-                    endprog = endprogs[token]
-                    endmatch = endprog.match(line, pos)
-                    if endmatch:  # all on one line
-                        pos = endmatch.end(0)
-                        token = line[start:pos]
-                        if stashed:
-                            yield stashed
-                            stashed = None
-                        yield (STRING, token, spos, (lnum, pos), line)
-                    else:
-                        strstart = (lnum, start)  # multiple lines
-                        contstr = line[start:]
-                        contline = line
-                        break
-                elif (
-                    initial in single_quoted
-                    or token[:2] in single_quoted
-                    or token[:3] in single_quoted
-                ):
-                    if token[-1] == "\n":  # continued string
-                        strstart = (lnum, start)
-                        maybe_endprog = (
-                            endprogs.get(initial)
-                            or endprogs.get(token[1])
-                            or endprogs.get(token[2])
+                    yield (STRING, token, start, end, spos)
+            elif initial.isidentifier():  # ordinary name
+                if token in ("async", "await"):
+                    if async_keywords or async_def:
+                        yield (
+                            ASYNC if token == "async" else AWAIT,
+                            token,
+                            start,
+                            end,
+                            spos,
                         )
-                        assert (
-                            maybe_endprog is not None
-                        ), f"endprog not found for {token}"
-                        endprog = maybe_endprog
-                        contstr, needcont = line[start:], 1
-                        contline = line
-                        break
-                    else:  # ordinary string
-                        if stashed:
-                            yield stashed
-                            stashed = None
-                        yield (STRING, token, spos, epos, line)
-                elif initial.isidentifier():  # ordinary name
-                    if token in ("async", "await"):
-                        if async_keywords or async_def:
-                            yield (
-                                ASYNC if token == "async" else AWAIT,
-                                token,
-                                spos,
-                                epos,
-                                line,
-                            )
-                            continue
-
-                    tok = (NAME, token, spos, epos, line)
-                    if token == "async" and not stashed:
-                        stashed = tok
                         continue
 
-                    if token in ("def", "for"):
-                        if stashed and stashed[0] == NAME and stashed[1] == "async":
-                            if token == "def":
-                                async_def = True
-                                async_def_indent = indents[-1]
-
-                            yield (
-                                ASYNC,
-                                stashed[1],
-                                stashed[2],
-                                stashed[3],
-                                stashed[4],
-                            )
-                            stashed = None
-
-                    if stashed:
-                        yield stashed
+                tok = (NAME, token, start, end, spos)
+                if token == "async" and not stashed:
+                    stashed = tok
+                    continue
+
+                if token in ("def", "for"):
+                    if stashed and stashed[0] == NAME and stashed[1] == "async":
+                        if token == "def":
+                            async_def = True
+                            async_def_indent = indents[-1]
+
+                        yield (
+                            ASYNC,
+                            stashed[1],
+                            stashed[2],
+                            stashed[3],
+                            stashed[4],
+                        )
                         stashed = None
 
-                    yield tok
-                elif initial == "\\":  # continued stmt
-                    # This yield is new; needed for better idempotency:
-                    if stashed:
-                        yield stashed
-                        stashed = None
-                    yield (NL, token, spos, (lnum, pos), line)
-                    continued = 1
-                else:
-                    if initial in "([{":
-                        parenlev += 1
-                    elif initial in ")]}":
-                        parenlev -= 1
-                    if stashed:
-                        yield stashed
-                        stashed = None
-                    yield (OP, token, spos, epos, line)
+                if stashed:
+                    yield stashed
+                    stashed = None
+
+                yield tok
+            elif initial == "\\":  # continued stmt
+                # This yield is new; needed for better idempotency:
+                if stashed:
+                    yield stashed
+                    stashed = None
+                yield (NL, None, start, pos, spos)
+                continued = 1
             else:
-                yield (ERRORTOKEN, line[pos], (lnum, pos), (lnum, pos + 1), line)
-                pos += 1
+                if initial in "([{":
+                    parenlev += 1
+                elif initial in ")]}":
+                    parenlev -= 1
+                if stashed:
+                    yield stashed
+                    stashed = None
+                yield (OP, token, start, end, spos)
 
     if stashed:
         yield stashed
         stashed = None
 
     for indent in indents[1:]:  # pop remaining indent levels
-        yield (DEDENT, "", (lnum, 0), (lnum, 0), "")
-    yield (ENDMARKER, "", (lnum, 0), (lnum, 0), "")
+        yield (DEDENT, "", eof, eof, (lnum, 0))
+    yield (ENDMARKER, "", eof, eof, (lnum, 0))
 
 
 if __name__ == "__main__":  # testing
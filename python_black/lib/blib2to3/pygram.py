@@ -4,24 +4,23 @@
 """Export the Python grammar and symbols."""
 
 # Python imports
+import hashlib
+import io
 import os
+import threading
 
 from pathlib import Path
-from typing import Tuple
+from typing import Any, Callable, Dict, Iterator, Optional
+from warnings import warn
 
 # Local imports
-from .pgen2 import driver
+from .pgen2 import pgen
 
 from .pgen2.grammar import Grammar
+from . import _grammar_tables
 from ._Grammar import GRAMMAR
 from ._PatternGrammar import PATTERN_GRAMMAR
 
-# Moved into initialize because mypyc can't handle __file__ (XXX bug)
-# # The grammar file
-# _GRAMMAR_FILE = os.path.join(os.path.dirname(__file__), "Grammar.txt")
-# _PATTERN_GRAMMAR_FILE = os.path.join(os.path.dirname(__file__),
-#                                      "PatternGrammar.txt")
-
 
 class Symbols:
     def __init__(self, grammar: Grammar) -> None:
@@ -168,77 +167,202 @@ python_grammar_soft_keywords: Grammar
 python_symbols: _python_symbols
 pattern_symbols: _pattern_symbols
 
-File = Tuple[str, str]
-
+# Every Python this runs on can load pickles of this protocol.
+_TABLES_PROTOCOL = 4
+# _grammar_tables is written as Black formats it with this line length.
+_TABLES_LINE_LENGTH = 88
+
+
+def _grammar_hash(source: str) -> str:
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def _generate_grammar(source: str) -> Grammar:
+    return pgen.ParserGenerator("<grammar>", io.StringIO(source)).make_grammar()
+
+
+def _load_grammar(source: str, source_hash: str, tables: bytes) -> Grammar:
+    """Load the grammar of `source` from its tables in _grammar_tables.
+
+    The grammar is generated if the tables were written for another source.
+    """
+    if _grammar_hash(source) != source_hash:
+        return _generate_grammar(source)
+    g = Grammar()
+    g.loads(tables)
+    return g
+
+
+def _bytes_literal(data: bytes) -> str:
+    """Return the literal of `data` with the quotes Black would give it.
+
+    Black prefers double quotes, unless they need more backslashes.
+    """
+    literal = repr(data)
+    if literal.startswith("b'"):
+        body = literal[2:-1]
+        double_quoted = body.replace("\\'", "'").replace('"', '\\"')
+        if double_quoted.count("\\") <= body.count("\\"):
+            literal = f'b"{double_quoted}"'
+    return literal
+
+
+def _split_bytes(data: bytes, width: int) -> Iterator[str]:
+    """Split `data` into literals that fit in `width` columns."""
+    start = 0
+    while start < len(data):
+        end = start + 1
+        while end < len(data) and len(_bytes_literal(data[start : end + 1])) <= width:
+            end += 1
+        yield _bytes_literal(data[start:end])
+        start = end
+
+
+def write_tables() -> None:
+    """Write _grammar_tables from the grammars in _Grammar and _PatternGrammar.
+
+    The tables are pickled, which loads much faster than literals of them.
+    Run `python -m python_black.lib.blib2to3.pygram` after changing a grammar.
+    """
+    lines = [
+        "# Generated by `python -m python_black.lib.blib2to3.pygram`, do not edit."
+    ]
+    for name, source in (("GRAMMAR", GRAMMAR), ("PATTERN_GRAMMAR", PATTERN_GRAMMAR)):
+        tables = _generate_grammar(source).dumps(_TABLES_PROTOCOL)
+        lines.append("")
+        assignment = f'{name}_HASH = "{_grammar_hash(source)}"'
+        if len(assignment) > _TABLES_LINE_LENGTH:
+            assignment = f'{name}_HASH = (\n    "{_grammar_hash(source)}"\n)'
+        lines.append(assignment)
+        lines.append(f"{name}_TABLES = (")
+        lines.extend(
+            f"    {literal}"
+            for literal in _split_bytes(tables, _TABLES_LINE_LENGTH - 4)
+        )
+        lines.append(")")
+    path = os.path.join(os.path.dirname(__file__), "_grammar_tables.py")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def _load_python_grammar(soft_keywords: bool = False) -> Grammar:
+    """Load the Python grammar from its tables.
+
+    Only the 3.10+ grammar has soft keywords, the others are loaded without.
+    """
+    grammar = _load_grammar(
+        GRAMMAR, _grammar_tables.GRAMMAR_HASH, _grammar_tables.GRAMMAR_TABLES
+    )
+    if not soft_keywords:
+        grammar.soft_keywords.clear()
+    return grammar
 
-def _create_new_files(*files: File):
-    for file in files:
-        if os.path.exists(file[0]):
-            with open(file[0], "r") as f:
-                content = f.read()
 
-            if content.strip() != file[1].strip():
-                os.remove(file[0])
+# Python 2
+def _build_python2_grammar() -> Grammar:
+    grammar = _load_python_grammar()
+    grammar.version = (2, 0)
+    return grammar
 
-        if not os.path.exists(file[0]):
-            with open(file[0], "w") as f:
-                f.write(file[1])
 
+# Python 2 + from __future__ import print_function
+def _build_python2_print_function_grammar() -> Grammar:
+    grammar = _get("python_grammar").copy()
+    del grammar.keywords["print"]
+    return grammar
 
-def initialize(cache_dir: Path) -> None:
-    global python_grammar
-    global python_grammar_no_print_statement
-    global python_grammar_no_print_statement_no_exec_statement
-    global python_grammar_no_print_statement_no_exec_statement_async_keywords
-    global python_grammar_soft_keywords
-    global python_symbols
-    global pattern_grammar
-    global pattern_symbols
 
-    # The grammar file
-    _GRAMMAR_FILE = os.path.join(cache_dir, "Grammar.txt")
-    _PATTERN_GRAMMAR_FILE = os.path.join(cache_dir, "PatternGrammar.txt")
-    _create_new_files(
-        (_GRAMMAR_FILE, GRAMMAR),
-        (_PATTERN_GRAMMAR_FILE, PATTERN_GRAMMAR),
-    )
+# Python 3.0-3.6
+def _build_python3_0_grammar() -> Grammar:
+    grammar = _load_python_grammar()
+    del grammar.keywords["print"]
+    del grammar.keywords["exec"]
+    grammar.version = (3, 0)
+    return grammar
 
-    # Python 2
-    python_grammar = driver.load_packaged_grammar("blib2to3", _GRAMMAR_FILE, cache_dir)
-    python_grammar.version = (2, 0)
 
-    soft_keywords = python_grammar.soft_keywords.copy()
-    python_grammar.soft_keywords.clear()
+# Python 3.7+
+def _build_python3_7_grammar() -> Grammar:
+    grammar = _get("python_grammar_no_print_statement_no_exec_statement").copy()
+    grammar.async_keywords = True
+    grammar.version = (3, 7)
+    return grammar
 
-    python_symbols = _python_symbols(python_grammar)
 
-    # Python 2 + from __future__ import print_function
-    python_grammar_no_print_statement = python_grammar.copy()
-    del python_grammar_no_print_statement.keywords["print"]
+# Python 3.10+
+def _build_python3_10_grammar() -> Grammar:
+    grammar = _get(
+        "python_grammar_no_print_statement_no_exec_statement_async_keywords"
+    ).copy()
+    grammar.soft_keywords = _load_python_grammar(soft_keywords=True).soft_keywords
+    grammar.version = (3, 10)
+    return grammar
 
-    # Python 3.0-3.6
-    python_grammar_no_print_statement_no_exec_statement = python_grammar.copy()
-    del python_grammar_no_print_statement_no_exec_statement.keywords["print"]
-    del python_grammar_no_print_statement_no_exec_statement.keywords["exec"]
-    python_grammar_no_print_statement_no_exec_statement.version = (3, 0)
 
-    # Python 3.7+
-    python_grammar_no_print_statement_no_exec_statement_async_keywords = (
-        python_grammar_no_print_statement_no_exec_statement.copy()
+def _build_pattern_grammar() -> Grammar:
+    return _load_grammar(
+        PATTERN_GRAMMAR,
+        _grammar_tables.PATTERN_GRAMMAR_HASH,
+        _grammar_tables.PATTERN_GRAMMAR_TABLES,
     )
-    python_grammar_no_print_statement_no_exec_statement_async_keywords.async_keywords = (
-        True
-    )
-    python_grammar_no_print_statement_no_exec_statement_async_keywords.version = (3, 7)
 
-    # Python 3.10+
-    python_grammar_soft_keywords = (
-        python_grammar_no_print_statement_no_exec_statement_async_keywords.copy()
-    )
-    python_grammar_soft_keywords.soft_keywords = soft_keywords
-    python_grammar_soft_keywords.version = (3, 10)
 
-    pattern_grammar = driver.load_packaged_grammar(
-        "blib2to3", _PATTERN_GRAMMAR_FILE, cache_dir
-    )
-    pattern_symbols = _pattern_symbols(pattern_grammar)
+# The grammars and symbols are built the first time they are used, by
+# __getattr__(), so that a process only pays for the grammars it parses with.
+_BUILDERS: Dict[str, Callable[[], Any]] = {
+    "python_grammar": _build_python2_grammar,
+    "python_grammar_no_print_statement": _build_python2_print_function_grammar,
+    "python_grammar_no_print_statement_no_exec_statement": _build_python3_0_grammar,
+    "python_grammar_no_print_statement_no_exec_statement_async_keywords": (
+        _build_python3_7_grammar
+    ),
+    "python_grammar_soft_keywords": _build_python3_10_grammar,
+    "python_symbols": lambda: _python_symbols(
+        _get("python_grammar_no_print_statement_no_exec_statement")
+    ),
+    "pattern_grammar": _build_pattern_grammar,
+    "pattern_symbols": lambda: _pattern_symbols(_get("pattern_grammar")),
+}
+_build_lock = threading.RLock()
+
+
+def _get(name: str) -> Any:
+    """Return the grammar or symbols called `name`, building them if needed."""
+    namespace = globals()
+    if name not in namespace:
+        with _build_lock:
+            if name not in namespace:
+                namespace[name] = _BUILDERS[name]()
+    return namespace[name]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _BUILDERS:
+        return _get(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def initialize(cache_dir: Optional[Path] = None) -> None:
+    """Set up the grammars and their symbols.
+
+    The grammars are loaded from the tables in _grammar_tables, without
+    reading or writing any file, when they are first used: this only drops
+    the ones built before.
+
+    `cache_dir` is deprecated and ignored, since nothing is cached there anymore.
+    """
+    if cache_dir is not None:
+        warn(
+            "The `cache_dir` argument of initialize() is deprecated and ignored,"
+            " the grammars are loaded from the tables in _grammar_tables.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+    namespace = globals()
+    with _build_lock:
+        for name in _BUILDERS:
+            namespace.pop(name, None)
+
+
+if __name__ == "__main__":
+    write_tables()
@@ -18,12 +18,14 @@ from typing import (
     Iterator,
     List,
     Optional,
+    Sequence,
     Tuple,
     TypeVar,
     Union,
     Set,
     Iterable,
 )
+from .pgen2 import token
 from .pgen2.grammar import Grammar
 
 __author__ = "Guido van Rossum <guido@python.org>"
@@ -66,20 +68,70 @@ class Base:
     template pattern.
 
     A node may be a subnode of at most one parent.
+
+    Trees can have millions of nodes, so they have slots instead of a
+    __dict__. The attributes that few nodes have are kept in `_extra`.
     """
 
-    # Default values for instance variables
+    __slots__ = ("type", "parent", "was_changed", "_extra")
+
     type: int  # int: token number (< 256) or symbol number (>= 256)
-    parent: Optional["Node"] = None  # Parent node pointer, or None
-    children: List[NL]  # List of subnodes
-    was_changed: bool = False
-    was_checked: bool = False
+    parent: Optional["Node"]  # Parent node pointer, or None
+    children: Sequence[NL]  # Subnodes, a leaf has none
+    was_changed: bool
+    # The rarely set attributes, by name, or None if there are none
+    _extra: Optional[Dict[str, Any]]
 
     def __new__(cls, *args, **kwds):
         """Constructor that prevents Base from being instantiated."""
         assert cls is not Base, "Cannot instantiate Base"
         return object.__new__(cls)
 
+    def _get_extra(self, name: str) -> Any:
+        extra = self._extra
+        return None if extra is None else extra.get(name)
+
+    def _set_extra(self, name: str, value: Any) -> None:
+        extra = self._extra
+        if value is not None:
+            if extra is None:
+                extra = self._extra = {}
+            extra[name] = value
+        elif extra is not None:
+            extra.pop(name, None)
+            if not extra:
+                self._extra = None
+
+    @property
+    def used_names(self) -> Optional[Set[str]]:
+        """The names used in the tree, set on its root by the parser."""
+        return self._get_extra("used_names")
+
+    @used_names.setter
+    def used_names(self, used_names: Optional[Set[str]]) -> None:
+        self._set_extra("used_names", used_names)
+
+    @property
+    def features(self) -> Optional[Set[Any]]:
+        """
+        The features that Black found used in the tree while it was parsed,
+        set on the root and on its children. They aren't updated when the
+        tree changes.
+        """
+        return self._get_extra("features")
+
+    @features.setter
+    def features(self, features: Optional[Set[Any]]) -> None:
+        self._set_extra("features", features)
+
+    @property
+    def was_checked(self) -> bool:
+        return self._get_extra("was_checked") or False
+
+    @was_checked.setter
+    def was_checked(self, was_checked: bool) -> None:
+        self._set_extra("was_checked", was_checked or None)
+
     def __eq__(self, other: Any) -> bool:
         """
         Compare two nodes for equality.
@@ -182,7 +234,7 @@ class Base:
                 if node is self:
                     del self.parent.children[i]
                     self.parent.changed()
-                    self.parent.invalidate_sibling_maps()
+                    self.parent.relink_sibling_maps(i, i + 1, removed=self)
                     self.parent = None
                     return i
         return None
@@ -240,8 +292,9 @@ class Node(Base):
 
     """Concrete implementation for interior nodes."""
 
-    fixers_applied: Optional[List[Any]]
-    used_names: Optional[Set[str]]
+    __slots__ = ("children", "prev_sibling_map", "next_sibling_map")
+
+    children: List[NL]  # List of subnodes
 
     def __init__(
         self,
@@ -261,6 +314,9 @@ class Node(Base):
         """
         assert type >= 256, type
         self.type = type
+        self.parent = None
+        self.was_changed = False
+        self._extra = None
         self.children = list(children)
         for ch in self.children:
             assert ch.parent is None, repr(ch)
@@ -269,9 +325,15 @@ class Node(Base):
         if prefix is not None:
             self.prefix = prefix
         if fixers_applied:
-            self.fixers_applied = fixers_applied[:]
-        else:
-            self.fixers_applied = None
+            self._set_extra("fixers_applied", fixers_applied[:])
+
+    @property
+    def fixers_applied(self) -> Optional[List[Any]]:
+        return self._get_extra("fixers_applied")
+
+    @fixers_applied.setter
+    def fixers_applied(self, fixers_applied: Optional[List[Any]]) -> None:
+        self._set_extra("fixers_applied", fixers_applied)
 
     def __repr__(self) -> str:
         """Return a canonical string representation."""
@@ -348,7 +410,7 @@ class Node(Base):
         child.parent = self
         self.children.insert(i, child)
         self.changed()
-        self.invalidate_sibling_maps()
+        self.relink_sibling_maps(i, i + 2)
 
     def append_child(self, child: NL) -> None:
         """
@@ -364,6 +426,30 @@ class Node(Base):
         self.prev_sibling_map: Optional[Dict[int, Optional[NL]]] = None
         self.next_sibling_map: Optional[Dict[int, Optional[NL]]] = None
 
+    def relink_sibling_maps(
+        self, start: int, stop: int, removed: Optional[NL] = None
+    ) -> None:
+        """
+        Update the sibling maps, if they were made, after children were
+        inserted or removed: the children from `start` to `stop` (excluded) get
+        linked to the child before them. This keeps many changes to a node
+        with many children from making the maps again each time.
+        """
+        _prev = self.prev_sibling_map
+        _next = self.next_sibling_map
+        if _prev is None or _next is None:
+            return
+        if removed is not None:
+            _prev.pop(id(removed), None)
+            _next.pop(id(removed), None)
+        children = self.children
+        for i in range(start, min(stop, len(children) + 1)):
+            previous = children[i - 1] if i > 0 else None
+            current = children[i] if i < len(children) else None
+            if current is not None:
+                _prev[id(current)] = previous
+            _next[id(previous)] = current
+
     def update_sibling_maps(self) -> None:
         _prev: Dict[int, Optional[NL]] = {}
         _next: Dict[int, Optional[NL]] = {}
@@ -381,20 +467,24 @@ class Leaf(Base):
 
     """Concrete implementation for leaf nodes."""
 
-    # Default values for instance variables
+    __slots__ = (
+        "value",
+        "_prefix",
+        "lineno",
+        "column",
+        "bracket_depth",
+        "opening_bracket",
+    )
+
     value: str
-    fixers_applied: List[Any]
     bracket_depth: int
     # Changed later in brackets.py
-    opening_bracket: Optional["Leaf"] = None
-    used_names: Optional[Set[str]]
-    _prefix = ""  # Whitespace and comments preceding this token in the input
-    lineno: int = 0  # Line where this token starts in the input
-    column: int = 0  # Column where this token starts in the input
-    # If not None, this Leaf is created by converting a block of fmt off/skip
-    # code, and `fmt_pass_converted_first_leaf` points to the first Leaf in the
-    # converted code.
-    fmt_pass_converted_first_leaf: Optional["Leaf"] = None
+    opening_bracket: Optional["Leaf"]
+    _prefix: str  # Whitespace and comments preceding this token in the input
+    lineno: int  # Line where this token starts in the input
+    column: int  # Column where this token starts in the input
+    # Shared by all the leaves, so it can't be changed.
+    children: Sequence[NL] = ()
 
     def __init__(
         self,
@@ -416,14 +506,48 @@ class Leaf(Base):
         assert 0 <= type < 256, type
         if context is not None:
             self._prefix, (self.lineno, self.column) = context
+        else:
+            self._prefix = ""
+            self.lineno = self.column = 0
         self.type = type
         self.value = value
         if prefix is not None:
             self._prefix = prefix
-        self.fixers_applied: Optional[List[Any]] = fixers_applied[:]
-        self.children = []
+        self.parent = None
+        self.was_changed = False
+        self._extra = None
+        if fixers_applied:
+            self._set_extra("fixers_applied", fixers_applied[:])
         self.opening_bracket = opening_bracket
-        self.fmt_pass_converted_first_leaf = fmt_pass_converted_first_leaf
+        if fmt_pass_converted_first_leaf is not None:
+            self._set_extra(
+                "fmt_pass_converted_first_leaf", fmt_pass_converted_first_leaf
+            )
+
+    @property
+    def fixers_applied(self) -> List[Any]:
+        fixers_applied = self._get_extra("fixers_applied")
+        if fixers_applied is None:
+            fixers_applied = []
+            self._set_extra("fixers_applied", fixers_applied)
+        return fixers_applied
+
+    @fixers_applied.setter
+    def fixers_applied(self, fixers_applied: List[Any]) -> None:
+        self._set_extra("fixers_applied", fixers_applied)
+
+    @property
+    def fmt_pass_converted_first_leaf(self) -> Optional["Leaf"]:
+        """
+        If not None, this Leaf is created by converting a block of fmt off/skip
+        code, and `fmt_pass_converted_first_leaf` points to the first Leaf in
+        the converted code.
+        """
+        return self._get_extra("fmt_pass_converted_first_leaf")
+
+    @fmt_pass_converted_first_leaf.setter
+    def fmt_pass_converted_first_leaf(self, leaf: Optional["Leaf"]) -> None:
+        self._set_extra("fmt_pass_converted_first_leaf", leaf)
 
     def __repr__(self) -> str:
         """Return a canonical string representation."""
@@ -455,7 +579,7 @@ class Leaf(Base):
             self.type,
             self.value,
             (self.prefix, (self.lineno, self.column)),
-            fixers_applied=self.fixers_applied,
+            fixers_applied=self._get_extra("fixers_applied") or [],
         )
 
     def leaves(self) -> Iterator["Leaf"]:
@@ -499,6 +623,9 @@ def convert(gr: Grammar, raw_node: RawNode) -> NL:
             return children[0]
         return Node(type, children, context=context)
     else:
+        # Names, keywords and operators come up again and again.
+        if value and type != token.STRING:
+            value = sys.intern(value)
         return Leaf(type, value or "", context=context)
 
 
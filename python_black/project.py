@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Format all the Python files of a folder, like running `black` on it.
+
+The files are found with `gen_python_files`, skipped when the cache of
+Black says they are already formatted, and formatted by `reformat_many` on a
+process pool.  This runs in a plain Python interpreter, since the plugin host
+of Sublime Text can't start worker processes:
+
+    python -m python_black.project ROOT PARAMS
+
+`PARAMS` is a JSON object with the `mode` (see `protocol.py`), the
+`include`, `exclude`, `extend_exclude` and `force_exclude` regular
+expressions, the paths to `skip` and the number of `workers`.  A line is
+printed for each reformatted or failed file, and a summary at the end.
+
+It must not import `sublime`.
+"""
+
+import argparse
+import json
+import re
+import sys
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Pattern
+
+from .lib.black import WriteBack
+from .lib.black.concurrency import reformat_many
+from .lib.black.const import DEFAULT_EXCLUDES, DEFAULT_INCLUDES
+from .lib.black.files import gen_python_files, get_gitignore
+from .lib.black.report import Changed, Report
+from .protocol import mode_from_dict
+
+# Print the progress every this many files that were left unchanged.
+PROGRESS_INTERVAL = 200
+
+
+def compile_pattern(regex: str) -> Pattern[str]:
+    """Compile `regex`, in verbose mode if it spans several lines like Black does."""
+    if "\n" in regex:
+        regex = "(?x)" + regex
+    return re.compile(regex)
+
+
+@dataclass
+class ProgressReport(Report):
+    """Print a line as soon as a file is reformatted or fails."""
+
+    total: int = 0
+
+    @property
+    def count(self) -> int:
+        return self.change_count + self.same_count + self.failure_count
+
+    def done(self, src: Path, changed: Changed) -> None:
+        if changed is Changed.YES:
+            self.change_count += 1
+            self._print(f"reformatted {src}")
+        else:
+            self.same_count += 1
+            if self.count % PROGRESS_INTERVAL == 0 or self.count == self.total:
+                self._print("unchanged")
+
+    def failed(self, src: Path, message: str) -> None:
+        self.failure_count += 1
+        self._print(f"error: cannot format {src}: {message}")
+
+    def _print(self, message: str) -> None:
+        print(f"[{self.count}/{self.total}] {message}", flush=True)
+
+
+def format_project(root: Path, params: Dict[str, Any]) -> ProgressReport:
+    include = compile_pattern(params.get("include") or DEFAULT_INCLUDES)
+    exclude = params.get("exclude")
+    extend_exclude = params.get("extend_exclude")
+    force_exclude = params.get("force_exclude")
+    skip = {Path(path).resolve() for path in params.get("skip") or []}
+
+    report = ProgressReport()
+    # Like Black, `.gitignore` is only used when `exclude` isn't configured.
+    sources = {
+        path
+        for path in gen_python_files(
+            root.iterdir(),
+            root,
+            include,
+            compile_pattern(exclude or DEFAULT_EXCLUDES),
+            compile_pattern(extend_exclude) if extend_exclude else None,
+            compile_pattern(force_exclude) if force_exclude else None,
+            report,
+            None if exclude else {root: get_gitignore(root)},
+            verbose=False,
+            quiet=True,
+        )
+        # Notebooks need dependencies that aren't vendored.
+        if path.suffix != ".ipynb" and path.resolve() not in skip
+    }
+    report.total = len(sources)
+    print(f"formatting {report.total} files in {root}", flush=True)
+    if sources:
+        reformat_many(
+            sources=sources,
+            fast=False,
+            write_back=WriteBack.YES,
+            mode=mode_from_dict(params["mode"]),
+            report=report,
+            workers=params.get("workers") or None,
+        )
+    return report
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="python-black project formatter")
+    parser.add_argument("root", help="the folder to format")
+    parser.add_argument("params", help="the formatting parameters, as JSON")
+    args = parser.parse_args(argv)
+
+    report = format_project(Path(args.root).resolve(), json.loads(args.params))
+    print(str(report) if report.total else "No Python files to format.", flush=True)
+    return report.return_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
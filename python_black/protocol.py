@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Framing shared by the formatter daemon and its client.
+
+Every message is a JSON object preceded by its size in bytes, packed as a
+4-byte big-endian unsigned integer.
+
+Requests look like `{"id": 1, "method": "format", "params": {...}}`, and
+responses carry the same `id` with either a `result` or an `error` object
+made of the exception `type` and its `message`.
+"""
+
+import json
+import struct
+
+from typing import Any, BinaryIO, Dict, Optional
+
+from .lib.black.mode import Mode, TargetVersion
+
+HEADER = struct.Struct(">I")
+MAX_FRAME_SIZE = 256 * 1024 * 1024
+
+Message = Dict[str, Any]
+
+
+class ProtocolError(Exception):
+    """Raised when a frame is malformed."""
+
+
+def encode_frame(message: Message) -> bytes:
+    data = json.dumps(message, separators=(",", ":")).encode("utf-8")
+    return HEADER.pack(len(data)) + data
+
+
+def write_frame(stream: BinaryIO, message: Message) -> None:
+    stream.write(encode_frame(message))
+    stream.flush()
+
+
+def _read_exactly(stream: BinaryIO, size: int) -> Optional[bytes]:
+    chunks = []
+    remaining = size
+    while remaining:
+        chunk = stream.read(remaining)
+        if not chunk:
+            if remaining == size:
+                return None
+            raise ProtocolError("connection closed in the middle of a frame")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def read_frame(stream: BinaryIO) -> Optional[Message]:
+    """Read the next message from `stream`, or return None at the end of the stream."""
+    header = _read_exactly(stream, HEADER.size)
+    if header is None:
+        return None
+
+    (size,) = HEADER.unpack(header)
+    if size > MAX_FRAME_SIZE:
+        raise ProtocolError(f"frame of {size} bytes exceeds the size limit")
+
+    data = _read_exactly(stream, size)
+    if data is None:
+        raise ProtocolError("connection closed before the frame body")
+
+    message = json.loads(data.decode("utf-8"))
+    if not isinstance(message, dict):
+        raise ProtocolError("a frame must contain a JSON object")
+    return message
+
+
+def mode_to_dict(mode: Mode) -> Message:
+    return {
+        "target_versions": sorted(v.name for v in mode.target_versions),
+        "line_length": mode.line_length,
+        "string_normalization": mode.string_normalization,
+        "is_pyi": mode.is_pyi,
+        "skip_source_first_line": mode.skip_source_first_line,
+        "magic_trailing_comma": mode.magic_trailing_comma,
+        "preview": mode.preview,
+    }
+
+
+def mode_from_dict(params: Message) -> Mode:
+    return Mode(
+        target_versions={TargetVersion[v] for v in params.get("target_versions", [])},
+        line_length=params["line_length"],
+        string_normalization=params["string_normalization"],
+        is_pyi=params["is_pyi"],
+        skip_source_first_line=params["skip_source_first_line"],
+        magic_trailing_comma=params["magic_trailing_comma"],
+        preview=params.get("preview", False),
+    )
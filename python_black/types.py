@@ -1,10 +1,20 @@
 #!/usr/bin/env python3
 # -*- coding:utf-8 -*-
 
-from typing import TypedDict, List
+from typing import TypedDict, List, Union
 from .mode import Mode
 
 
+class DaemonSettings(TypedDict):
+    enabled: bool
+    python: str
+    socket: str
+    workers: int
+    line_workers: int
+    parse_workers: int
+    timeout: int
+
+
 class BlackConfig(TypedDict):
     target_version: List[str]
     line_length: int
@@ -17,4 +27,11 @@ class BlackConfig(TypedDict):
 
 class SublimeSettings(TypedDict):
     format_on_save: Mode
+    format_on_save_async: bool
+    format_on_save_deadline: int
+    format_on_save_changes_only: bool
+    result_cache: bool
+    incremental_parsing: Union[bool, str]
+    verify_stability: bool
+    daemon: DaemonSettings
     options: BlackConfig
@@ -4,10 +4,10 @@
 import sublime
 import os
 
-from typing import Optional, Union
-from collections import namedtuple
+from typing import Any, Dict, Optional, Union
 from pathlib import Path
 from .constants import PACKAGE_NAME, SETTINGS_FILE_NAME
+from .edits import line_edits
 from .log import child_logger
 from .mode import Mode
 from .lib.black.files import find_pyproject_toml
@@ -16,9 +16,6 @@ from .types import SublimeSettings
 logger = child_logger(__name__)
 
 
-ViewState = namedtuple("ViewState", ["row", "col", "vector"])
-
-
 def show_error_panel(text: str):
     view = sublime.active_window().get_output_panel("black")
     view.set_read_only(False)
@@ -88,38 +85,22 @@ def out(msg: str):
     return sublime.status_message(msg)
 
 
-def save_state(view: sublime.View):
-    # save cursor position
-    row, col = view.rowcol(view.sel()[0].begin())
-    # save viewport
-    vector = view.text_to_layout(view.visible_region().begin())
-    return ViewState(row, col, vector)
-
-
-def restore_state(view: sublime.View, state: ViewState):
-    # restore cursor position
-    sel = view.sel()
-    if len(sel) == 1 and sel[0].a == sel[0].b:
-        point = view.text_point(state.row, state.col)
-        sel.subtract(sel[0])
-        sel.add(sublime.Region(point, point))
-    # restore viewport
-    # magic, next line doesn't work without it
-    view.set_viewport_position((0.0, 0.0))
-    view.set_viewport_position(state.vector)
-
-
 def replace_text(
     edit: sublime.Edit, view: sublime.View, region: sublime.Region, text: str
 ):
-    state = save_state(view)
     if region.b - region.a < view.size():
         lines = text.split("\n")
         if not lines[-1]:
             text = "\n".join(lines[:-1])
 
-    view.replace(edit, region, text)
-    restore_state(view, state)
+    # Only the changed lines are replaced, so that the selections, the
+    # viewport, folds and marks elsewhere are left alone.
+    edits = line_edits(view.substr(region), text)
+    logger.debug("replacing %d hunks", len(edits))
+    for start, end, replacement in reversed(edits):
+        view.replace(
+            edit, sublime.Region(region.a + start, region.a + end), replacement
+        )
     sublime.status_message("black: Formatted")
 
 
@@ -134,6 +115,10 @@ def get_project_settings(view: sublime.View) -> SublimeSettings:
     if not window:
         return {}  # type: ignore
 
+    return get_window_project_settings(window)
+
+
+def get_window_project_settings(window: sublime.Window) -> SublimeSettings:
     project_settings: SublimeSettings = (
         (window.project_data() or {}).get("settings", {}).get(PACKAGE_NAME, {})  # type: ignore
     )
@@ -141,6 +126,15 @@ def get_project_settings(view: sublime.View) -> SublimeSettings:
     return project_settings
 
 
+def get_setting(view: sublime.View, key: str, default: Any = None) -> Any:
+    """Get a package setting, preferring the value in the project settings."""
+    project_settings: Dict[str, Any] = get_project_settings(view)  # type: ignore
+    if key in project_settings:
+        return project_settings[key]
+
+    return get_package_settings().get(key, default)
+
+
 def get_mode():
     settings = get_package_settings()
     _mode: Union[str, bool] = settings.get("format_on_save")  # type: ignore
@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import sublime
+import threading
+
+from collections import OrderedDict
+from functools import partial
+from typing import Optional, Set
+
+from .black import FormatRequest, run_format
+from .log import child_logger
+
+logger = child_logger(__name__)
+
+
+class FormatJob:
+    """A snapshot of a view taken on the UI thread, formatted on the worker thread.
+
+    Everything the formatting needs from the view and the settings is in
+    `request`, so that the worker thread doesn't use the Sublime Text API. The
+    result is only applied if the view's change count still matches the one
+    recorded in the snapshot.
+    """
+
+    def __init__(self, view: sublime.View, request: FormatRequest) -> None:
+        self.view = view
+        self.view_id = view.id()
+        self.change_count = view.change_count()
+        self.request = request
+        self.message: Optional[str] = None
+        self.cancelled = False
+        self.finished = threading.Event()
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+    def run(self) -> Optional[str]:
+        formatted, self.message = run_format(self.request)
+        return formatted
+
+
+class FormatWorker:
+    """Format views on a background thread.
+
+    Jobs are coalesced per view: submitting a job for a view cancels the job
+    that is still pending or running for the same view, so repeated saves only
+    format the latest snapshot.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._pending: "OrderedDict[int, FormatJob]" = OrderedDict()
+        self._running: Optional[FormatJob] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+        self._skip_next_save: Set[int] = set()
+
+    def submit(self, job: FormatJob, deadline: int) -> None:
+        """Queue `job`, telling in the status bar if it misses `deadline`.
+
+        The result of a job that misses its deadline is still applied when it
+        is ready.
+
+        Args:
+            job (FormatJob): the snapshot to format
+            deadline (int): milliseconds to wait before telling, 0 to never tell
+        """
+        with self._condition:
+            previous = self._pending.pop(job.view_id, None)
+            if previous:
+                logger.debug("coalescing pending job of view %d", job.view_id)
+                previous.cancel()
+
+            if self._running and self._running.view_id == job.view_id:
+                self._running.cancel()
+
+            self._pending[job.view_id] = job
+            self._ensure_thread()
+            self._condition.notify()
+
+        if deadline > 0:
+            sublime.set_timeout(partial(self._on_deadline, job), deadline)
+
+    def cancel(self, view_id: int) -> None:
+        with self._condition:
+            job = self._pending.pop(view_id, None)
+            if job:
+                job.cancel()
+
+            if self._running and self._running.view_id == view_id:
+                self._running.cancel()
+
+    def shutdown(self) -> None:
+        with self._condition:
+            self._stopped = True
+            for job in self._pending.values():
+                job.cancel()
+            self._pending.clear()
+            self._condition.notify()
+
+    def skip_next_save(self, view: sublime.View) -> None:
+        self._skip_next_save.add(view.id())
+
+    def consume_skip(self, view: sublime.View) -> bool:
+        """Return True once if the save of `view` was triggered by the worker itself."""
+        view_id = view.id()
+        if view_id in self._skip_next_save:
+            self._skip_next_save.discard(view_id)
+            return True
+
+        return False
+
+    def _ensure_thread(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._thread = threading.Thread(
+            target=self._loop, name="python-black-worker", daemon=True
+        )
+        self._thread.start()
+
+    def _loop(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopped:
+                    self._condition.wait()
+
+                if self._stopped:
+                    return
+
+                _, job = self._pending.popitem(last=False)
+                self._running = job
+
+            formatted: Optional[str] = None
+            try:
+                if not job.cancelled:
+                    formatted = job.run()
+            except Exception as e:
+                logger.error("background formatting failed: %s", e)
+            finally:
+                with self._condition:
+                    self._running = None
+                job.finished.set()
+
+            if not job.cancelled:
+                sublime.set_timeout(partial(self._apply, job, formatted))
+
+    def _apply(self, job: FormatJob, formatted: Optional[str]) -> None:
+        view = job.view
+        if job.cancelled or not view.is_valid():
+            return
+
+        if job.message:
+            sublime.status_message(job.message)
+
+        if view.change_count() != job.change_count:
+            logger.info(
+                "view %d changed while formatting, discarding the result", job.view_id
+            )
+            return
+
+        if not formatted or formatted == job.request.source:
+            return
+
+        view.run_command("black_replace", {"text": formatted})
+        self.save(view)
+
+    def _on_deadline(self, job: FormatJob) -> None:
+        if job.finished.is_set() or job.cancelled:
+            return
+
+        # Formatting again on the UI thread would block it for longer than the
+        # job has left, so the job keeps running and is applied when done.
+        logger.warning(
+            "background formatting of view %d missed its deadline, still waiting",
+            job.view_id,
+        )
+        sublime.status_message("black: Still formatting, the result will be applied")
+
+    def save(self, view: sublime.View) -> None:
+        """Save `view` without triggering format on save again."""
+        self.skip_next_save(view)
+        view.run_command("save")
+
+
+worker = FormatWorker()